@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Parameter binding benchmark
+===========================
+
+Compares per-call binding through :meth:`inspect.Signature.bind` (unpacking pydantic models) with the
+precomputed :class:`binance.client.endpoints.base.BindingPlan`.
+
+Run with::
+
+    python benchmarks/bench_binding.py
+"""
+import inspect
+import timeit
+
+from pydantic import BaseModel
+
+from binance.client.endpoints import market, trade
+from binance.client.endpoints.base import Parameters
+from binance.enums.binance import KlineInterval, OrderSide, TimeInForce
+from binance.order import Limit
+
+NUMBER = 100_000
+
+
+def get_endpoint(endpoints, name):
+    return next(e for e in endpoints if e.func.__name__ == name)
+
+
+def signature_bind(signature: inspect.Signature, args: tuple, kwargs: dict) -> Parameters:
+    # per-call binding, as endpoints did before binding plans
+    ba = signature.bind(*args, **kwargs)
+    ba.apply_defaults()
+    for key in list(ba.arguments.keys()):
+        if isinstance(ba.arguments[key], BaseModel):
+            ba.arguments.update(ba.arguments.pop(key).model_dump(exclude_none=True))
+    return Parameters(**ba.arguments)
+
+
+def bench(name, endpoint, args, kwargs):
+    args, kwargs = endpoint.validator(*args, **kwargs)
+    signature, plan = endpoint.func_signature, endpoint.plan
+
+    before = timeit.timeit(lambda: signature_bind(signature, args, kwargs), number=NUMBER)
+    after = timeit.timeit(lambda: plan.bind(args, kwargs), number=NUMBER)
+    print(
+        f"{name:<20} signature.bind: {before / NUMBER * 1e6:6.2f} us/call  "
+        f"plan.bind: {after / NUMBER * 1e6:6.2f} us/call  speedup: {before / after:4.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    bench(
+        "market.klines",
+        get_endpoint(market.endpoints, "klines"),
+        ("BTCUSDT", KlineInterval.ONE_MINUTE),
+        dict(startTime=1700000000000, limit=1500),
+    )
+    order = Limit(
+        symbol="BTCUSDT", side=OrderSide.BUY, quantity=0.1, price=25000, timeInForce=TimeInForce.GOOD_TILL_CANCEL
+    )
+    bench("trade.new_order", get_endpoint(trade.endpoints, "new_order"), (order,), dict(recvWindow=5000))
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Response decoding benchmark
+===========================
+
+Compares the installed JSON decoders (see :mod:`binance.client.decoder`) on klines, all-symbol 24hr ticker and
+exchange information payloads.
+
+Run with::
+
+    python benchmarks/bench_decoding.py
+"""
+import timeit
+
+import payloads
+
+from binance.client.decoder import DECODERS
+
+NUMBER = 200
+
+PAYLOADS = {
+    "klines (1500 rows)": payloads.klines(),
+    "ticker_24hr (all)": payloads.ticker_price_change_statistics(),
+    "exchange_info": payloads.exchange_info(),
+}
+
+
+def available_decoders():
+    for name, load in DECODERS.items():
+        try:
+            yield name, load()
+        except ImportError:
+            print(f"{name} not installed, skipping")
+
+
+if __name__ == "__main__":
+    decoders = dict(available_decoders())
+    for payload_name, body in PAYLOADS.items():
+        baseline = timeit.timeit(lambda body=body: decoders["json"](body), number=NUMBER)
+        results = [f"{payload_name:<20} ({len(body) / 1e3:6.0f} kB)"]
+        for name, decode in decoders.items():
+            elapsed = timeit.timeit(lambda decode=decode, body=body: decode(body), number=NUMBER)
+            results.append(f"{name}: {elapsed / NUMBER * 1e3:6.2f} ms ({baseline / elapsed:4.1f}x)")
+        print("  ".join(results))
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Partial depth benchmark
+=======================
+
+Compares three ways of writing ``depth20@100ms`` frames into preallocated arrays, in (best) time and peak allocated
+memory (the temporary objects of a frame) per frame:
+
+* events: parsing frames into typed events and copying their level tuples
+* decoded: decoding frames with the client decoder and copying their level lists
+* parsed: :meth:`binance.client.partial_depth.PartialDepth.on_frame`, parsing the numbers of the undecoded frame
+
+Run with::
+
+    python benchmarks/bench_partial_depth.py
+"""
+import json
+import random
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from binance import AIOClient
+from binance.client.partial_depth import PartialDepth
+from binance.client.streams.events import parse
+
+NUMBER = 20000
+LEVELS = 20
+
+
+def frame(symbol: str = "BTCUSDT") -> str:
+    bids = [[f"{35000 - i / 10:.1f}", f"{random.uniform(0, 10):.3f}"] for i in range(LEVELS)]
+    asks = [[f"{35000.1 + i / 10:.1f}", f"{random.uniform(0, 10):.3f}"] for i in range(LEVELS)]
+    data = {"e": "depthUpdate", "E": 1, "T": 1, "s": symbol, "U": 1, "u": 2, "pu": 0, "b": bids, "a": asks}
+    return json.dumps({"stream": f"{symbol.lower()}@depth{LEVELS}@100ms", "data": data}, separators=(",", ":"))
+
+
+def allocated(func, raw: str) -> int:
+    tracemalloc.start()
+    func(raw)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+if __name__ == "__main__":
+    client = AIOClient()
+    depth = PartialDepth(client, ["BTCUSDT"], levels=LEVELS)
+    raw = frame()
+    book = np.zeros((2, LEVELS, 2))
+    depth.on_frame(raw)
+
+    def events(raw: str):
+        event = parse(client.decoder(raw)["data"])
+        book[0] = event.bids
+        book[1] = event.asks
+
+    def decoded(raw: str):
+        data = client.decoder(raw)["data"]
+        book[0] = data["b"]
+        book[1] = data["a"]
+
+    for name, func in (("events", events), ("decoded", decoded), ("parsed", depth.on_frame)):
+        func(raw)
+        if func is not depth.on_frame:
+            np.testing.assert_array_equal(book, depth.book[0])
+        elapsed = min(timeit.repeat(lambda func=func: func(raw), number=NUMBER, repeat=5)) / NUMBER * 1e6
+        print(f"{name:8s} {elapsed:6.2f} us {allocated(func, raw):6d} B")
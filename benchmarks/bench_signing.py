@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Signing benchmark
+=================
+
+Compares keying a new HMAC for every request with the pre-keyed :class:`binance.client.signer.HMACSigner`.
+
+Run with::
+
+    python benchmarks/bench_signing.py
+"""
+import hashlib
+import hmac
+import timeit
+
+from binance.client.signer import HMACSigner
+
+NUMBER = 200_000
+
+SECRET = "x" * 64
+QUERY = (
+    "symbol=BTCUSDT&side=BUY&quantity=0.001&price=25000.0&timeInForce=GTC&type=LIMIT"
+    "&timestamp=1700000000000&recvWindow=5000"
+)
+
+
+if __name__ == "__main__":
+    signer = HMACSigner(SECRET)
+    assert signer.sign(QUERY.encode()) == hmac.new(SECRET.encode(), QUERY.encode(), hashlib.sha256).hexdigest()
+
+    before = timeit.timeit(
+        lambda: hmac.new(SECRET.encode(), QUERY.encode(), hashlib.sha256).hexdigest(), number=NUMBER
+    )
+    after = timeit.timeit(lambda: signer.sign(QUERY.encode()), number=NUMBER)
+    print(
+        f"hmac.new per request: {before / NUMBER * 1e6:5.2f} us/sign  "
+        f"HMACSigner: {after / NUMBER * 1e6:5.2f} us/sign  speedup: {before / after:4.1f}x"
+    )
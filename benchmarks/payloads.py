@@ -0,0 +1,133 @@
+"""
+Benchmark payloads
+==================
+
+Payloads shaped like real binance futures responses (1500 row klines page, all-symbol 24hr tickers and
+exchange information) generated deterministically, so benchmarks run without network access.
+"""
+import json
+import random
+
+random.seed(42)
+
+SYMBOLS = [f"SYM{i}USDT" for i in range(300)]
+
+
+def klines(rows: int = 1500) -> bytes:
+    """1500 row klines page"""
+    data = []
+    open_time = 1700000000000
+    price = 35000.0
+    for _ in range(rows):
+        o, c = price, price + random.uniform(-50, 50)
+        h, low = max(o, c) + random.uniform(0, 20), min(o, c) - random.uniform(0, 20)
+        volume = random.uniform(10, 1000)
+        data.append(
+            [
+                open_time,
+                f"{o:.1f}",
+                f"{h:.1f}",
+                f"{low:.1f}",
+                f"{c:.1f}",
+                f"{volume:.3f}",
+                open_time + 59999,
+                f"{volume * c:.5f}",
+                random.randint(100, 5000),
+                f"{volume / 2:.3f}",
+                f"{volume * c / 2:.5f}",
+                "0",
+            ]
+        )
+        open_time += 60000
+        price = c
+    return json.dumps(data).encode()
+
+
+def ticker_price_change_statistics() -> bytes:
+    """all-symbol 24hr ticker"""
+    data = []
+    for symbol in SYMBOLS:
+        price = random.uniform(0.001, 50000)
+        data.append(
+            {
+                "symbol": symbol,
+                "priceChange": f"{random.uniform(-1, 1) * price / 10:.4f}",
+                "priceChangePercent": f"{random.uniform(-10, 10):.3f}",
+                "weightedAvgPrice": f"{price:.4f}",
+                "lastPrice": f"{price:.4f}",
+                "lastQty": f"{random.uniform(0, 100):.3f}",
+                "openPrice": f"{price:.4f}",
+                "highPrice": f"{price * 1.05:.4f}",
+                "lowPrice": f"{price * 0.95:.4f}",
+                "volume": f"{random.uniform(0, 1e7):.3f}",
+                "quoteVolume": f"{random.uniform(0, 1e9):.3f}",
+                "openTime": 1700000000000,
+                "closeTime": 1700086399999,
+                "firstId": 100000,
+                "lastId": 200000,
+                "count": 100000,
+            }
+        )
+    return json.dumps(data).encode()
+
+
+def exchange_info() -> bytes:
+    """exchange information"""
+    symbols = []
+    for symbol in SYMBOLS:
+        symbols.append(
+            {
+                "symbol": symbol,
+                "pair": symbol,
+                "contractType": "PERPETUAL",
+                "deliveryDate": 4133404800000,
+                "onboardDate": 1569398400000,
+                "status": "TRADING",
+                "maintMarginPercent": "2.5000",
+                "requiredMarginPercent": "5.0000",
+                "baseAsset": symbol[:-4],
+                "quoteAsset": "USDT",
+                "marginAsset": "USDT",
+                "pricePrecision": 2,
+                "quantityPrecision": 3,
+                "baseAssetPrecision": 8,
+                "quotePrecision": 8,
+                "underlyingType": "COIN",
+                "underlyingSubType": [],
+                "settlePlan": 0,
+                "triggerProtect": "0.0500",
+                "liquidationFee": "0.012500",
+                "marketTakeBound": "0.05",
+                "maxMoveOrderLimit": 10000,
+                "filters": [
+                    {"minPrice": "0.10", "maxPrice": "4529764", "filterType": "PRICE_FILTER", "tickSize": "0.10"},
+                    {"stepSize": "0.001", "filterType": "LOT_SIZE", "maxQty": "1000", "minQty": "0.001"},
+                    {"stepSize": "0.001", "filterType": "MARKET_LOT_SIZE", "maxQty": "120", "minQty": "0.001"},
+                    {"limit": 200, "filterType": "MAX_NUM_ORDERS"},
+                    {"limit": 10, "filterType": "MAX_NUM_ALGO_ORDERS"},
+                    {"notional": "5", "filterType": "MIN_NOTIONAL"},
+                    {
+                        "multiplierDown": "0.9500",
+                        "multiplierUp": "1.0500",
+                        "multiplierDecimal": "4",
+                        "filterType": "PERCENT_PRICE",
+                    },
+                ],
+                "orderTypes": ["LIMIT", "MARKET", "STOP", "STOP_MARKET", "TAKE_PROFIT", "TAKE_PROFIT_MARKET"],
+                "timeInForce": ["GTC", "IOC", "FOK", "GTX", "GTD"],
+            }
+        )
+    data = {
+        "timezone": "UTC",
+        "serverTime": 1700000000000,
+        "futuresType": "U_MARGINED",
+        "rateLimits": [
+            {"rateLimitType": "REQUEST_WEIGHT", "interval": "MINUTE", "intervalNum": 1, "limit": 2400},
+            {"rateLimitType": "ORDERS", "interval": "MINUTE", "intervalNum": 1, "limit": 1200},
+            {"rateLimitType": "ORDERS", "interval": "SECOND", "intervalNum": 10, "limit": 300},
+        ],
+        "exchangeFilters": [],
+        "assets": [{"asset": "USDT", "marginAvailable": True, "autoAssetExchange": "-10000"}],
+        "symbols": symbols,
+    }
+    return json.dumps(data).encode()
@@ -2,59 +2,152 @@
 Asynchronous Binance API client
 ===============================
 """
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
 import aiohttp
+from yarl import URL
 
+from binance.client.backfill import Backfill
 from binance.client.base import BaseClient
+from binance.client.pool import PoolConfig
+from binance.client.response import Response, ResponseException
 from binance.enums import HTTPMethod
 
 if TYPE_CHECKING:
-    from binance.client.endpoints.base import APIParameters
-    from binance.client.response import Response
+    from binance.client.endpoints.base import Parameters
+    from binance.client.ratelimit import Limiter
 
 log = logging.getLogger(__name__)
 
 
 class AIOClient(BaseClient):
-    """Asynchronous Binance client"""
+    """
+    Asynchronous Binance client
+
+    Parameters
+    ----------
+    *args
+        See :class:`binance.client.base.BaseClient`
+    session: :class:`aiohttp.ClientSession`, optional
+        Session to share with other clients (not closed by this client)
+    connector: :class:`aiohttp.BaseConnector`, optional
+        Connector (connection pool) to share with other clients (not closed by this client)
+    pool: :class:`binance.client.pool.PoolConfig`, optional
+        Connection pool configuration of the connector created by this client
+    **kwargs
+        See :class:`binance.client.base.BaseClient`
+    """
 
     ASYNCHRONOUS = True
 
-    def __init__(self, *args, **kwargs):
-        self.session = aiohttp.ClientSession()
-        super().__init__(*args, *kwargs)
+    def __init__(
+        self,
+        *args,
+        session: aiohttp.ClientSession = None,
+        connector: aiohttp.BaseConnector = None,
+        pool: PoolConfig = None,
+        **kwargs,
+    ):
+        self.pool = PoolConfig() if pool is None else pool
+        self._owns_session = session is None
+        self._session = session
+        self._connector = connector
+        super().__init__(*args, **kwargs)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """HTTP session (created on first use, within the running event loop)"""
+        if self._session is None:
+            connector = self.pool.aiohttp_connector() if self._connector is None else self._connector
+            self._session = aiohttp.ClientSession(connector=connector, connector_owner=self._connector is None)
+        return self._session
 
     async def __aenter__(self):
+        self._start_background()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
         await self.close()
 
     async def close(self) -> None:
-        if self.session is not None:
-            await self.session.close()
+        self.clock.stop()
+        self.exchange_info.stop()
+        self.warmer.stop()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def backfill(
+        self,
+        endpoint: str,
+        start: int,
+        end: int = None,
+        /,
+        concurrency: int = 4,
+        budget: "Limiter" = None,
+        **params,
+    ) -> AsyncIterator[list]:
+        """
+        Fetches a time range of a kline style endpoint concurrently, see :class:`binance.client.backfill.Backfill`.
+
+        Parameters
+        ----------
+        endpoint: str
+            Name of market endpoint (``klines``, ``continues_contract_klines``, ``index_price_klines``,
+            ``mark_price_klines``, ``lvt_klines`` or ``funding_rate_history``)
+        start: int
+            Start time in milliseconds
+        end: int, optional
+            End time in milliseconds (inclusive), defaults to now
+        concurrency: int
+            Maximum number of concurrent calls
+        budget: :class:`binance.client.ratelimit.Limiter`, optional
+            Request weight budget of backfill
+        **params
+            Further endpoint parameters, e.g. ``symbol`` and ``interval``
+
+        Returns
+        -------
+        AsyncIterator[list]
+            Pages of rows in ascending time order, without duplicates
+        """
+        return Backfill(self, endpoint, concurrency=concurrency, budget=budget).pages(start, end, **params)
 
     async def _call(
         self,
         http_method: HTTPMethod,
         route: str,
         /,
-        params: "APIParameters" = None,
+        params: "Parameters" = None,
         headers: dict[str, str] = None,
         add_api_key: bool = False,
         add_signature: bool = False,
+        weight: int = 1,
+        orders: int = 0,
     ) -> "Response":
-        if add_api_key is True:
-            headers = self._add_api_key(headers)
+        if self._background:
+            self._start_background()
+        while delay := self._acquire(weight, orders):
+            log.debug("rate limit exhausted, waiting %.3fs", delay)
+            await asyncio.sleep(delay)
 
-        if add_signature is True:
-            params = self._add_signature(params)
+        request = self._prepare(
+            http_method, route, params=params, headers=headers, add_api_key=add_api_key, add_signature=add_signature
+        )
 
-        log.debug("%s call at %s", self.api_url + route, http_method.value)
+        log.debug("%s call at %s", request.url, http_method.value)
+        # send encoded (and signed) query string verbatim
         response = await self.session.request(
-            method=http_method.value, url=self.api_url + route, params=params.urlencode(), headers=headers
+            method=http_method.value, url=URL(request.full_url, encoded=True), headers=request.headers
         )
 
-        return await Response.from_aiohttp_response(response)
+        try:
+            response = await Response.from_aiohttp_response(response, self.decoder, self.keep_raw)
+        except ResponseException as e:
+            self._rate_limited(e)
+            raise
+        self._update_limits(response)
+        return response
@@ -0,0 +1,226 @@
+"""
+Backfill
+========
+
+Concurrent time range backfill of kline style endpoints for :class:`binance.client.AIOClient`.
+
+A time range is split into interval aligned windows of one full page each. Windows are fetched concurrently
+(within an optional request weight budget) and yielded in order with overlapping open times removed.
+
+https://binance-docs.github.io/apidocs/futures/en/#kline-candlestick-data
+"""
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING
+
+from binance.client.endpoints import market
+from binance.client.ratelimit import Limiter
+from binance.enums.binance import KlineInterval
+
+if TYPE_CHECKING:
+    from binance.client.aioclient import AIOClient
+
+log = logging.getLogger(__name__)
+
+#: milliseconds per kline interval (a month is counted as its shortest length, so a window never exceeds a page)
+INTERVALS = {
+    KlineInterval.ONE_MINUTE: 60_000,
+    KlineInterval.THREE_MINUTES: 3 * 60_000,
+    KlineInterval.FIVE_MINUTES: 5 * 60_000,
+    KlineInterval.FIFTEEN_MINUTES: 15 * 60_000,
+    KlineInterval.THIRTY_MINUTES: 30 * 60_000,
+    KlineInterval.ONE_HOUR: 3_600_000,
+    KlineInterval.TWO_HOURS: 2 * 3_600_000,
+    KlineInterval.FOUR_HOURS: 4 * 3_600_000,
+    KlineInterval.SIX_HOURS: 6 * 3_600_000,
+    KlineInterval.EIGHT_HOURS: 8 * 3_600_000,
+    KlineInterval.TWELWE_HOURS: 12 * 3_600_000,
+    KlineInterval.ONE_DAY: 86_400_000,
+    KlineInterval.THREE_DAYS: 3 * 86_400_000,
+    KlineInterval.ONE_WEEK: 7 * 86_400_000,
+    KlineInterval.ONE_MONTH: 28 * 86_400_000,
+}
+
+
+def open_time(row: list) -> int:
+    """Open time of a kline row"""
+    return row[0]
+
+
+def funding_time(row: dict) -> int:
+    """Funding time of a funding rate row"""
+    return row["fundingTime"]
+
+
+class Series:
+    """
+    Backfillable time series endpoint.
+
+    Parameters
+    ----------
+    limit: int
+        Maximum rows per call
+    key: Callable[[object], int]
+        Gets time (milliseconds) identifying a row
+    step: int, optional
+        Milliseconds between rows (taken from the ``interval`` parameter if not given)
+    """
+
+    __slots__ = ["limit", "key", "step"]
+
+    def __init__(self, limit: int, key: Callable[[object], int], step: int = None):
+        self.limit = limit
+        self.key = key
+        self.step = step
+
+    def __repr__(self) -> str:
+        return f"Series(limit={self.limit}, key={self.key.__name__}, step={self.step})"
+
+    def get_step(self, params: dict) -> int:
+        """Milliseconds between rows for parameters"""
+        if self.step is not None:
+            return self.step
+        if "interval" not in params:
+            raise ValueError("interval is required to backfill klines")
+        return INTERVALS[KlineInterval(params["interval"])]
+
+
+#: backfillable market endpoints
+SERIES = {
+    market.klines.__name__: Series(1500, open_time),
+    market.continues_contract_klines.__name__: Series(1500, open_time),
+    market.index_price_klines.__name__: Series(1500, open_time),
+    market.mark_price_klines.__name__: Series(1500, open_time),
+    market.lvt_klines.__name__: Series(1000, open_time),
+    # funding is usually settled every 8 hours (denser symbols are followed up page by page)
+    market.funding_rate_history.__name__: Series(1000, funding_time, step=8 * 3_600_000),
+}
+
+
+def windows(start: int, end: int, step: int, limit: int) -> list[tuple[int, int]]:
+    """
+    Splits a time range into interval aligned windows of at most `limit` rows.
+
+    Parameters
+    ----------
+    start: int
+        Start time in milliseconds
+    end: int
+        End time in milliseconds (inclusive)
+    step: int
+        Milliseconds between rows
+    limit: int
+        Maximum rows per window
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Start and (inclusive) end time of every window
+    """
+    span = step * limit
+    first = start - start % step
+    return [(max(t, start), min(t + span - 1, end)) for t in range(first, end + 1, span)]
+
+
+class Backfill:
+    """
+    Concurrent time range backfill.
+
+    Up to `concurrency` windows are in flight at any time; pages are still yielded in time order. Calls go
+    through the client rate limiters and, if given, additionally through `budget`, which caps how much request
+    weight the backfill may use so other calls of the client keep their share.
+
+    Parameters
+    ----------
+    client: :class:`binance.client.AIOClient`
+        Asynchronous binance client
+    endpoint: str
+        Name of market endpoint, one of :data:`SERIES`
+    concurrency: int
+        Maximum number of concurrent calls
+    budget: :class:`binance.client.ratelimit.Limiter`, optional
+        Request weight budget of backfill, e.g. ``Limiter.request_weight(1200)``
+    """
+
+    __slots__ = ["client", "endpoint", "series", "concurrency", "budget", "weight"]
+
+    def __init__(self, client: "AIOClient", endpoint: str = "klines", concurrency: int = 4, budget: Limiter = None):
+        if endpoint not in SERIES:
+            raise ValueError(f"{endpoint} cannot be backfilled, expected one of {list(SERIES)}")
+        self.client = client
+        self.endpoint = endpoint
+        self.series = SERIES[endpoint]
+        self.concurrency = concurrency
+        self.budget = budget
+        ep = next(e for e in market.endpoints if e.func.__name__ == endpoint)
+        self.weight = ep.get_weight({"limit": str(self.series.limit)})
+
+    def __repr__(self) -> str:
+        return f"Backfill(endpoint={self.endpoint}, concurrency={self.concurrency})"
+
+    async def _fetch(self, start: int, end: int, params: dict) -> list:
+        """Fetches all rows of a window (following up with further calls while pages come back full)"""
+        call = getattr(self.client.market, self.endpoint)
+        key, limit = self.series.key, self.series.limit
+        rows = []
+        while start <= end:
+            if self.budget is not None:
+                while delay := self.budget.acquire(self.weight):
+                    await asyncio.sleep(delay)
+            page = (await call(startTime=start, endTime=end, limit=limit, **params)).data
+            if rows:
+                last = key(rows[-1])
+                rows.extend(row for row in page if key(row) > last)
+            else:
+                rows.extend(page)
+            if len(page) < limit:
+                break
+            start = key(page[-1]) + 1
+        return rows
+
+    async def pages(self, start: int, end: int = None, **params) -> AsyncIterator[list]:
+        """
+        Fetches time range.
+
+        Parameters
+        ----------
+        start: int
+            Start time in milliseconds
+        end: int, optional
+            End time in milliseconds (inclusive), defaults to now
+        **params
+            Further endpoint parameters, e.g. ``symbol`` and ``interval``
+
+        Yields
+        ------
+        list
+            Rows of one window in ascending time order, without duplicates
+        """
+        if end is None:
+            end = self.client.clock.timestamp()
+        pending = iter(windows(start, end, self.series.get_step(params), self.series.limit))
+        key = self.series.key
+        tasks = deque()
+
+        def schedule():
+            window = next(pending, None)
+            if window is not None:
+                tasks.append(asyncio.ensure_future(self._fetch(*window, params)))
+
+        last = None
+        try:
+            for _ in range(self.concurrency):
+                schedule()
+            while tasks:
+                rows = await tasks.popleft()
+                schedule()
+                if last is not None:
+                    rows = [row for row in rows if key(row) > last]
+                if rows:
+                    last = key(rows[-1])
+                    yield rows
+        finally:
+            for task in tasks:
+                task.cancel()
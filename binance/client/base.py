@@ -1,17 +1,26 @@
 import abc
-import hashlib
-import hmac
+import asyncio
 import os
 from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 
 from binance.client import endpoints
+from binance.client.clock import Clock
+from binance.client.decoder import Decoder, get_decoder
+from binance.client.endpoints import helpers
+from binance.client.exchange_info import ExchangeInfo
+from binance.client.filters import OrderFilter
+from binance.client.fixed_point import OrderFormatter
+from binance.client.ratelimit import Limiter
+from binance.client.request import Request
+from binance.client.signer import HMACSigner, Signer
+from binance.client.warmup import Warmer
 from binance.constants import NETWORK
 
 if TYPE_CHECKING:
     from binance.client.endpoints.base import Parameters
-    from binance.client.response import Response
+    from binance.client.response import Response, ResponseException
     from binance.enums import HTTPMethod
 
 load_dotenv()
@@ -33,11 +42,45 @@ class BaseClient(abc.ABC):
         Binance API base url
     websocket_url: str
         Binance websocket base url
+    weight_limiter: :class:`binance.client.ratelimit.Limiter`
+        Request weight limiter (pass the same limiter to several clients to share the budget)
+    order_limiter: :class:`binance.client.ratelimit.Limiter`
+        Order count limiter; ``order_limiter.remaining`` exposes the remaining order budget per interval
+    sync_clock: bool
+        Synchronise signed request timestamps with server time in the background
+        (see :class:`binance.client.clock.Clock`), asynchronous clients created outside the event loop start
+        background tasks on ``async with`` or their first call
+    signer: :class:`binance.client.signer.Signer`
+        Request signer (e.g. for Ed25519 or RSA keys), defaults to HMAC-SHA256 with `api_secret`
+    decoder: str | Callable[[bytes], object]
+        JSON decoder of responses, defaults to the fastest installed (see :func:`binance.client.decoder.get_decoder`)
+    keep_raw: bool
+        Keep raw requests/aiohttp response objects on responses (released by default)
+    exchange_info_ttl: float, optional
+        Refresh exchange information in the background every `exchange_info_ttl` seconds
+        (see :class:`binance.client.exchange_info.ExchangeInfo`)
+    check_orders: bool
+        Round and validate orders against cached exchange filters before sending them
+        (see :class:`binance.client.filters.OrderFilter`)
+    cache_responses: bool
+        Cache responses of endpoints declaring a ttl (see :class:`binance.client.cache.ResponseCache`), off by
+        default since cached responses may be up to ttl seconds old
+    warm_connections: int
+        Number of connections to open at start and keep warm with pings (see :class:`binance.client.warmup.Warmer`)
+    fixed_point: bool
+        Represent prices and quantities of streams, order books and orders as scaled integers
+        (see :mod:`binance.client.fixed_point`)
     """
 
     #: indicates whether endpoints should be asynchronous
     ASYNCHRONOUS: bool
 
+    #: HTTP status codes of rate limit violations
+    RATE_LIMITED = (418, 429)
+
+    #: error code of order rate limit violations
+    TOO_MANY_ORDERS = -1015
+
     def __init__(
         self,
         api_key: str = os.environ.get("BINANCE_API_KEY"),
@@ -45,6 +88,17 @@ class BaseClient(abc.ABC):
         mode: NETWORK = NETWORK.TEST,
         api_url: str = None,
         websocket_url: str = None,
+        weight_limiter: Limiter = None,
+        order_limiter: Limiter = None,
+        sync_clock: bool = False,
+        signer: Signer = None,
+        decoder: str | Decoder = None,
+        keep_raw: bool = False,
+        exchange_info_ttl: float = None,
+        check_orders: bool = False,
+        cache_responses: bool = False,
+        warm_connections: int = 0,
+        fixed_point: bool = False,
     ):
         if mode:
             self.api_url = mode["API"]
@@ -58,11 +112,50 @@ class BaseClient(abc.ABC):
 
         self._api_key = api_key
         self._api_secret = api_secret
+        if signer is None and api_secret is not None:
+            signer = HMACSigner(api_secret)
+        self._signer = signer
+        self.decoder = get_decoder(decoder)
+        self.keep_raw = keep_raw
+        self.cache_responses = cache_responses
+        self.fixed_point = fixed_point
+
+        self.weight_limiter = Limiter.request_weight() if weight_limiter is None else weight_limiter
+        self.order_limiter = Limiter.orders() if order_limiter is None else order_limiter
+
+        self.clock = Clock(self)
+        # default factories replaced in every call (signed timestamps follow server time)
+        self._factories = {helpers.get_timestamp: self.clock.timestamp}
 
-        print(endpoints.market.__annotations__)
         self.market: endpoints.market = endpoints.market.endpoints.link(self)
         self.trade: endpoints.trade = endpoints.trade.endpoints.link(self)
-        # self.user_data = endpoints.UserData.link(self)
+        self.user_data: endpoints.user_data = endpoints.user_data.endpoints.link(self)
+
+        self.exchange_info = ExchangeInfo(self, exchange_info_ttl or ExchangeInfo.TTL)
+        self.order_formatter = OrderFormatter(self.exchange_info) if fixed_point else None
+        self.order_filter = OrderFilter(self.exchange_info) if check_orders else None
+        self.warmer = Warmer(self, warm_connections)
+
+        # background tasks of asynchronous clients start once an event loop is running
+        self._background = [self.clock] if sync_clock else []
+        if exchange_info_ttl is not None:
+            self._background.append(self.exchange_info)
+        if warm_connections:
+            self._background.append(self.warmer)
+        self._start_background()
+
+    def _start_background(self) -> None:
+        """Starts pending background tasks (deferred while no event loop is running for asynchronous clients)"""
+        if not self._background:
+            return
+        if self.ASYNCHRONOUS:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return
+        background, self._background = self._background, []
+        for task in background:
+            task.start()
 
     def _add_api_key(self, headers: dict) -> dict[str, str]:
         """Adds API key to headers"""
@@ -72,14 +165,91 @@ class BaseClient(abc.ABC):
         headers.update({"X-MBX-APIKEY": self._api_key})
         return headers
 
-    def _add_signature(self, params: "Parameters") -> "Parameters":
-        """Adds signature to params"""
-        if self._api_secret is None:
+    def _add_signature(self, request: Request) -> Request:
+        """Adds signature of encoded query string to request"""
+        if self._signer is None:
             raise ValueError("Binance futures API secret is missing!")
-        url_encoded_params = params.urlencode()
-        signature = hmac.new(self._api_secret.encode(), url_encoded_params.encode(), hashlib.sha256).hexdigest()
-        params["signature"] = signature
-        return params
+        request.sign(self._signer.sign(request.query.encode()))
+        return request
+
+    def _prepare(
+        self,
+        http_method: "HTTPMethod",
+        route: str,
+        /,
+        params: "Parameters" = None,
+        headers: dict[str, str] = None,
+        add_api_key: bool = False,
+        add_signature: bool = False,
+    ) -> Request:
+        """
+        Encodes a binance API call into a request
+
+        The query string is encoded once and (if required) signed, and is sent verbatim afterwards.
+
+        Parameters
+        ----------
+        http_method: http.Method
+            HTTP method to use.
+        route: str
+            Route of endpoint
+        params: :class:`binance.client.endpoints.base.Parameters`
+            Parameters to encode in url
+        headers: dict[str, str]
+            Headers to include in API call
+        add_api_key: bool
+            Boolean indicating whether to add API key
+        add_signature: bool
+            Boolean indicating whether to add API signature
+
+        Returns
+        -------
+        :class:`binance.client.request.Request`
+            Encoded request
+        """
+        if add_api_key:
+            headers = self._add_api_key(headers)
+
+        query = params.urlencode() if params else ""
+        request = Request(http_method, self.api_url + route, query, headers)
+
+        if add_signature:
+            request = self._add_signature(request)
+        return request
+
+    def _acquire(self, weight: int, orders: int = 0) -> float:
+        """
+        Reserves request weight and order count of a call
+
+        Returns
+        -------
+        float
+            0.0 if reserved, otherwise seconds to wait before trying again
+        """
+        if orders and (delay := self.order_limiter.acquire(orders)):
+            return delay
+        if weight and (delay := self.weight_limiter.acquire(weight)):
+            if orders:
+                self.order_limiter.release(orders)
+            return delay
+        return 0.0
+
+    def _update_limits(self, response: "Response") -> None:
+        """Reconciles rate limiters with rate limit headers of response"""
+        self.weight_limiter.update(response.limits)
+        self.order_limiter.update(response.limits)
+
+    def _rate_limited(self, exc: "ResponseException") -> None:
+        """Blocks rate limiters after a rate limit violation (HTTP 429 or 418)"""
+        if exc.status not in self.RATE_LIMITED:
+            return
+        headers = getattr(exc.raw, "headers", None) or {}
+        retry_after = headers.get("Retry-After")
+        seconds = float(retry_after) if retry_after else 60.0
+        if isinstance(exc.data, dict) and exc.data.get("code") == self.TOO_MANY_ORDERS:
+            self.order_limiter.block(seconds)
+        else:
+            self.weight_limiter.block(seconds)
 
     @abc.abstractmethod
     def close(self):
@@ -97,6 +267,8 @@ class BaseClient(abc.ABC):
         headers=None,
         add_api_key=False,
         add_signature=False,
+        weight=1,
+        orders=0,
     ) -> "Response":
         """
         Makes a binance API call
@@ -115,6 +287,10 @@ class BaseClient(abc.ABC):
             Boolean indicating whether to add API key
         add_signature: bool
             Boolean indicating whether to add API signature
+        weight: int
+            Request weight of call
+        orders: int
+            Number of orders placed by call
 
         Returns
         -------
@@ -0,0 +1,153 @@
+"""
+Response cache
+==============
+
+Per endpoint time-to-live (TTL) response cache with least recently used (LRU) eviction and request coalescing.
+"""
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from binance.client.base import BaseClient
+    from binance.client.endpoints.base import Parameters
+    from binance.client.response import Response
+
+
+class ResponseCache:
+    """
+    TTL and LRU bounded response cache with single-flight calls.
+
+    Responses are cached by encoded parameters. Identical calls made while a call is in flight wait for that
+    call and share its :class:`~binance.client.response.Response` (which is decoded at most once). Failed
+    calls are not cached.
+
+    Parameters
+    ----------
+    ttl: float
+        Seconds a response is served from cache
+    size: int
+        Maximum number of cached responses
+    """
+
+    __slots__ = ["ttl", "size", "_entries", "_inflight", "_lock"]
+
+    def __init__(self, ttl: float, size: int = 128):
+        self.ttl = ttl
+        self.size = size
+        self._entries: OrderedDict[str, tuple[float, Response]] = OrderedDict()
+        self._inflight: dict[str, Future | asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(ttl={self.ttl}, size={self.size}, entries={len(self._entries)})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drops all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key: str) -> "Response | None":
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, response = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def _store(self, key: str, response: "Response") -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+    def call(self, client: "BaseClient", *args, params: "Parameters", **kwargs) -> "Response":
+        """
+        Calls :meth:`binance.client.Client._call` through cache.
+
+        Parameters
+        ----------
+        client: :class:`binance.client.Client`
+            Synchronous binance client
+        *args
+            Arguments of call
+        params: :class:`binance.client.endpoints.base.Parameters`
+            Parameters of call (the cache key)
+        **kwargs
+            Keyword arguments of call
+
+        Returns
+        -------
+        :class:`binance.client.response.Response`
+            Cached, shared or new response
+        """
+        key = params.urlencode()
+        with self._lock:
+            response = self._lookup(key)
+            if response is not None:
+                return response
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            response = client._call(*args, params=params, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            self._store(key, response)
+        future.set_result(response)
+        return response
+
+    async def async_call(self, client: "BaseClient", *args, params: "Parameters", **kwargs) -> "Response":
+        """
+        Calls :meth:`binance.client.AIOClient._call` through cache.
+
+        Parameters
+        ----------
+        client: :class:`binance.client.AIOClient`
+            Asynchronous binance client
+        *args
+            Arguments of call
+        params: :class:`binance.client.endpoints.base.Parameters`
+            Parameters of call (the cache key)
+        **kwargs
+            Keyword arguments of call
+
+        Returns
+        -------
+        :class:`binance.client.response.Response`
+            Cached, shared or new response
+        """
+        key = params.urlencode()
+        response = self._lookup(key)
+        if response is not None:
+            return response
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(client._call(*args, params=params, **kwargs))
+            task.add_done_callback(functools.partial(self._done, key))
+        # a cancelled waiter must not cancel the call shared with other waiters
+        return await asyncio.shield(task)
+
+    def _done(self, key: str, task: asyncio.Future) -> None:
+        del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self._store(key, task.result())
@@ -1,10 +1,12 @@
 import logging
+import time
 from typing import TYPE_CHECKING
 
 import requests
 
 from binance.client.base import BaseClient
-from binance.client.response import Response
+from binance.client.pool import PoolConfig
+from binance.client.response import Response, ResponseException
 from binance.enums import HTTPMethod
 
 if TYPE_CHECKING:
@@ -14,13 +16,28 @@ log = logging.getLogger(__name__)
 
 
 class Client(BaseClient):
-    """Binance client"""
+    """
+    Binance client
+
+    Parameters
+    ----------
+    *args
+        See :class:`binance.client.base.BaseClient`
+    session: :class:`requests.Session`, optional
+        Session to share with other clients (not closed by this client)
+    pool: :class:`binance.client.pool.PoolConfig`, optional
+        Connection pool configuration of the session created by this client
+    **kwargs
+        See :class:`binance.client.base.BaseClient`
+    """
 
     ASYNCHRONOUS = False
 
-    def __init__(self, *args, **kwargs):
-        self.session = requests.Session()
-        super().__init__(*args, *kwargs)
+    def __init__(self, *args, session: requests.Session = None, pool: PoolConfig = None, **kwargs):
+        self.pool = PoolConfig() if pool is None else pool
+        self._owns_session = session is None
+        self.session = self.pool.requests_session() if session is None else session
+        super().__init__(*args, **kwargs)
 
     def __enter__(self) -> None:
         return self
@@ -29,7 +46,10 @@ class Client(BaseClient):
         self.close()
 
     def close(self) -> None:
-        if self.session is not None:
+        self.clock.stop()
+        self.exchange_info.stop()
+        self.warmer.stop()
+        if self._owns_session:
             self.session.close()
 
     def _call(
@@ -41,19 +61,29 @@ class Client(BaseClient):
         headers: dict[str, str] = None,
         add_api_key: bool = False,
         add_signature: bool = False,
+        weight: int = 1,
+        orders: int = 0,
     ) -> Response:
-        if add_api_key:
-            headers = self._add_api_key(headers)
+        while delay := self._acquire(weight, orders):
+            log.debug("rate limit exhausted, waiting %.3fs", delay)
+            time.sleep(delay)
 
-        if add_signature:
-            params = self._add_signature(params)
-
-        log.debug("%s call at %s", self.api_url + route, http_method.value)
-        req = requests.Request(
-            method=http_method.value, url=self.api_url + route, params=params.urlencode(), headers=headers
+        request = self._prepare(
+            http_method, route, params=params, headers=headers, add_api_key=add_api_key, add_signature=add_signature
         )
 
+        log.debug("%s call at %s", request.url, http_method.value)
+        req = requests.Request(method=http_method.value, url=request.url, headers=request.headers)
+
         req = self.session.prepare_request(req)
+        # send encoded (and signed) query string verbatim
+        req.url = request.full_url
         response = self.session.send(req)
 
-        return Response.from_requests_response(response)
+        try:
+            response = Response.from_requests_response(response, self.decoder, self.keep_raw)
+        except ResponseException as e:
+            self._rate_limited(e)
+            raise
+        self._update_limits(response)
+        return response
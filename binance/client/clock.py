@@ -0,0 +1,131 @@
+"""
+Clock synchronisation
+=====================
+
+Keeps track of the offset between the local clock and binance server time, so signed requests carry a
+timestamp inside the server's ``recvWindow``.
+
+https://binance-docs.github.io/apidocs/futures/en/#endpoint-security-type
+"""
+import logging
+import math
+import time
+from typing import TYPE_CHECKING
+
+from binance.client.periodic import Periodic
+
+if TYPE_CHECKING:
+    from binance.client.base import BaseClient
+
+log = logging.getLogger(__name__)
+
+
+class Clock(Periodic):
+    """
+    Server time synchronised clock.
+
+    The offset is measured NTP-style with :func:`binance.client.endpoints.market.server_time`: several samples
+    are taken and the one with the smallest round trip time (RTT) is kept, assuming the server stamped it in the
+    middle of the round trip.
+
+    Parameters
+    ----------
+    client: :class:`binance.client.base.BaseClient`
+        Binance client used to query server time
+    samples: int
+        Number of samples per synchronisation
+    interval: float
+        Seconds between background synchronisations
+    """
+
+    __slots__ = ["client", "samples", "interval", "offset", "rtt", "max_rtt"]
+
+    #: lower and upper bound of suggested recvWindow (milliseconds)
+    MIN_RECV_WINDOW = 1000
+    MAX_RECV_WINDOW = 60000
+
+    TASK = "clock synchronisation"
+
+    def __init__(self, client: "BaseClient", samples: int = 5, interval: float = 300.0):
+        super().__init__()
+        self.client = client
+        self.samples = samples
+        self.interval = interval
+        #: server time minus local time (milliseconds)
+        self.offset = 0.0
+        #: round trip time of the kept sample (milliseconds)
+        self.rtt = None
+        #: largest round trip time of the last synchronisation (milliseconds)
+        self.max_rtt = None
+
+    def __repr__(self) -> str:
+        return f"Clock(offset={self.offset}, rtt={self.rtt})"
+
+    @property
+    def period(self) -> float:
+        """Seconds between background synchronisations"""
+        return self.interval
+
+    def _step(self):
+        return self.sync()
+
+    def timestamp(self) -> int:
+        """
+        Gets server time corrected timestamp in miliseconds
+
+        Returns
+        -------
+        int
+            Timestamp in miliseconds
+        """
+        return int(round(time.time() * 1000 + self.offset))
+
+    @property
+    def recv_window(self) -> int:
+        """
+        Suggested ``recvWindow`` (milliseconds) derived from observed latency.
+
+        A request must reach the server within ``recvWindow`` of its timestamp, so the suggestion leaves room for
+        a few worst case round trips and is clamped to what binance accepts.
+        """
+        if self.max_rtt is None:
+            return 5000
+        return min(self.MIN_RECV_WINDOW + math.ceil(3 * self.max_rtt), self.MAX_RECV_WINDOW)
+
+    def add_samples(self, samples: list[tuple[float, int, float]]) -> None:
+        """
+        Updates offset from samples.
+
+        Parameters
+        ----------
+        samples: list[tuple[float, int, float]]
+            (local send time, server time, local receive time) in milliseconds
+        """
+        rtts = [(received - sent, server - (sent + received) / 2) for sent, server, received in samples]
+        self.rtt, self.offset = min(rtts)
+        self.max_rtt = max(rtt for rtt, _ in rtts)
+        log.debug("clock offset %.1fms (rtt %.1fms)", self.offset, self.rtt)
+
+    def sync(self):
+        """
+        Synchronises clock with binance server time.
+
+        Returns a coroutine when the client is asynchronous.
+        """
+        if self.client.ASYNCHRONOUS:
+            return self._async_sync()
+
+        samples = []
+        for _ in range(self.samples):
+            sent = time.time() * 1000
+            server = self.client.market.server_time().data["serverTime"]
+            samples.append((sent, server, time.time() * 1000))
+        self.add_samples(samples)
+
+    async def _async_sync(self) -> None:
+        samples = []
+        for _ in range(self.samples):
+            sent = time.time() * 1000
+            server = (await self.client.market.server_time()).data["serverTime"]
+            samples.append((sent, server, time.time() * 1000))
+        self.add_samples(samples)
@@ -0,0 +1,114 @@
+"""
+Columnar klines
+===============
+
+Vectorized decoding of kline payloads into NumPy structured arrays (requires the ``numpy`` package).
+
+Used by all kline endpoints: :func:`~binance.client.endpoints.market.klines`,
+:func:`~binance.client.endpoints.market.continues_contract_klines`,
+:func:`~binance.client.endpoints.market.index_price_klines`,
+:func:`~binance.client.endpoints.market.mark_price_klines` and
+:func:`~binance.client.endpoints.market.lvt_klines`.
+
+https://binance-docs.github.io/apidocs/futures/en/#kline-candlestick-data
+"""
+import numpy as np
+
+#: number of fields of a kline row
+KLINE_WIDTH = 12
+
+#: kline fields (the trailing "ignore" field is dropped)
+KLINE_FIELDS = [
+    ("open_time", "i8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+    ("close_time", "i8"),
+    ("quote_volume", "f8"),
+    ("trades", "i8"),
+    ("taker_buy_volume", "f8"),
+    ("taker_buy_quote_volume", "f8"),
+]
+
+#: price fields (stored as fixed-point integers when a price scale is given)
+PRICE_FIELDS = ("open", "high", "low", "close")
+
+
+def kline_dtype(price_scale: int = None) -> np.dtype:
+    """
+    Gets structured dtype of klines
+
+    Parameters
+    ----------
+    price_scale: int, optional
+        Number of decimals of fixed-point prices (prices are float64 if not given)
+
+    Returns
+    -------
+    :class:`numpy.dtype`
+        Structured kline dtype
+    """
+    if price_scale is None:
+        return np.dtype(KLINE_FIELDS)
+    return np.dtype([(name, "i8" if name in PRICE_FIELDS else kind) for name, kind in KLINE_FIELDS])
+
+
+def decode_klines(body: bytes, price_scale: int = None) -> np.ndarray:
+    """
+    Decodes a kline payload into a structured array in one vectorized pass.
+
+    Quotes and brackets are stripped from the JSON body and all fields are parsed by NumPy's C number parser
+    in one pass, so no Python object is created per field. Times and trade counts are exact in float64 (they are
+    far below 2**53) and are cast to int64 afterwards.
+
+    Parameters
+    ----------
+    body: bytes
+        JSON body of a kline endpoint response
+    price_scale: int, optional
+        Number of decimals of fixed-point prices, e.g. 2 stores ``"35000.10"`` as ``3500010``
+        (prices are float64 if not given)
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Structured array with one record per kline, see :func:`kline_dtype`
+    """
+    flat = body.translate(None, b'[]" \n\r\t')
+    if not flat:
+        return np.empty(0, dtype=kline_dtype(price_scale))
+    return _to_records(np.fromstring(flat, dtype=np.float64, sep=",").reshape(-1, KLINE_WIDTH), price_scale)
+
+
+def from_rows(rows: list[list], price_scale: int = None) -> np.ndarray:
+    """
+    Converts decoded kline rows (e.g. :attr:`binance.client.response.Response.data`) into a structured array.
+
+    Parameters
+    ----------
+    rows: list[list]
+        Kline rows
+    price_scale: int, optional
+        Number of decimals of fixed-point prices (prices are float64 if not given)
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Structured array with one record per kline, see :func:`kline_dtype`
+    """
+    if not rows:
+        return np.empty(0, dtype=kline_dtype(price_scale))
+    return _to_records(np.array(rows, dtype=np.float64).reshape(-1, KLINE_WIDTH), price_scale)
+
+
+def _to_records(fields: np.ndarray, price_scale: int = None) -> np.ndarray:
+    """Converts a (n, 12) float64 array of kline fields into a structured array"""
+    klines = np.empty(len(fields), dtype=kline_dtype(price_scale))
+    for i, (name, _) in enumerate(KLINE_FIELDS):
+        column = fields[:, i]
+        if price_scale is not None and name in PRICE_FIELDS:
+            column = np.rint(column * 10**price_scale)
+        klines[name] = column
+    return klines
@@ -0,0 +1,58 @@
+"""
+JSON decoders
+=============
+
+Response bodies are decoded straight from bytes with the fastest available JSON library
+(``orjson``, then ``msgspec``, then the standard library).
+"""
+import json
+from collections.abc import Callable
+
+#: decoder of response bodies
+Decoder = Callable[[bytes], object]
+
+
+def _orjson() -> Decoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> Decoder:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+def _json() -> Decoder:
+    return json.loads
+
+
+#: available decoders in order of preference
+DECODERS = {"orjson": _orjson, "msgspec": _msgspec, "json": _json}
+
+
+def get_decoder(decoder: str | Decoder = None) -> Decoder:
+    """
+    Gets JSON decoder
+
+    Parameters
+    ----------
+    decoder: str | Callable[[bytes], object], optional
+        Name of decoder ("orjson", "msgspec" or "json") or a decoder callable.
+        Defaults to the fastest installed decoder.
+
+    Returns
+    -------
+    Callable[[bytes], object]
+        Decoder decoding JSON bytes
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is not None:
+        return DECODERS[decoder]()
+    for load in DECODERS.values():
+        try:
+            return load()
+        except ImportError:
+            continue
@@ -3,19 +3,24 @@ Endpoint base classes
 =====================
 
 - Parameters
+- BindingPlan
+- Pagination
 - Endpoint
 - Endpoints
 """
+import asyncio
 import functools
 import inspect
 import logging
-from collections.abc import Callable, Iterator, MutableMapping
+from collections.abc import AsyncIterator, Callable, Iterator, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 from urllib.parse import urlencode
 
 from pydantic import BaseModel, validate_call
 
+from binance.client.cache import ResponseCache
 from binance.enums import HTTPMethod
 
 if TYPE_CHECKING:
@@ -59,34 +64,23 @@ class Parameters(MutableMapping):
         return len(self.__store)
 
     @classmethod
-    def from_signature(cls, signature: inspect.Signature, args: list, kwargs: dict) -> "Parameters":
+    def from_dict(cls, store: dict[str, str]) -> "Parameters":
         """
-        Creates Parameters object from args and kwargs
+        Creates Parameters object directly from an already encoded dictionary.
 
         Parameters
         ----------
-        signature:
-            Signature of method
-        args: list
-            args to extract parameters from
-        kwargs: dict
-            kwargs to extract parameters from
+        store: dict[str, str]
+            Dictionary of string encoded parameters (taken over, not copied)
 
         Returns
         -------
         :class:`Parameters`
-            Parameters object with parameters extracted from args and kwargs
+            Parameters object wrapping dictionary
         """
-        ba = signature.bind(*args, **kwargs)
-        ba.apply_defaults()
-        for key in list(ba.arguments.keys()):
-            if not isinstance(ba.arguments[key], BaseModel):
-                continue
-            # unpack pydantic basemodels into parameters
-            model: BaseModel = ba.arguments.pop(key)
-            model_args = model.model_dump(exclude_none=True)
-            ba.arguments.update(model_args)
-        return cls(**ba.arguments)
+        params = cls.__new__(cls)
+        params.__store = store
+        return params
 
     def urlencode(self) -> str:
         """
@@ -100,6 +94,239 @@ class Parameters(MutableMapping):
         return urlencode(self.__store)
 
 
+class BindingPlan:
+    """
+    Precomputed parameter binding plan of an endpoint.
+
+    The plan is computed once from the endpoint signature and records the positional order of parameters, which
+    parameters are pydantic models to unpack and which defaults are factories (e.g.
+    :func:`binance.client.endpoints.helpers.get_timestamp`) to call.
+
+    Parameters
+    ----------
+    signature: :class:`inspect.Signature`
+        Signature of endpoint
+    """
+
+    __slots__ = ["names", "entries"]
+
+    #: parameter kinds of plan entries
+    VALUE, MODEL, FACTORY, UNKNOWN = range(4)
+
+    def __init__(self, signature: inspect.Signature):
+        self.names = tuple(signature.parameters)
+        self.entries = tuple((name, *self._kind(p)) for name, p in signature.parameters.items())
+
+    def __repr__(self) -> str:
+        return f"BindingPlan({self.names})"
+
+    @classmethod
+    def _kind(cls, parameter: inspect.Parameter) -> tuple[int, object]:
+        annotation = parameter.annotation
+        if isinstance(annotation, TypeVar):
+            annotation = annotation.__bound__
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return cls.MODEL, None
+        if callable(parameter.default) and parameter.default is not inspect.Parameter.empty:
+            return cls.FACTORY, parameter.default
+        if annotation is inspect.Parameter.empty:
+            return cls.UNKNOWN, None
+        return cls.VALUE, None
+
+    def bind(self, args: tuple, kwargs: dict, factories: dict[Callable, Callable] = None) -> Parameters:
+        """
+        Binds validated args and kwargs to parameters.
+
+        Parameters
+        ----------
+        args: tuple
+            Positional arguments (in signature order)
+        kwargs: dict
+            Keyword arguments
+        factories: dict[Callable, Callable], optional
+            Replacements of default factories, e.g. a server time corrected
+            :func:`~binance.client.endpoints.helpers.get_timestamp`
+
+        Returns
+        -------
+        :class:`Parameters`
+            Parameters object with string encoded parameters
+        """
+        arguments = dict(zip(self.names, args, strict=False))
+        arguments.update(kwargs)
+        store = dict()
+        for name, kind, default in self.entries:
+            value = arguments.get(name)
+            if value is None:
+                continue
+            if kind == self.FACTORY and value is default:
+                value = factories.get(default, default)() if factories else default()
+            elif kind == self.MODEL or (kind == self.UNKNOWN and isinstance(value, BaseModel)):
+                # unpack pydantic basemodels into parameters
+                for key, val in value.model_dump(exclude_none=True).items():
+                    store[key] = str(val)
+                continue
+            store[name] = str(value)
+        return Parameters.from_dict(store)
+
+
+class Pagination:
+    """
+    Cursor pagination of an endpoint.
+
+    Paginated endpoints expose a ``paginate`` method on every linked endpoint, which walks the whole history
+    from the given arguments. The next page is requested as soon as a page arrives (before it is consumed), so
+    the connection is not idle between pages.
+
+    Parameters
+    ----------
+    cursor: str
+        Parameter continuing from a row, e.g. ``fromId``
+    key: str
+        Field of row holding the cursor value
+    limit: int
+        Maximum page size of endpoint (used unless a limit is passed)
+    time: str, optional
+        Field of row holding its time, used to stop at ``endTime``
+    """
+
+    __slots__ = ["cursor", "key", "limit", "time"]
+
+    #: time range parameters replaced by the cursor after the first page
+    TIME_RANGE = ("startTime", "endTime")
+
+    def __init__(self, cursor: str, key: str, limit: int, time: str = None):
+        self.cursor = cursor
+        self.key = key
+        self.limit = limit
+        self.time = time
+
+    def __repr__(self) -> str:
+        return f"Pagination(cursor={self.cursor}, key={self.key}, limit={self.limit}, time={self.time})"
+
+    def advance(self, kwargs: dict, page: list, end: int = None) -> dict | None:
+        """
+        Gets keyword arguments of the page following `page`.
+
+        Parameters
+        ----------
+        kwargs: dict
+            Keyword arguments of `page`
+        page: list
+            Rows of page
+        end: int, optional
+            End time of pagination
+
+        Returns
+        -------
+        dict | None
+            Keyword arguments of next page, None if `page` is the last page
+        """
+        if len(page) < int(kwargs["limit"]):
+            return None
+        if end is not None and self.time is not None and page[-1][self.time] >= end:
+            return None
+        kwargs = {key: val for key, val in kwargs.items() if key not in self.TIME_RANGE}
+        kwargs[self.cursor] = page[-1][self.key] + 1
+        return kwargs
+
+    def trim(self, page: list, end: int = None) -> list:
+        """Drops rows after end time"""
+        if end is None or self.time is None or not page or page[-1][self.time] <= end:
+            return page
+        return [row for row in page if row[self.time] <= end]
+
+    def _start(self, kwargs: dict) -> tuple[dict, int | None]:
+        if kwargs.get("limit") is None:
+            kwargs["limit"] = self.limit
+        return kwargs, kwargs.get("endTime")
+
+    def iterate(self, call: Callable, kwargs: dict) -> Iterator[list]:
+        """
+        Iterates pages of a synchronous endpoint (the next page is fetched in a background thread).
+
+        Parameters
+        ----------
+        call: Callable
+            Linked endpoint
+        kwargs: dict
+            Keyword arguments of first page
+
+        Yields
+        ------
+        list
+            Rows of page
+        """
+        kwargs, end = self._start(kwargs)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(lambda kwargs: call(**kwargs).data, kwargs)
+            while future is not None:
+                page = future.result()
+                kwargs = self.advance(kwargs, page, end)
+                future = None if kwargs is None else executor.submit(lambda kwargs: call(**kwargs).data, kwargs)
+                page = self.trim(page, end)
+                if page:
+                    yield page
+
+    async def aiterate(self, call: Callable, kwargs: dict) -> AsyncIterator[list]:
+        """
+        Iterates pages of an asynchronous endpoint (the next page is fetched in a background task).
+
+        Parameters
+        ----------
+        call: Callable
+            Linked endpoint
+        kwargs: dict
+            Keyword arguments of first page
+
+        Yields
+        ------
+        list
+            Rows of page
+        """
+        kwargs, end = self._start(kwargs)
+        task = asyncio.ensure_future(call(**kwargs))
+        try:
+            while task is not None:
+                page = (await task).data
+                kwargs = self.advance(kwargs, page, end)
+                task = None if kwargs is None else asyncio.ensure_future(call(**kwargs))
+                page = self.trim(page, end)
+                if page:
+                    yield page
+        finally:
+            if task is not None:
+                task.cancel()
+
+    def link(self, endpoint: "Endpoint", call: Callable, asynchronous: bool) -> Callable:
+        """
+        Creates ``paginate`` method of a linked endpoint.
+
+        Parameters
+        ----------
+        endpoint: :class:`Endpoint`
+            Paginated endpoint
+        call: Callable
+            Linked endpoint
+        asynchronous: bool
+            Whether `call` is asynchronous
+
+        Returns
+        -------
+        Callable
+            Method taking the endpoint arguments and returning an (async) iterator of pages
+        """
+        signature = endpoint.func_signature
+
+        def paginate(*args, **kwargs):
+            kwargs = dict(signature.bind_partial(*args, **kwargs).arguments)
+            return self.aiterate(call, kwargs) if asynchronous else self.iterate(call, kwargs)
+
+        paginate.__name__ = paginate.__qualname__ = f"{endpoint.func.__name__}.paginate"
+        paginate.__doc__ = f"Iterates all pages of :func:`{endpoint.func.__module__}.{endpoint.func.__name__}`"
+        return paginate
+
+
 class Endpoint:
     """
     API Endpoint container and wrapper.
@@ -116,9 +343,38 @@ class Endpoint:
         Boolean indicating whether to add API key
     add_signature: bool
         Boolean indicating whether to add API signature
+    weight: int or Callable[[Parameters], int]
+        Request weight of endpoint, either fixed or computed from parameters
+    orders: int or Callable[[Parameters], int]
+        Number of orders placed by endpoint (counted against order rate limits)
+    pagination: :class:`Pagination`, optional
+        Cursor pagination of endpoint
+    ttl: float, optional
+        Seconds responses are cached (and identical in-flight calls coalesced) by clients created with
+        ``cache_responses=True``, see :class:`binance.client.cache.ResponseCache`
+    cache_size: int
+        Maximum number of cached responses per client
     """
 
-    __slots__ = ["http_method", "route", "headers", "add_api_key", "add_signature", "func", "func_signature"]
+    __slots__ = [
+        "http_method",
+        "route",
+        "headers",
+        "add_api_key",
+        "add_signature",
+        "weight",
+        "orders",
+        "pagination",
+        "ttl",
+        "cache_size",
+        "func",
+        "func_signature",
+        "plan",
+        "_validator",
+    ]
+
+    #: pydantic configuration used when compiling endpoint validators
+    VALIDATOR_CONFIG = dict(arbitrary_types_allowed=True)
 
     def __init__(
         self,
@@ -129,14 +385,26 @@ class Endpoint:
         headers: dict = None,
         add_api_key: bool = False,
         add_signature: bool = False,
+        weight: int | Callable[[Parameters], int] = 1,
+        orders: int | Callable[[Parameters], int] = 0,
+        pagination: Pagination = None,
+        ttl: float = None,
+        cache_size: int = 128,
     ):
         self.http_method = HTTPMethod(http_method)
         self.route = route
         self.headers = headers
         self.add_api_key = add_api_key
         self.add_signature = add_signature
+        self.weight = weight
+        self.orders = orders
+        self.pagination = pagination
+        self.ttl = ttl
+        self.cache_size = cache_size
         self.func = func
         self.func_signature = inspect.signature(func)
+        self.plan = BindingPlan(self.func_signature)
+        self._validator = None
 
     def __repr__(self) -> str:
         return (
@@ -146,9 +414,68 @@ class Endpoint:
             f"route={self.route}, "
             f"headers={self.headers}, "
             f"add_api_key={self.add_api_key}, "
-            f"add_signature={self.add_signature})"
+            f"add_signature={self.add_signature}, "
+            f"weight={self.weight}, "
+            f"orders={self.orders}, "
+            f"pagination={self.pagination}, "
+            f"ttl={self.ttl})"
         )
 
+    def get_weight(self, params: Parameters) -> int:
+        """
+        Gets request weight of a call.
+
+        Parameters
+        ----------
+        params: :class:`Parameters`
+            Parameters of call
+
+        Returns
+        -------
+        int
+            Request weight
+        """
+        return self.weight(params) if callable(self.weight) else self.weight
+
+    def get_orders(self, params: Parameters) -> int:
+        """
+        Gets number of orders placed by a call.
+
+        Parameters
+        ----------
+        params: :class:`Parameters`
+            Parameters of call
+
+        Returns
+        -------
+        int
+            Number of orders
+        """
+        return self.orders(params) if callable(self.orders) else self.orders
+
+    @property
+    def validator(self) -> Callable:
+        """
+        Compiled argument validator of endpoint.
+
+        The validator is built the first time it is requested and shared by every client linking the endpoint.
+        Calling it validates args and kwargs against the endpoint signature and returns them (with defaults
+        applied) as a tuple of args and kwargs.
+
+        Returns
+        -------
+        Callable
+            Validator returning validated args and kwargs
+        """
+        if self._validator is None:
+
+            @functools.wraps(self.func)
+            def arguments(*args, **kwargs):
+                return args, kwargs
+
+            self._validator = validate_call(config=self.VALIDATOR_CONFIG)(arguments)
+        return self._validator
+
     def wrap(self, client: "BaseClient"):
         """
         Wraps API endpoint with client.
@@ -165,29 +492,55 @@ class Endpoint:
         """
         endpoint_args = [self.http_method, self.route]
         endpoint_kwargs = dict(headers=self.headers, add_api_key=self.add_api_key, add_signature=self.add_signature)
+        validator = self.validator
+        bind = self.plan.bind
+        get_weight = self.get_weight
+        get_orders = self.get_orders
+        factories = client._factories
+        cache = ResponseCache(self.ttl, self.cache_size) if self.ttl and client.cache_responses else None
         if client.ASYNCHRONOUS:
 
             @functools.wraps(self.func)
             async def wrapper(*args, **kwargs):
-                validate_call(config=dict(arbitrary_types_allowed=True))(self.func)
-                return await client._call(
+                args, kwargs = validator(*args, **kwargs)
+                params = bind(args, kwargs, factories)
+                orders = get_orders(params)
+                if orders and client.order_formatter is not None:
+                    params = client.order_formatter.format(params)
+                if orders and client.order_filter is not None:
+                    params = client.order_filter.check(params)
+                call = client._call if cache is None else functools.partial(cache.async_call, client)
+                return await call(
                     *endpoint_args,
                     **endpoint_kwargs,
-                    params=Parameters.from_signature(self.func_signature, args, kwargs),
+                    params=params,
+                    weight=get_weight(params),
+                    orders=orders,
                 )
         else:
 
             @functools.wraps(self.func)
             def wrapper(*args, **kwargs):
-                return client._call(
+                args, kwargs = validator(*args, **kwargs)
+                params = bind(args, kwargs, factories)
+                orders = get_orders(params)
+                if orders and client.order_formatter is not None:
+                    params = client.order_formatter.format(params)
+                if orders and client.order_filter is not None:
+                    params = client.order_filter.check(params)
+                call = client._call if cache is None else functools.partial(cache.call, client)
+                return call(
                     *endpoint_args,
                     **endpoint_kwargs,
-                    params=Parameters.from_signature(self.func_signature, args, kwargs),
+                    params=params,
+                    weight=get_weight(params),
+                    orders=orders,
                 )
 
-        if True:  # client.validate_calls:
-            config = dict(arbitrary_types_allowed=True)
-            wrapper = validate_call(config=config)(wrapper)
+        if cache is not None:
+            wrapper.cache = cache
+        if self.pagination is not None:
+            wrapper.paginate = self.pagination.link(self, wrapper, client.ASYNCHRONOUS)
         return wrapper
 
 
@@ -218,6 +571,11 @@ class Endpoints:
         headers: dict[str, str] = None,
         add_api_key: bool = False,
         add_signature: bool = False,
+        weight: int | Callable[[Parameters], int] = 1,
+        orders: int | Callable[[Parameters], int] = 0,
+        pagination: Pagination = None,
+        ttl: float = None,
+        cache_size: int = 128,
     ):
         """
         Decorator for adding endpoint to container.
@@ -234,6 +592,17 @@ class Endpoints:
             Boolean indicating whether to add API key
         add_signature: bool
             Boolean indicating whether to add API signature
+        weight: int or Callable[[Parameters], int]
+            Request weight of endpoint, either fixed or computed from parameters
+        orders: int or Callable[[Parameters], int]
+            Number of orders placed by endpoint (counted against order rate limits)
+        pagination: :class:`Pagination`, optional
+            Cursor pagination of endpoint (adds a ``paginate`` method to linked endpoints)
+        ttl: float, optional
+            Seconds responses are cached by clients created with ``cache_responses=True``, for public endpoints only
+            (adds a ``cache`` attribute to endpoints linked to such clients)
+        cache_size: int
+            Maximum number of cached responses per client
 
         Returns
         -------
@@ -244,7 +613,17 @@ class Endpoints:
 
         def decorator(method: Callable):
             ep = Endpoint(
-                method, http_method, route, headers=headers, add_api_key=add_api_key, add_signature=add_signature
+                method,
+                http_method,
+                route,
+                headers=headers,
+                add_api_key=add_api_key,
+                add_signature=add_signature,
+                weight=weight,
+                orders=orders,
+                pagination=pagination,
+                ttl=ttl,
+                cache_size=cache_size,
             )
             self.__endpoints.append(ep)
             return method
@@ -258,6 +637,11 @@ class Endpoints:
         headers: dict[str, str] = None,
         add_api_key: bool = False,
         add_signature: bool = False,
+        weight: int | Callable[[Parameters], int] = 1,
+        orders: int | Callable[[Parameters], int] = 0,
+        pagination: Pagination = None,
+        ttl: float = None,
+        cache_size: int = 128,
     ):
         """
         Adds get endpoint.
@@ -272,13 +656,35 @@ class Endpoints:
             Boolean indicating whether to add API key
         add_signature: bool
             Boolean indicating whether to add API signature
+        weight: int or Callable[[Parameters], int]
+            Request weight of endpoint, either fixed or computed from parameters
+        orders: int or Callable[[Parameters], int]
+            Number of orders placed by endpoint (counted against order rate limits)
+        pagination: :class:`Pagination`, optional
+            Cursor pagination of endpoint (adds a ``paginate`` method to linked endpoints)
+        ttl: float, optional
+            Seconds responses are cached by clients created with ``cache_responses=True``, for public endpoints only
+            (adds a ``cache`` attribute to endpoints linked to such clients)
+        cache_size: int
+            Maximum number of cached responses per client
 
         Returns
         -------
         Callable
             Original callable on which decoratorwas called
         """
-        return self.add(HTTPMethod.GET, route, headers, add_api_key, add_signature)
+        return self.add(
+            HTTPMethod.GET,
+            route,
+            headers,
+            add_api_key,
+            add_signature,
+            weight=weight,
+            orders=orders,
+            pagination=pagination,
+            ttl=ttl,
+            cache_size=cache_size,
+        )
 
     def post(
         self,
@@ -287,6 +693,9 @@ class Endpoints:
         headers: dict[str, str] = None,
         add_api_key: bool = False,
         add_signature: bool = False,
+        weight: int | Callable[[Parameters], int] = 1,
+        orders: int | Callable[[Parameters], int] = 0,
+        pagination: Pagination = None,
     ):
         """
         Adds post endpoint.
@@ -301,13 +710,28 @@ class Endpoints:
             Boolean indicating whether to add API key
         add_signature: bool
             Boolean indicating whether to add API signature
+        weight: int or Callable[[Parameters], int]
+            Request weight of endpoint, either fixed or computed from parameters
+        orders: int or Callable[[Parameters], int]
+            Number of orders placed by endpoint (counted against order rate limits)
+        pagination: :class:`Pagination`, optional
+            Cursor pagination of endpoint (adds a ``paginate`` method to linked endpoints)
 
         Returns
         -------
         Callable
             Original callable on which decoratorwas called
         """
-        return self.add(HTTPMethod.POST, route, headers, add_api_key, add_signature)
+        return self.add(
+            HTTPMethod.POST,
+            route,
+            headers,
+            add_api_key,
+            add_signature,
+            weight=weight,
+            orders=orders,
+            pagination=pagination,
+        )
 
     def put(
         self,
@@ -316,6 +740,9 @@ class Endpoints:
         headers: dict[str, str] = None,
         add_api_key: bool = False,
         add_signature: bool = False,
+        weight: int | Callable[[Parameters], int] = 1,
+        orders: int | Callable[[Parameters], int] = 0,
+        pagination: Pagination = None,
     ):
         """
         Adds put endpoint.
@@ -330,13 +757,28 @@ class Endpoints:
             Boolean indicating whether to add API key
         add_signature: bool
             Boolean indicating whether to add API signature
+        weight: int or Callable[[Parameters], int]
+            Request weight of endpoint, either fixed or computed from parameters
+        orders: int or Callable[[Parameters], int]
+            Number of orders placed by endpoint (counted against order rate limits)
+        pagination: :class:`Pagination`, optional
+            Cursor pagination of endpoint (adds a ``paginate`` method to linked endpoints)
 
         Returns
         -------
         Callable
             Original callable on which decoratorwas called
         """
-        return self.add(HTTPMethod.PUT, route, headers, add_api_key, add_signature)
+        return self.add(
+            HTTPMethod.PUT,
+            route,
+            headers,
+            add_api_key,
+            add_signature,
+            weight=weight,
+            orders=orders,
+            pagination=pagination,
+        )
 
     def delete(
         self,
@@ -345,6 +787,9 @@ class Endpoints:
         headers: dict[str, str] = None,
         add_api_key: bool = False,
         add_signature: bool = False,
+        weight: int | Callable[[Parameters], int] = 1,
+        orders: int | Callable[[Parameters], int] = 0,
+        pagination: Pagination = None,
     ):
         """
         Adds delete endpoint.
@@ -359,13 +804,28 @@ class Endpoints:
             Boolean indicating whether to add API key
         add_signature: bool
             Boolean indicating whether to add API signature
+        weight: int or Callable[[Parameters], int]
+            Request weight of endpoint, either fixed or computed from parameters
+        orders: int or Callable[[Parameters], int]
+            Number of orders placed by endpoint (counted against order rate limits)
+        pagination: :class:`Pagination`, optional
+            Cursor pagination of endpoint (adds a ``paginate`` method to linked endpoints)
 
         Returns
         -------
         Callable
             Original callable on which decoratorwas called
         """
-        return self.add(HTTPMethod.DELETE, route, headers, add_api_key, add_signature)
+        return self.add(
+            HTTPMethod.DELETE,
+            route,
+            headers,
+            add_api_key,
+            add_signature,
+            weight=weight,
+            orders=orders,
+            pagination=pagination,
+        )
 
     def link(self, client: "BaseClient"):
         """
@@ -1,6 +1,8 @@
 """
 """
+import json
 import time
+from collections.abc import Callable, Mapping
 
 
 def get_timestamp():
@@ -12,3 +14,77 @@ def get_timestamp():
     """
     timestamp = int(round(time.time() * 1000))
     return timestamp
+
+
+def limit_weight(steps: list[tuple[int, int]], default: int) -> Callable[[Mapping], int]:
+    """
+    Creates request weight function for endpoints whose weight depends on parameter limit
+
+    Parameters
+    ----------
+    steps: list[tuple[int, int]]
+        Ascending list of (largest limit, weight) pairs
+    default: int
+        Limit used by binance when limit is not sent
+
+    Returns
+    -------
+    Callable[[Mapping], int]
+        Function computing request weight from parameters
+    """
+
+    def weight(params: Mapping) -> int:
+        limit = int(params.get("limit", default))
+        for bound, w in steps:
+            if limit <= bound:
+                return w
+        return steps[-1][1]
+
+    return weight
+
+
+def symbol_weight(with_symbol: int, without_symbol: int) -> Callable[[Mapping], int]:
+    """
+    Creates request weight function for endpoints whose weight depends on whether a symbol is sent
+
+    Parameters
+    ----------
+    with_symbol: int
+        Weight when symbol is sent
+    without_symbol: int
+        Weight when symbol is omitted (all symbols)
+
+    Returns
+    -------
+    Callable[[Mapping], int]
+        Function computing request weight from parameters
+    """
+
+    def weight(params: Mapping) -> int:
+        return with_symbol if "symbol" in params else without_symbol
+
+    return weight
+
+
+#: request weight of order book endpoint
+order_book_weight = limit_weight([(50, 2), (100, 5), (500, 10), (1000, 20)], default=500)
+
+#: request weight of kline endpoints
+klines_weight = limit_weight([(99, 1), (499, 2), (1000, 5), (1500, 10)], default=500)
+
+
+def batch_size(params: Mapping) -> int:
+    """
+    Gets number of orders in a batch order
+
+    Parameters
+    ----------
+    params: Mapping
+        Parameters of batch order call
+
+    Returns
+    -------
+    int
+        Number of orders
+    """
+    return len(json.loads(params["batchOrders"]))
@@ -9,7 +9,8 @@ https://binance-docs.github.io/apidocs/futures/en/#market-data-endpoints
 """
 from typing import Optional
 
-from binance.client.endpoints.base import Endpoints
+import binance.client.endpoints.helpers as helpers
+from binance.client.endpoints.base import Endpoints, Pagination
 from binance.client.response import Response
 from binance.enums.binance import ContractType, KlineInterval, Period
 
@@ -85,7 +86,7 @@ def exchange_info() -> Response:
     """
 
 
-@endpoints.get("/fapi/v1/depth")
+@endpoints.get("/fapi/v1/depth", weight=helpers.order_book_weight)
 def order_book(symbol: str, limit: Optional[int] = None) -> Response:
     """
     Gets order book for a symbol.
@@ -123,7 +124,7 @@ def order_book(symbol: str, limit: Optional[int] = None) -> Response:
     """
 
 
-@endpoints.get("/fapi/v1/trades")
+@endpoints.get("/fapi/v1/trades", weight=5)
 def recent_trades(symbol: str, limit: Optional[int] = None) -> Response:
     """
     Gets most recent trades for a symbol.
@@ -161,7 +162,9 @@ def recent_trades(symbol: str, limit: Optional[int] = None) -> Response:
     """
 
 
-@endpoints.get("/fapi/v1/historicalTrades", add_api_key=True)
+@endpoints.get(
+    "/fapi/v1/historicalTrades", add_api_key=True, weight=20, pagination=Pagination("fromId", "id", limit=1000)
+)
 def historical_trades(symbol: str, limit: Optional[int] = None, fromId: Optional[int] = None) -> Response:
     """
     Gets historical trades for a symbol. (*MARKET_DATA*)
@@ -211,7 +214,7 @@ def historical_trades(symbol: str, limit: Optional[int] = None, fromId: Optional
     """
 
 
-@endpoints.get("/fapi/v1/aggTrades")
+@endpoints.get("/fapi/v1/aggTrades", weight=20, pagination=Pagination("fromId", "a", limit=1000, time="T"))
 def aggregated_trades(
     symbol: str,
     fromId: Optional[int] = None,
@@ -247,7 +250,7 @@ def aggregated_trades(
     """
 
 
-@endpoints.get("/fapi/v1/klines")
+@endpoints.get("/fapi/v1/klines", weight=helpers.klines_weight)
 def klines(
     symbol: str,
     interval: KlineInterval,
@@ -284,7 +287,7 @@ def klines(
     """
 
 
-@endpoints.get("/fapi/v1/continuousKlines")
+@endpoints.get("/fapi/v1/continuousKlines", weight=helpers.klines_weight)
 def continues_contract_klines(
     pair: str,
     contractType: ContractType,
@@ -324,7 +327,7 @@ def continues_contract_klines(
     """
 
 
-@endpoints.get("/fapi/v1/indexPriceKlines")
+@endpoints.get("/fapi/v1/indexPriceKlines", weight=helpers.klines_weight)
 def index_price_klines(
     pair: str,
     interval: KlineInterval,
@@ -360,7 +363,7 @@ def index_price_klines(
     """
 
 
-@endpoints.get("/fapi/v1/markPriceKlines")
+@endpoints.get("/fapi/v1/markPriceKlines", weight=helpers.klines_weight)
 def mark_price_klines(
     symbol: str,
     interval: KlineInterval,
@@ -397,11 +400,11 @@ def mark_price_klines(
     """
 
 
-@endpoints.get("/fapi/v1/premiumIndex")
+@endpoints.get("/fapi/v1/premiumIndex", weight=helpers.symbol_weight(1, 10), ttl=0.5)
 def mark_price(symbol: Optional[str] = None) -> Response:
     """
     Gets mark price for a symbol or all symbols.
-    weight=1
+    weight: 1 with symbol, 10 without
 
     https://binance-docs.github.io/apidocs/futures/en/#mark-price
 
@@ -450,7 +453,7 @@ def funding_rate_history(
     """
 
 
-@endpoints.get("/fapi/v1/ticker/24hr")
+@endpoints.get("/fapi/v1/ticker/24hr", weight=helpers.symbol_weight(1, 40))
 def ticker_price_change_statistics(symbol: Optional[str] = None) -> Response:
     """
     Gets the 24 hour rolling window price change statistics for symbol or all symbols.
@@ -471,7 +474,7 @@ def ticker_price_change_statistics(symbol: Optional[str] = None) -> Response:
     """
 
 
-@endpoints.get("/fapi/v1/ticker/price")
+@endpoints.get("/fapi/v1/ticker/price", weight=helpers.symbol_weight(1, 2), ttl=0.5)
 def ticker_price(symbol: Optional[str] = None) -> Response:
     """
     Gets the latest price for a symbol or all symbols.
@@ -487,7 +490,7 @@ def ticker_price(symbol: Optional[str] = None) -> Response:
     """
 
 
-@endpoints.get("/fapi/v1/ticker/bookTicker")
+@endpoints.get("/fapi/v1/ticker/bookTicker", weight=helpers.symbol_weight(2, 5), ttl=0.5)
 def ticker_order_book(symbol: Optional[str] = None) -> Response:
     """
     Gets best price/quantity on the order book for a symbol or all symbols.
@@ -508,7 +511,7 @@ def ticker_order_book(symbol: Optional[str] = None) -> Response:
     """
 
 
-@endpoints.add("GET", "/fapi/v1/openInterest")
+@endpoints.get("/fapi/v1/openInterest", ttl=0.5)
 def open_interest(symbol: str) -> Response:
     """
     Gets present open interest for a specific symbol.
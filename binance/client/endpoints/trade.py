@@ -34,7 +34,7 @@ def set_position_mode(
     """
 
 
-@endpoints.get("/fapi/v1/positionSide/dual", add_api_key=True, add_signature=True)
+@endpoints.get("/fapi/v1/positionSide/dual", add_api_key=True, add_signature=True, weight=30)
 def get_position_mode(timestamp: int = helpers.get_timestamp, recvWindow: Optional[int] = None) -> Response:
     """
     Gets the user's position mode on every position: hedge mode or one-way mode (*USER_DATA*)
@@ -68,7 +68,7 @@ def set_multiasset_mode(multiAssetsMargin, timestamp: int = helpers.get_timestam
     """
 
 
-@endpoints.get("/fapi/v1/multiAssetsMargin", add_api_key=True)
+@endpoints.get("/fapi/v1/multiAssetsMargin", add_api_key=True, weight=30)
 def get_multiasset_mode(timestamp: int = helpers.get_timestamp, recvWindow: int = None) -> Response:
     """
     Gets the user's Multi-Assets mode (Multi-Assets Mode or Single-Asset Mode) on Every symbol (*USER DATA*)
@@ -84,7 +84,7 @@ def get_multiasset_mode(timestamp: int = helpers.get_timestamp, recvWindow: int
     """
 
 
-@endpoints.post("/fapi/v1/order", add_api_key=True, add_signature=True)
+@endpoints.post("/fapi/v1/order", add_api_key=True, add_signature=True, weight=0, orders=1)
 def new_order(order: OrderType, timestamp: int = helpers.get_timestamp, recvWindow: int = None) -> Response:
     """
     Send in a new order (*TRADE*).
@@ -102,7 +102,9 @@ def new_order(order: OrderType, timestamp: int = helpers.get_timestamp, recvWind
     """
 
 
-@endpoints.post("/fapi/v1/batchOrders", add_api_key=True, add_signature=True)
+@endpoints.post(
+    "/fapi/v1/batchOrders", add_api_key=True, add_signature=True, weight=5, orders=helpers.batch_size
+)
 def batch_order(orders: BatchOrder, timestamp: int = helpers.get_timestamp, recvWindow: int = None) -> Response:
     """
     Send in a batch of orders (*TRADE*).
@@ -42,7 +42,7 @@ def keep_listen_key_alive():
     """
 
 
-@endpoints.delete("DELETE", "/fapi/v1/listenKey", add_api_key=True)
+@endpoints.delete("/fapi/v1/listenKey", add_api_key=True)
 def close_listen_key():
     """
     Closes current user data streams listen key (USER_STREAM).
@@ -58,7 +58,7 @@ def close_listen_key():
 
     To close a listen key call:
 
-        >>> client.user_data.close_list_key()
+        >>> client.user_data.close_listen_key()
         Response(status=200, data={})
     """
 
@@ -0,0 +1,302 @@
+"""
+Exchange information
+====================
+
+Cached and indexed exchange information (symbols, their status and trading filters).
+
+https://binance-docs.github.io/apidocs/futures/en/#exchange-information
+"""
+import hashlib
+import logging
+import re
+import time
+from collections.abc import Callable, Iterator
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from binance.client.fixed_point import scale_of
+from binance.client.periodic import Periodic
+
+if TYPE_CHECKING:
+    from binance.client.base import BaseClient
+
+log = logging.getLogger(__name__)
+
+
+class SymbolInfo:
+    """
+    Trading rules of a symbol.
+
+    Parameters
+    ----------
+    data: dict
+        Symbol entry of exchange information
+    """
+
+    __slots__ = [
+        "symbol",
+        "pair",
+        "status",
+        "contract_type",
+        "price_precision",
+        "quantity_precision",
+        "min_price",
+        "max_price",
+        "tick_size",
+        "min_qty",
+        "max_qty",
+        "step_size",
+        "market_min_qty",
+        "market_max_qty",
+        "market_step_size",
+        "min_notional",
+        "multiplier_up",
+        "multiplier_down",
+        "price_scale",
+        "quantity_scale",
+        "filters",
+        "data",
+    ]
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.symbol = data["symbol"]
+        self.pair = data.get("pair")
+        self.status = data.get("status")
+        self.contract_type = data.get("contractType")
+        self.price_precision = data.get("pricePrecision")
+        self.quantity_precision = data.get("quantityPrecision")
+        #: filters by filter type
+        self.filters = {f["filterType"]: f for f in data.get("filters", [])}
+
+        price = self.filters.get("PRICE_FILTER", {})
+        self.min_price = self._decimal(price.get("minPrice"))
+        self.max_price = self._decimal(price.get("maxPrice"))
+        self.tick_size = self._decimal(price.get("tickSize"))
+        lot = self.filters.get("LOT_SIZE", {})
+        self.min_qty = self._decimal(lot.get("minQty"))
+        self.max_qty = self._decimal(lot.get("maxQty"))
+        self.step_size = self._decimal(lot.get("stepSize"))
+        market_lot = self.filters.get("MARKET_LOT_SIZE", lot)
+        self.market_min_qty = self._decimal(market_lot.get("minQty"))
+        self.market_max_qty = self._decimal(market_lot.get("maxQty"))
+        self.market_step_size = self._decimal(market_lot.get("stepSize"))
+        self.min_notional = self._decimal(self.filters.get("MIN_NOTIONAL", {}).get("notional"))
+        percent = self.filters.get("PERCENT_PRICE", {})
+        self.multiplier_up = self._decimal(percent.get("multiplierUp"))
+        self.multiplier_down = self._decimal(percent.get("multiplierDown"))
+        #: decimals of fixed-point prices and quantities (see :mod:`binance.client.fixed_point`)
+        self.price_scale = scale_of(self.tick_size, self.price_precision)
+        self.quantity_scale = scale_of(self.step_size, self.quantity_precision)
+
+    def __repr__(self) -> str:
+        return (
+            f"SymbolInfo(symbol={self.symbol}, status={self.status}, contract_type={self.contract_type}, "
+            f"tick_size={self.tick_size}, step_size={self.step_size}, min_notional={self.min_notional})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SymbolInfo):
+            return NotImplemented
+        return self.data == other.data
+
+    @staticmethod
+    def _decimal(value: str | None) -> Decimal | None:
+        return None if value is None else Decimal(str(value))
+
+
+class ExchangeInfoDiff:
+    """
+    Changes between two versions of exchange information.
+
+    Parameters
+    ----------
+    listed: list[str]
+        Symbols added
+    delisted: list[str]
+        Symbols removed
+    changed: dict[str, tuple[SymbolInfo, SymbolInfo]]
+        Old and new trading rules of symbols whose status or filters changed
+    """
+
+    __slots__ = ["listed", "delisted", "changed"]
+
+    def __init__(self, listed: list[str], delisted: list[str], changed: dict[str, tuple[SymbolInfo, SymbolInfo]]):
+        self.listed = listed
+        self.delisted = delisted
+        self.changed = changed
+
+    def __repr__(self) -> str:
+        return f"ExchangeInfoDiff(listed={self.listed}, delisted={self.delisted}, changed={list(self.changed)})"
+
+    def __bool__(self) -> bool:
+        return bool(self.listed or self.delisted or self.changed)
+
+    @classmethod
+    def compare(cls, old: dict[str, SymbolInfo], new: dict[str, SymbolInfo]) -> "ExchangeInfoDiff":
+        """
+        Compares two symbol indexes.
+
+        Parameters
+        ----------
+        old: dict[str, SymbolInfo]
+            Previous symbol index
+        new: dict[str, SymbolInfo]
+            Current symbol index
+
+        Returns
+        -------
+        :class:`ExchangeInfoDiff`
+            Changes from `old` to `new`
+        """
+        listed = [symbol for symbol in new if symbol not in old]
+        delisted = [symbol for symbol in old if symbol not in new]
+        changed = {}
+        for symbol, info in new.items():
+            previous = old.get(symbol)
+            if previous is None:
+                continue
+            if previous.status != info.status or previous.filters != info.filters:
+                changed[symbol] = (previous, info)
+        return cls(listed, delisted, changed)
+
+
+class ExchangeInfo(Periodic):
+    """
+    Cached exchange information indexed by symbol.
+
+    The payload is hashed (ignoring ``serverTime``) before it is decoded, so an unchanged refresh neither decodes
+    nor re-indexes it. Changed payloads produce an :class:`ExchangeInfoDiff` which is returned by :meth:`refresh`
+    and passed to every listener.
+
+    Parameters
+    ----------
+    client: :class:`binance.client.base.BaseClient`
+        Binance client used to query exchange information
+    ttl: float
+        Seconds between background refreshes
+
+    Examples
+    --------
+    >>> info = ExchangeInfo(client=None)
+    >>> "BTCUSDT" in info
+    False
+    """
+
+    __slots__ = ["client", "ttl", "symbols", "data", "digest", "updated", "listeners"]
+
+    #: matches server time of payload (which changes on every call)
+    SERVER_TIME = re.compile(rb'"serverTime"\s*:\s*\d+')
+
+    #: default seconds between background refreshes
+    TTL = 3600.0
+
+    TASK = "exchange information refresh"
+
+    def __init__(self, client: "BaseClient", ttl: float = TTL):
+        super().__init__()
+        self.client = client
+        self.ttl = ttl
+        #: symbol index
+        self.symbols: dict[str, SymbolInfo] = {}
+        #: decoded exchange information (without symbols)
+        self.data = None
+        self.digest = None
+        #: local time of last refresh
+        self.updated = None
+        #: callables called with every non-empty :class:`ExchangeInfoDiff`
+        self.listeners: list[Callable[[ExchangeInfoDiff], None]] = []
+
+    def __repr__(self) -> str:
+        return f"ExchangeInfo(symbols={len(self.symbols)}, updated={self.updated})"
+
+    def __getitem__(self, symbol: str) -> SymbolInfo:
+        return self.symbols[symbol]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.symbols
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.symbols)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def get(self, symbol: str, default: SymbolInfo = None) -> SymbolInfo | None:
+        """Gets trading rules of symbol (`default` if unknown)"""
+        return self.symbols.get(symbol, default)
+
+    def require(self) -> None:
+        """
+        Ensures exchange information is loaded.
+
+        Raises
+        ------
+        ValueError
+            If exchange information is not loaded
+        """
+        if not self.symbols:
+            raise ValueError("exchange information is not loaded, call client.exchange_info.refresh()")
+
+    @property
+    def expired(self) -> bool:
+        """Whether exchange information is missing or older than ttl"""
+        return self.updated is None or time.time() - self.updated > self.ttl
+
+    def load(self, body: bytes, decoder: Callable[[bytes], object] = None) -> ExchangeInfoDiff | None:
+        """
+        Loads exchange information payload.
+
+        Parameters
+        ----------
+        body: bytes
+            JSON body of :func:`binance.client.endpoints.market.exchange_info`
+        decoder: Callable[[bytes], object], optional
+            JSON decoder, defaults to the client decoder
+
+        Returns
+        -------
+        :class:`ExchangeInfoDiff` | None
+            Changes, None if content is unchanged
+        """
+        self.updated = time.time()
+        digest = hashlib.blake2b(self.SERVER_TIME.sub(b"", body), digest_size=16).digest()
+        if digest == self.digest:
+            return None
+
+        decoder = decoder or self.client.decoder
+        data = decoder(body)
+        symbols = {entry["symbol"]: SymbolInfo(entry) for entry in data.pop("symbols", [])}
+        diff = ExchangeInfoDiff.compare(self.symbols, symbols) if self.digest is not None else None
+        self.symbols, self.data, self.digest = symbols, data, digest
+        if diff:
+            log.info("exchange information changed: %s", diff)
+            for listener in self.listeners:
+                listener(diff)
+        return diff
+
+    def refresh(self):
+        """
+        Refreshes exchange information.
+
+        Returns a coroutine when the client is asynchronous.
+
+        Returns
+        -------
+        :class:`ExchangeInfoDiff` | None
+            Changes, None if content is unchanged (or on first load)
+        """
+        if self.client.ASYNCHRONOUS:
+            return self._async_refresh()
+        return self.load(self.client.market.exchange_info().body)
+
+    async def _async_refresh(self) -> ExchangeInfoDiff | None:
+        return self.load((await self.client.market.exchange_info()).body)
+
+    @property
+    def period(self) -> float:
+        """Seconds between background refreshes"""
+        return self.ttl
+
+    def _step(self):
+        return self.refresh()
@@ -0,0 +1,226 @@
+"""
+Order filters
+=============
+
+Local validation and rounding of orders against the symbol filters of cached exchange information, so invalid
+orders are rejected before they are sent (and before they use order rate limits).
+
+https://binance-docs.github.io/apidocs/futures/en/#filters
+"""
+import json
+import logging
+from decimal import ROUND_DOWN, ROUND_UP, Decimal
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from binance.client.endpoints.base import Parameters
+    from binance.client.exchange_info import ExchangeInfo, SymbolInfo
+
+log = logging.getLogger(__name__)
+
+
+class FilterException(ValueError):
+    """
+    Order violates a symbol filter
+
+    Parameters
+    ----------
+    symbol: str
+        Symbol of order
+    filter_type: str
+        Violated filter, e.g. ``LOT_SIZE``
+    message: str
+        Description of violation
+    """
+
+    def __init__(self, symbol: str, filter_type: str, message: str):
+        super().__init__(f"{symbol} {filter_type}: {message}")
+        self.symbol = symbol
+        self.filter_type = filter_type
+
+
+class SymbolRules:
+    """
+    Precomputed rounding and bounds of a symbol (a value of zero disables a bound, as on binance).
+
+    Parameters
+    ----------
+    info: :class:`binance.client.exchange_info.SymbolInfo`
+        Trading rules of symbol
+    """
+
+    __slots__ = ["info", "tick_size", "min_price", "max_price", "lot", "market_lot", "min_notional", "up", "down"]
+
+    def __init__(self, info: "SymbolInfo"):
+        self.info = info
+        self.tick_size = info.tick_size or None
+        self.min_price = info.min_price or None
+        self.max_price = info.max_price or None
+        #: (step size, min qty, max qty) of limit and market orders
+        self.lot = (info.step_size or None, info.min_qty or None, info.max_qty or None)
+        self.market_lot = (info.market_step_size or None, info.market_min_qty or None, info.market_max_qty or None)
+        self.min_notional = info.min_notional or None
+        self.up = info.multiplier_up
+        self.down = info.multiplier_down
+
+    def __repr__(self) -> str:
+        return f"SymbolRules(symbol={self.info.symbol}, tick_size={self.tick_size}, lot={self.lot})"
+
+    @staticmethod
+    def round(value: Decimal, step: Decimal | None, rounding: str) -> Decimal:
+        """Rounds value to a multiple of step"""
+        if step is None:
+            return value
+        return (value / step).to_integral_value(rounding) * step
+
+
+class OrderFilter:
+    """
+    Order pre-validation against exchange filters.
+
+    Prices are rounded to the tick size in the direction favourable to the order (down for buys, up for sells)
+    and quantities down to the step size. Rounded orders are then checked against PRICE_FILTER, LOT_SIZE (or
+    MARKET_LOT_SIZE), MIN_NOTIONAL and, when a mark price is known, PERCENT_PRICE.
+
+    Parameters
+    ----------
+    exchange_info: :class:`binance.client.exchange_info.ExchangeInfo`
+        Cached exchange information
+    """
+
+    __slots__ = ["exchange_info", "mark_prices", "_rules"]
+
+    #: order parameters subject to PRICE_FILTER
+    PRICES = ("price", "stopPrice")
+
+    #: order types using MARKET_LOT_SIZE
+    MARKET_TYPES = ("MARKET", "STOP_MARKET", "TAKE_PROFIT_MARKET")
+
+    def __init__(self, exchange_info: "ExchangeInfo"):
+        self.exchange_info = exchange_info
+        #: latest mark price per symbol, enables PERCENT_PRICE checks
+        self.mark_prices: dict[str, Decimal] = {}
+        self._rules: dict[str, SymbolRules] = {}
+
+    def __repr__(self) -> str:
+        return f"OrderFilter(symbols={len(self._rules)})"
+
+    def set_mark_price(self, symbol: str, price: str | float | Decimal) -> None:
+        """Sets latest mark price of symbol"""
+        self.mark_prices[symbol] = Decimal(str(price))
+
+    def rules(self, symbol: str) -> SymbolRules:
+        """
+        Gets (cached) rules of symbol
+
+        Parameters
+        ----------
+        symbol: str
+            Symbol
+
+        Returns
+        -------
+        :class:`SymbolRules`
+            Rounding and bounds of symbol, rebuilt whenever exchange information changes
+        """
+        info = self.exchange_info.get(symbol)
+        if info is None:
+            self.exchange_info.require()
+            raise FilterException(symbol, "SYMBOL", "unknown symbol")
+        rules = self._rules.get(symbol)
+        if rules is None or rules.info is not info:
+            rules = self._rules[symbol] = SymbolRules(info)
+        return rules
+
+    def check_order(self, order: dict[str, str]) -> dict[str, str]:
+        """
+        Rounds and validates a single order.
+
+        Parameters
+        ----------
+        order: dict[str, str]
+            String encoded order parameters
+
+        Returns
+        -------
+        dict[str, str]
+            Order parameters with rounded price and quantity
+
+        Raises
+        ------
+        :class:`FilterException`
+            If order violates a filter
+        """
+        symbol = order["symbol"]
+        rules = self.rules(symbol)
+        if rules.info.status not in (None, "TRADING"):
+            raise FilterException(symbol, "STATUS", f"symbol is {rules.info.status}")
+
+        buy = order.get("side", "").upper() == "BUY"
+        market = order.get("type", "").upper() in self.MARKET_TYPES
+
+        price = None
+        for key in self.PRICES:
+            if key not in order:
+                continue
+            value = rules.round(Decimal(order[key]), rules.tick_size, ROUND_DOWN if buy else ROUND_UP)
+            if rules.min_price is not None and value < rules.min_price:
+                raise FilterException(symbol, "PRICE_FILTER", f"{key} {value} below {rules.min_price}")
+            if rules.max_price is not None and value > rules.max_price:
+                raise FilterException(symbol, "PRICE_FILTER", f"{key} {value} above {rules.max_price}")
+            order[key] = f"{value:f}"
+            price = value if key == "price" or price is None else price
+
+        quantity = None
+        if "quantity" in order:
+            step, min_qty, max_qty = rules.market_lot if market else rules.lot
+            filter_type = "MARKET_LOT_SIZE" if market else "LOT_SIZE"
+            quantity = rules.round(Decimal(order["quantity"]), step, ROUND_DOWN)
+            if min_qty is not None and quantity < min_qty:
+                raise FilterException(symbol, filter_type, f"quantity {quantity} below {min_qty}")
+            if max_qty is not None and quantity > max_qty:
+                raise FilterException(symbol, filter_type, f"quantity {quantity} above {max_qty}")
+            order["quantity"] = f"{quantity:f}"
+
+        mark = self.mark_prices.get(symbol)
+        if market and price is None:
+            price = mark
+        # reduce only orders are exempt from MIN_NOTIONAL
+        checked = rules.min_notional is not None and order.get("reduceOnly", "").lower() != "true"
+        if checked and price is not None and quantity is not None and price * quantity < rules.min_notional:
+            raise FilterException(symbol, "MIN_NOTIONAL", f"notional {price * quantity} below {rules.min_notional}")
+
+        if mark is not None and not market and "price" in order:
+            if buy and rules.up is not None and price > mark * rules.up:
+                raise FilterException(symbol, "PERCENT_PRICE", f"price {price} above {mark * rules.up}")
+            if not buy and rules.down is not None and price < mark * rules.down:
+                raise FilterException(symbol, "PERCENT_PRICE", f"price {price} below {mark * rules.down}")
+        return order
+
+    def check(self, params: "Parameters") -> "Parameters":
+        """
+        Rounds and validates the order(s) of an order placing call.
+
+        Parameters
+        ----------
+        params: :class:`binance.client.endpoints.base.Parameters`
+            Parameters of :func:`~binance.client.endpoints.trade.new_order` or
+            :func:`~binance.client.endpoints.trade.batch_order`
+
+        Returns
+        -------
+        :class:`binance.client.endpoints.base.Parameters`
+            Parameters with rounded prices and quantities
+
+        Raises
+        ------
+        :class:`FilterException`
+            If an order violates a filter
+        """
+        if "batchOrders" in params:
+            orders = [self.check_order(order) for order in json.loads(params["batchOrders"])]
+            params["batchOrders"] = json.dumps(orders)
+        elif "symbol" in params:
+            order = self.check_order(dict(params))
+            params.update(order)
+        return params
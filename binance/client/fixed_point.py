@@ -0,0 +1,187 @@
+"""
+Fixed point
+===========
+
+Exact fixed-point (scaled integer) representation of prices and quantities.
+
+A value with scale ``s`` is stored as the integer ``value * 10**s``, e.g. ``"60123.40"`` with a price scale of 1
+(tick size 0.1) is ``601234``. Scales are the number of decimals of the tick size (prices) and step size
+(quantities) of a symbol, see :attr:`binance.client.exchange_info.SymbolInfo.price_scale`.
+"""
+import json
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from binance.client.filters import FilterException
+
+if TYPE_CHECKING:
+    from binance.client.endpoints.base import Parameters
+    from binance.client.exchange_info import ExchangeInfo
+
+
+def to_fixed(value: str, scale: int) -> int:
+    """
+    Parses decimal string into scaled integer.
+
+    Parameters
+    ----------
+    value: str
+        Decimal string, e.g. ``"0.00100000"``
+    scale: int
+        Number of decimals
+
+    Returns
+    -------
+    int
+        Scaled integer
+
+    Raises
+    ------
+    ValueError
+        If value has more (non-zero) decimals than scale
+
+    Examples
+    --------
+    >>> to_fixed("60123.40000000", 1)
+    601234
+    >>> to_fixed("-0.05", 4)
+    -500
+    >>> to_fixed("0.123", 2)
+    Traceback (most recent call last):
+    ...
+    ValueError: 0.123 has more than 2 decimals
+    """
+    integer, _, fraction = value.partition(".")
+    if len(fraction) > scale:
+        if fraction[scale:].strip("0"):
+            raise ValueError(f"{value} has more than {scale} decimals")
+        fraction = fraction[:scale]
+    return int(integer + fraction + "0" * (scale - len(fraction)))
+
+
+def from_fixed(value: int, scale: int) -> str:
+    """
+    Formats scaled integer as decimal string.
+
+    Parameters
+    ----------
+    value: int
+        Scaled integer
+    scale: int
+        Number of decimals
+
+    Returns
+    -------
+    str
+        Exact decimal string
+
+    Examples
+    --------
+    >>> from_fixed(601234, 1)
+    '60123.4'
+    >>> from_fixed(-500, 4)
+    '-0.0500'
+    >>> from_fixed(7, 0)
+    '7'
+    """
+    if not scale:
+        return str(value)
+    integer, fraction = divmod(abs(value), 10**scale)
+    return f"{'-' if value < 0 else ''}{integer}.{fraction:0{scale}d}"
+
+
+def scale_of(step: Decimal | None, precision: int | None = None) -> int:
+    """
+    Number of decimals of a tick or step size (`precision` if step is unknown).
+
+    Examples
+    --------
+    >>> scale_of(Decimal("0.10"))
+    1
+    >>> scale_of(Decimal("1"))
+    0
+    """
+    if not step:
+        return precision or 0
+    return max(-step.normalize().as_tuple().exponent, 0)
+
+
+class OrderFormatter:
+    """
+    Formats fixed-point order prices and quantities as exact decimal strings.
+
+    Order parameters ``price``, ``stopPrice``, ``activationPrice`` and ``quantity`` are scaled integers (as
+    returned by fixed-point streams and order books) and are formatted with the scales of their symbol before the
+    order is sent. Scaled values pass through float fields of order models, so they must be below ``2**53``.
+
+    Parameters
+    ----------
+    exchange_info: :class:`binance.client.exchange_info.ExchangeInfo`
+        Cached exchange information (scales of symbols)
+    """
+
+    __slots__ = ["exchange_info"]
+
+    #: order parameters with price scale
+    PRICES = ("price", "stopPrice", "activationPrice")
+
+    def __init__(self, exchange_info: "ExchangeInfo"):
+        self.exchange_info = exchange_info
+
+    def __repr__(self) -> str:
+        return "OrderFormatter()"
+
+    @staticmethod
+    def _integer(symbol: str, key: str, value: str) -> int:
+        number = Decimal(value)
+        if number != number.to_integral_value():
+            raise FilterException(symbol, "FIXED_POINT", f"{key} {value} is not a scaled integer")
+        return int(number)
+
+    def format_order(self, order: dict[str, str]) -> dict[str, str]:
+        """
+        Formats a single order.
+
+        Parameters
+        ----------
+        order: dict[str, str]
+            String encoded order parameters with scaled prices and quantity
+
+        Returns
+        -------
+        dict[str, str]
+            Order parameters with decimal prices and quantity
+        """
+        symbol = order["symbol"]
+        info = self.exchange_info.get(symbol)
+        if info is None:
+            self.exchange_info.require()
+            raise FilterException(symbol, "SYMBOL", "unknown symbol")
+        for key in self.PRICES:
+            if key in order:
+                order[key] = from_fixed(self._integer(symbol, key, order[key]), info.price_scale)
+        if "quantity" in order:
+            order["quantity"] = from_fixed(self._integer(symbol, "quantity", order["quantity"]), info.quantity_scale)
+        return order
+
+    def format(self, params: "Parameters") -> "Parameters":
+        """
+        Formats the order(s) of an order placing call.
+
+        Parameters
+        ----------
+        params: :class:`binance.client.endpoints.base.Parameters`
+            Parameters of :func:`~binance.client.endpoints.trade.new_order` or
+            :func:`~binance.client.endpoints.trade.batch_order`
+
+        Returns
+        -------
+        :class:`binance.client.endpoints.base.Parameters`
+            Parameters with decimal prices and quantities
+        """
+        if "batchOrders" in params:
+            orders = [self.format_order(order) for order in json.loads(params["batchOrders"])]
+            params["batchOrders"] = json.dumps(orders)
+        elif "symbol" in params:
+            params.update(self.format_order(dict(params)))
+        return params
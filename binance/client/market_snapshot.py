@@ -0,0 +1,283 @@
+"""
+Market snapshot
+===============
+
+Latest mark prices, funding rates, 24hr tickers and best bids and asks of all symbols as columnar NumPy arrays
+(requires the ``numpy`` package), maintained from the all market streams ``!markPrice@arr@1s``, ``!ticker@arr``
+and ``!bookTicker``.
+
+Every symbol has a fixed row (see :attr:`MarketSnapshot.index`) and every field a column. An all market frame is
+applied as one vectorized in-place update of the rows of its symbols per column, so the whole market can be read
+as arrays without a dict or event object per symbol.
+
+Ticker and book prices and quantities are floats, or scaled int64 integers in fixed-point mode (see
+:mod:`binance.client.fixed_point`). Mark and index prices, funding rates, quote volumes and percentages carry more
+decimals than the tick size and are always floats.
+
+https://binance-docs.github.io/apidocs/futures/en/#all-market-mark-price-stream
+"""
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from binance.client.fixed_point import to_fixed
+from binance.client.streams.market_data_stream import MarketDataStreams
+
+if TYPE_CHECKING:
+    from binance.client.base import BaseClient
+
+log = logging.getLogger(__name__)
+
+#: column kinds, prices and quantities are scaled int64 integers in fixed-point mode
+FLOAT, INTEGER, PRICE, QUANTITY = "float", "integer", "price", "quantity"
+
+#: kind of every column
+COLUMNS = {
+    # !markPrice@arr@1s
+    "mark_price": FLOAT,
+    "index_price": FLOAT,
+    "funding_rate": FLOAT,
+    "next_funding_time": INTEGER,
+    "mark_time": INTEGER,
+    # !ticker@arr
+    "last_price": PRICE,
+    "open_price": PRICE,
+    "high_price": PRICE,
+    "low_price": PRICE,
+    "volume": QUANTITY,
+    "quote_volume": FLOAT,
+    "price_change_percent": FLOAT,
+    "trades": INTEGER,
+    "ticker_time": INTEGER,
+    # !bookTicker
+    "bid_price": PRICE,
+    "bid_quantity": QUANTITY,
+    "ask_price": PRICE,
+    "ask_quantity": QUANTITY,
+    "book_update_id": INTEGER,
+    "book_time": INTEGER,
+}
+
+#: columns by payload key of every stream
+STREAMS = {
+    "!markPrice@arr@1s": {
+        "p": "mark_price",
+        "i": "index_price",
+        "r": "funding_rate",
+        "T": "next_funding_time",
+        "E": "mark_time",
+    },
+    "!ticker@arr": {
+        "c": "last_price",
+        "o": "open_price",
+        "h": "high_price",
+        "l": "low_price",
+        "v": "volume",
+        "q": "quote_volume",
+        "P": "price_change_percent",
+        "n": "trades",
+        "E": "ticker_time",
+    },
+    "!bookTicker": {
+        "b": "bid_price",
+        "B": "bid_quantity",
+        "a": "ask_price",
+        "A": "ask_quantity",
+        "u": "book_update_id",
+        "T": "book_time",
+    },
+}
+
+#: columns by response key of :func:`~binance.client.endpoints.market.mark_price`
+MARK_PRICE = {
+    "markPrice": "mark_price",
+    "indexPrice": "index_price",
+    "lastFundingRate": "funding_rate",
+    "nextFundingTime": "next_funding_time",
+    "time": "mark_time",
+}
+
+#: columns by response key of :func:`~binance.client.endpoints.market.ticker_order_book`
+BOOK_TICKER = {
+    "bidPrice": "bid_price",
+    "bidQty": "bid_quantity",
+    "askPrice": "ask_price",
+    "askQty": "ask_quantity",
+    "lastUpdateId": "book_update_id",
+    "time": "book_time",
+}
+
+
+class MarketSnapshot:
+    """
+    All market data of many symbols as columns.
+
+    Columns (see :data:`COLUMNS`) are one-dimensional arrays indexed by the row of a symbol, e.g.
+    ``snapshot["funding_rate"][snapshot.index["BTCUSDT"]]``. Columns are updated in place and never reallocated,
+    so they can be held by callers. Missing float values are NaN and missing integers (including fixed-point prices
+    and quantities) zero. Symbols listed after the snapshot is created are ignored.
+
+    Parameters
+    ----------
+    client: :class:`binance.client.base.BaseClient`
+        Binance client (websocket url, seed calls and exchange information)
+    symbols: Iterable[str], optional
+        Symbols of snapshot, defaults to all symbols of the loaded exchange information
+    streams: :class:`binance.client.streams.MarketDataStreams`, optional
+        Market data streams carrying the all market streams, defaults to new streams of client
+
+    Raises
+    ------
+    ValueError
+        If exchange information is not loaded while symbols are not given or in fixed-point mode
+    """
+
+    __slots__ = ["client", "streams", "index", "columns", "_scales", "_owns_streams"]
+
+    def __init__(self, client: "BaseClient", symbols: Iterable[str] = None, streams: MarketDataStreams = None):
+        self.client = client
+        self._owns_streams = streams is None
+        self.streams = MarketDataStreams(client) if streams is None else streams
+        if symbols is None or self.streams.fixed_point:
+            client.exchange_info.require()
+        if symbols is None:
+            symbols = client.exchange_info
+        #: row of symbol
+        self.index = {symbol: row for row, symbol in enumerate(symbols)}
+        size = len(self.index)
+        # price and quantity scales per row (fixed-point mode only)
+        self._scales = None
+        if self.streams.fixed_point:
+            infos = [client.exchange_info[symbol] for symbol in self.index]
+            self._scales = [(info.price_scale, info.quantity_scale) for info in infos]
+        #: column by name
+        self.columns: dict[str, np.ndarray] = {}
+        for name, kind in COLUMNS.items():
+            if kind == FLOAT or (kind in (PRICE, QUANTITY) and self._scales is None):
+                self.columns[name] = np.full(size, np.nan)
+            else:
+                self.columns[name] = np.zeros(size, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"MarketSnapshot(symbols={len(self.index)})"
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def row(self, symbol: str) -> dict[str, float | int]:
+        """All columns of symbol"""
+        row = self.index[symbol]
+        return {name: column[row].item() for name, column in self.columns.items()}
+
+    def start(self) -> None:
+        """Subscribes the all market streams"""
+        for stream in STREAMS:
+            self.streams.subscribe(stream, self.on_frame, raw=True)
+
+    async def close(self) -> None:
+        """Unsubscribes the all market streams"""
+        for stream in STREAMS:
+            self.streams.unsubscribe(stream, self.on_frame)
+        if self._owns_streams:
+            await self.streams.close()
+
+    def seed(self):
+        """
+        Fills the snapshot with mark prices, funding rates and best bids and asks of all symbols in one call each.
+
+        Call before :meth:`start`, streamed updates are newer. Returns a coroutine when the client is asynchronous.
+        """
+        if self.client.ASYNCHRONOUS:
+            return self._async_seed()
+        self.update(self.client.market.mark_price().data, MARK_PRICE, key="symbol")
+        self.update(self.client.market.ticker_order_book().data, BOOK_TICKER, key="symbol")
+
+    async def _async_seed(self) -> None:
+        mark_prices, book_tickers = await asyncio.gather(
+            self.client.market.mark_price(), self.client.market.ticker_order_book()
+        )
+        self.update(mark_prices.data, MARK_PRICE, key="symbol")
+        self.update(book_tickers.data, BOOK_TICKER, key="symbol")
+
+    def on_frame(self, frame: str | bytes) -> None:
+        """
+        Applies an undecoded combined stream frame of an all market stream.
+
+        Parameters
+        ----------
+        frame: str | bytes
+            All market frame, ``{"stream": <name>, "data": [...]}``
+        """
+        message = self.client.decoder(frame)
+        fields = STREAMS.get(message["stream"])
+        if fields is not None:
+            self.update(message["data"], fields)
+
+    def update(self, entries: list[dict] | dict, fields: dict[str, str], key: str = "s") -> None:
+        """
+        Writes entries into the rows of their symbols.
+
+        Parameters
+        ----------
+        entries: list[dict] | dict
+            Decoded entries (or a single entry) with string encoded numbers, empty strings are missing values
+        fields: dict[str, str]
+            Column by entry key, e.g. ``STREAMS["!ticker@arr"]``
+        key: str
+            Symbol key of entries
+
+        Raises
+        ------
+        ValueError
+            If a fixed-point price or quantity has more decimals than the scale of its symbol
+        """
+        if isinstance(entries, dict):
+            row = self.index.get(entries[key])
+            if row is not None:
+                self._update_row(row, entries, fields)
+            return
+
+        index = self.index
+        rows, known = [], []
+        for entry in entries:
+            row = index.get(entry[key])
+            if row is not None:
+                rows.append(row)
+                known.append(entry)
+        if not rows:
+            return
+        scales = self._scales
+        index = np.array(rows, dtype=np.intp)
+        for source, name in fields.items():
+            kind, column = COLUMNS[name], self.columns[name]
+            if kind == INTEGER:
+                column[index] = [entry[source] for entry in known]
+            elif kind == FLOAT or scales is None:
+                # empty strings (e.g. funding rates of delivery contracts) are missing values
+                column[index] = [entry[source] or "nan" for entry in known]
+            else:
+                side = 0 if kind == PRICE else 1
+                column[index] = [
+                    to_fixed(entry[source], scales[row][side]) if entry[source] else 0
+                    for row, entry in zip(rows, known, strict=True)
+                ]
+
+    def _update_row(self, row: int, entry: dict, fields: dict[str, str]) -> None:
+        scales = self._scales
+        for source, name in fields.items():
+            kind, value = COLUMNS[name], entry[source]
+            if kind == INTEGER:
+                self.columns[name][row] = value
+            elif kind == FLOAT or scales is None:
+                self.columns[name][row] = value or "nan"
+            else:
+                self.columns[name][row] = to_fixed(value, scales[row][0 if kind == PRICE else 1]) if value else 0
@@ -0,0 +1,452 @@
+"""
+Order book
+==========
+
+Local order books maintained from diff depth streams and REST snapshots (requires the ``numpy`` package).
+Levels are floats, or scaled int64 integers in fixed-point mode (see :mod:`binance.client.fixed_point`) so book
+updates and comparisons are integer operations.
+
+Follows the synchronisation protocol of binance: depth updates are buffered while a snapshot is fetched, updates
+older than the snapshot are dropped, the first applied update must cover the ``lastUpdateId`` of the snapshot and
+every following update must continue the previous one (``pu``). A gap triggers a new snapshot.
+
+https://binance-docs.github.io/apidocs/futures/en/#how-to-manage-a-local-order-book-correctly
+"""
+import asyncio
+import functools
+import logging
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from binance.client.fixed_point import to_fixed
+from binance.client.streams.events import DepthUpdate
+from binance.client.streams.market_data_stream import MarketDataStreams
+
+if TYPE_CHECKING:
+    from binance.client.base import BaseClient
+    from binance.client.exchange_info import SymbolInfo
+
+log = logging.getLogger(__name__)
+
+
+class BookSide:
+    """
+    Price levels of one side of an order book.
+
+    Levels are kept in preallocated arrays sorted by ascending price (grown by doubling when full), so bids have
+    their best level last and asks first. Queries return views or walk the arrays from the best level without
+    copying them.
+
+    Parameters
+    ----------
+    bid: bool
+        Whether side holds bids (best level is the highest price)
+    capacity: int
+        Initial number of levels
+    dtype: :class:`numpy.dtype`
+        Type of prices and quantities, ``int64`` for fixed-point levels
+    """
+
+    __slots__ = ["bid", "prices", "quantities", "size"]
+
+    def __init__(self, bid: bool, capacity: int = 1024, dtype: np.dtype = np.float64):
+        self.bid = bid
+        self.prices = np.empty(capacity, dtype=dtype)
+        self.quantities = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def __repr__(self) -> str:
+        return f"BookSide(bid={self.bid}, levels={self.size}, best={self.best})"
+
+    def __len__(self) -> int:
+        return self.size
+
+    def clear(self) -> None:
+        """Removes all levels"""
+        self.size = 0
+
+    def load(self, levels: Iterable[tuple[float, float]]) -> None:
+        """
+        Replaces all levels.
+
+        Parameters
+        ----------
+        levels: Iterable[tuple[float, float]]
+            Price and quantity of levels (in any order)
+        """
+        levels = np.asarray(list(levels), dtype=self.prices.dtype).reshape(-1, 2)
+        levels = levels[levels[:, 1] > 0]
+        levels = levels[np.argsort(levels[:, 0], kind="stable")]
+        self.size = 0
+        self._reserve(len(levels))
+        self.size = len(levels)
+        self.prices[: self.size] = levels[:, 0]
+        self.quantities[: self.size] = levels[:, 1]
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self.prices)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in ("prices", "quantities"):
+            array = np.empty(capacity, dtype=self.prices.dtype)
+            array[: self.size] = getattr(self, name)[: self.size]
+            setattr(self, name, array)
+
+    def update(self, price: float, quantity: float) -> None:
+        """
+        Sets quantity of a level, a quantity of zero removes the level.
+
+        Parameters
+        ----------
+        price: float
+            Price of level
+        quantity: float
+            Total quantity of level
+        """
+        size = self.size
+        prices = self.prices
+        i = int(prices[:size].searchsorted(price))
+        if i < size and prices[i] == price:
+            if quantity:
+                self.quantities[i] = quantity
+            else:
+                prices[i : size - 1] = prices[i + 1 : size]
+                self.quantities[i : size - 1] = self.quantities[i + 1 : size]
+                self.size = size - 1
+        elif quantity:
+            self._reserve(size + 1)
+            prices, quantities = self.prices, self.quantities
+            prices[i + 1 : size + 1] = prices[i:size]
+            quantities[i + 1 : size + 1] = quantities[i:size]
+            prices[i] = price
+            quantities[i] = quantity
+            self.size = size + 1
+
+    def index(self, level: int) -> int:
+        """Array index of `level` (0 is the best level)"""
+        return self.size - 1 - level if self.bid else level
+
+    @property
+    def best(self) -> tuple[float, float] | None:
+        """Price and quantity of best level"""
+        if not self.size:
+            return None
+        i = self.index(0)
+        return self.prices.item(i), self.quantities.item(i)
+
+    def top(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Best `n` levels.
+
+        Parameters
+        ----------
+        n: int
+            Number of levels
+
+        Returns
+        -------
+        tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`]
+            Views of prices and quantities, best level first (only valid until the next update)
+        """
+        n = min(n, self.size)
+        if self.bid:
+            return self.prices[self.size - n : self.size][::-1], self.quantities[self.size - n : self.size][::-1]
+        return self.prices[:n], self.quantities[:n]
+
+    def vwap(self, quantity: float) -> float | None:
+        """
+        Volume weighted average price of filling `quantity` against this side.
+
+        Parameters
+        ----------
+        quantity: float
+            Quantity to fill
+
+        Returns
+        -------
+        float | None
+            Average fill price (scaled in fixed-point mode), None if the book is not deep enough
+        """
+        prices, quantities = self.prices, self.quantities
+        step = -1 if self.bid else 1
+        i = self.index(0)
+        remaining, notional = quantity, 0.0
+        for _ in range(self.size):
+            filled = min(quantities.item(i), remaining)
+            notional += filled * prices.item(i)
+            remaining -= filled
+            if remaining <= 0:
+                return notional / quantity
+            i += step
+        return None
+
+
+class OrderBook:
+    """
+    Order book of a symbol.
+
+    Parameters
+    ----------
+    symbol: str
+        Symbol of order book
+    capacity: int
+        Initial number of levels per side
+    info: :class:`binance.client.exchange_info.SymbolInfo`, optional
+        Trading rules of symbol, keeps fixed-point levels with its scales
+    """
+
+    __slots__ = ["symbol", "info", "bids", "asks", "last_update_id", "event_time", "synced", "buffer", "_previous"]
+
+    def __init__(self, symbol: str, capacity: int = 1024, info: "SymbolInfo" = None):
+        self.symbol = symbol
+        self.info = info
+        dtype = np.float64 if info is None else np.int64
+        self.bids = BookSide(True, capacity, dtype)
+        self.asks = BookSide(False, capacity, dtype)
+        #: update id of the current state
+        self.last_update_id = None
+        self.event_time = None
+        #: whether the book is in sync with the exchange
+        self.synced = False
+        #: updates received while not in sync
+        self.buffer: list[DepthUpdate] = []
+        self._previous = None
+
+    def __repr__(self) -> str:
+        return (
+            f"OrderBook(symbol={self.symbol}, synced={self.synced}, last_update_id={self.last_update_id}, "
+            f"bid={self.bids.best}, ask={self.asks.best})"
+        )
+
+    @property
+    def spread(self) -> float | None:
+        """Difference of best ask and best bid price"""
+        bid, ask = self.bids.best, self.asks.best
+        return None if bid is None or ask is None else ask[0] - bid[0]
+
+    @property
+    def mid_price(self) -> float | None:
+        """Average of best bid and best ask price"""
+        bid, ask = self.bids.best, self.asks.best
+        return None if bid is None or ask is None else (ask[0] + bid[0]) / 2
+
+    def load(self, snapshot: dict) -> bool:
+        """
+        Loads snapshot and applies buffered updates.
+
+        Parameters
+        ----------
+        snapshot: dict
+            Decoded :func:`binance.client.endpoints.market.order_book` response
+
+        Returns
+        -------
+        bool
+            Whether the book is in sync, False if the snapshot is older than the buffered updates or they have a
+            gap (updates following the gap stay buffered)
+        """
+        buffer, self.buffer = self.buffer, []
+        if buffer and buffer[0].first_update_id > snapshot["lastUpdateId"]:
+            log.debug("%s snapshot %s is older than buffered updates", self.symbol, snapshot["lastUpdateId"])
+            self.buffer = buffer
+            return False
+
+        self.bids.load(self._levels(snapshot["bids"]))
+        self.asks.load(self._levels(snapshot["asks"]))
+        self.last_update_id = snapshot["lastUpdateId"]
+        self.event_time = snapshot.get("E")
+        self._previous = None
+        self.synced = True
+        for i, event in enumerate(buffer):
+            if not self.apply(event):
+                # the gap restarted the buffer, keep the updates following it for the next snapshot
+                self.buffer.extend(buffer[i + 1 :])
+                return False
+        return True
+
+    def _levels(self, levels: list[list[str]]) -> list[tuple[float, float]] | list[tuple[int, int]]:
+        if self.info is None:
+            return [(float(price), float(quantity)) for price, quantity in levels]
+        scale, quantity_scale = self.info.price_scale, self.info.quantity_scale
+        return [(to_fixed(price, scale), to_fixed(quantity, quantity_scale)) for price, quantity in levels]
+
+    def apply(self, event: DepthUpdate) -> bool:
+        """
+        Applies depth update (buffers it while the book is not in sync).
+
+        Parameters
+        ----------
+        event: :class:`binance.client.streams.events.DepthUpdate`
+            Depth update of symbol
+
+        Returns
+        -------
+        bool
+            Whether the book is in sync, False if it awaits a (new) snapshot
+        """
+        if not self.synced:
+            self.buffer.append(event)
+            return False
+        if event.final_update_id < self.last_update_id:
+            return True
+
+        if self._previous is None:
+            # first update after snapshot must cover it
+            continuous = event.first_update_id <= self.last_update_id
+        else:
+            continuous = event.previous_update_id == self._previous
+        if not continuous:
+            log.warning("%s depth update gap at %s, resyncing", self.symbol, event.final_update_id)
+            self.synced = False
+            self.buffer = [event]
+            return False
+
+        bids, asks = self.bids, self.asks
+        for price, quantity in event.bids:
+            bids.update(price, quantity)
+        for price, quantity in event.asks:
+            asks.update(price, quantity)
+        self.last_update_id = self._previous = event.final_update_id
+        self.event_time = event.event_time
+        return True
+
+
+class OrderBooks:
+    """
+    Local order books of many symbols.
+
+    Subscribes the diff depth stream of every symbol, fetches snapshots (at request weight of `limit`, see
+    :func:`binance.client.endpoints.helpers.order_book_weight`) whenever a book is out of sync and notifies
+    listeners of every update of a synced book. Books keep fixed-point levels if the streams parse fixed-point
+    events.
+
+    Parameters
+    ----------
+    client: :class:`binance.client.base.BaseClient`
+        Binance client used to fetch snapshots
+    streams: :class:`binance.client.streams.MarketDataStreams`, optional
+        Market data streams carrying depth streams, defaults to new streams of client
+    limit: int
+        Levels of snapshots
+    speed: str
+        Update speed of depth streams, ``100ms``, ``250ms`` or ``500ms``
+    """
+
+    __slots__ = ["client", "streams", "limit", "speed", "books", "listeners", "_snapshots", "_owns_streams"]
+
+    def __init__(
+        self, client: "BaseClient", streams: MarketDataStreams = None, limit: int = 1000, speed: str = "100ms"
+    ):
+        self.client = client
+        self._owns_streams = streams is None
+        self.streams = MarketDataStreams(client) if streams is None else streams
+        self.limit = limit
+        self.speed = speed
+        #: order book by symbol
+        self.books: dict[str, OrderBook] = {}
+        #: callables called with every updated synced book
+        self.listeners: list[Callable[[OrderBook], None]] = []
+        self._snapshots: dict[str, asyncio.Task] = {}
+
+    def __repr__(self) -> str:
+        return f"OrderBooks(books={len(self.books)}, synced={sum(b.synced for b in self.books.values())})"
+
+    def __getitem__(self, symbol: str) -> OrderBook:
+        return self.books[symbol.upper()]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self.books
+
+    def stream(self, symbol: str) -> str:
+        """Depth stream name of symbol"""
+        return f"{symbol.lower()}@depth@{self.speed}"
+
+    def add(self, symbol: str, capacity: int = 1024) -> OrderBook:
+        """
+        Starts maintaining order book of symbol (must be called within the running event loop).
+
+        Parameters
+        ----------
+        symbol: str
+            Symbol (case-insensitive, books are keyed by the uppercase symbol of depth events)
+        capacity: int
+            Initial number of levels per side
+
+        Returns
+        -------
+        :class:`OrderBook`
+            Order book of symbol (not in sync until its first snapshot is loaded)
+
+        Raises
+        ------
+        ValueError
+            If the book keeps fixed-point levels but exchange information is not loaded
+        """
+        symbol = symbol.upper()
+        book = self.books.get(symbol)
+        if book is None:
+            info = None
+            if self.streams.fixed_point:
+                self.client.exchange_info.require()
+                info = self.client.exchange_info[symbol]
+            book = self.books[symbol] = OrderBook(symbol, capacity, info)
+            self.streams.subscribe(self.stream(symbol), self._on_depth)
+            self._resync(book)
+        return book
+
+    def remove(self, symbol: str) -> None:
+        """Stops maintaining order book of symbol"""
+        symbol = symbol.upper()
+        if self.books.pop(symbol, None) is not None:
+            self.streams.unsubscribe(self.stream(symbol), self._on_depth)
+        task = self._snapshots.pop(symbol, None)
+        if task is not None:
+            task.cancel()
+
+    def _on_depth(self, event: DepthUpdate) -> None:
+        book = self.books.get(event.symbol)
+        if book is None:
+            return
+        if book.synced and event.final_update_id < book.last_update_id:
+            # stale update, already part of the book
+            return
+        if book.apply(event):
+            for listener in self.listeners:
+                listener(book)
+        else:
+            self._resync(book)
+
+    def _resync(self, book: OrderBook) -> None:
+        if book.symbol not in self._snapshots:
+            task = asyncio.get_running_loop().create_task(self._snapshot(book))
+            self._snapshots[book.symbol] = task
+
+    async def _snapshot(self, book: OrderBook) -> None:
+        try:
+            while not book.synced and self.books.get(book.symbol) is book:
+                try:
+                    if self.client.ASYNCHRONOUS:
+                        response = await self.client.market.order_book(symbol=book.symbol, limit=self.limit)
+                    else:
+                        call = functools.partial(self.client.market.order_book, symbol=book.symbol, limit=self.limit)
+                        response = await asyncio.get_running_loop().run_in_executor(None, call)
+                except Exception as e:
+                    log.warning("%s order book snapshot failed: %s", book.symbol, e)
+                    await asyncio.sleep(1.0)
+                    continue
+                if not book.load(response.data):
+                    # wait for updates newer than the snapshot
+                    await asyncio.sleep(0.1)
+        finally:
+            self._snapshots.pop(book.symbol, None)
+
+    async def close(self) -> None:
+        """Stops maintaining all order books"""
+        for symbol in list(self.books):
+            self.remove(symbol)
+        if self._owns_streams:
+            await self.streams.close()
@@ -0,0 +1,246 @@
+"""
+Partial depth
+=============
+
+Latest top-N order book levels of many symbols from partial depth streams (``<symbol>@depth<N>@<speed>``) in one
+preallocated NumPy buffer (requires the ``numpy`` package).
+
+Float levels are parsed straight from the undecoded frame: the fields of a frame are located in any key order (and
+with any whitespace) and the numbers of its bid and ask lists are parsed by NumPy into an array, without decoding
+the frame into Python dicts, lists and strings. Fixed-point levels are decoded with the client decoder and parsed
+exactly (see :func:`binance.client.fixed_point.to_fixed`). Every row has a sequence counter (a seqlock), which is
+odd while the row is written, so readers in other threads can detect torn reads.
+
+https://binance-docs.github.io/apidocs/futures/en/#partial-book-depth-streams
+"""
+import logging
+import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from binance.client.fixed_point import to_fixed
+from binance.client.streams.market_data_stream import MarketDataStreams
+
+if TYPE_CHECKING:
+    from binance.client.base import BaseClient
+
+log = logging.getLogger(__name__)
+
+BIDS, ASKS = 0, 1
+PRICE, QUANTITY = 0, 1
+
+#: values of an undecoded frame after their key
+SYMBOL = re.compile(rb'\s*:\s*"([^"]*)"')
+NUMBER = re.compile(rb"\s*:\s*(\d+)")
+LEVELS = re.compile(rb"\s*:\s*(\[\s*\]|\[)")
+#: end of a non-empty level list
+LEVELS_END = re.compile(rb"\]\s*\]")
+
+#: characters of level lists around their numbers
+PUNCTUATION = b'[]" \t\r\n'
+
+
+class PartialDepth:
+    """
+    Top-N levels of many symbols in a preallocated buffer.
+
+    `book` has the shape ``(symbols, 2, levels, 2)``, indexed by symbol row (see `index`), side (:data:`BIDS`
+    or :data:`ASKS`), level (best first) and :data:`PRICE` or :data:`QUANTITY`. Missing levels are zero.
+    Levels are float64, or scaled int64 integers in fixed-point mode (see :mod:`binance.client.fixed_point`).
+
+    Parameters
+    ----------
+    client: :class:`binance.client.base.BaseClient`
+        Binance client (websocket url and, in fixed-point mode, exchange information)
+    symbols: Iterable[str]
+        Symbols of buffer
+    levels: int
+        Levels per side, 5, 10 or 20
+    speed: str
+        Update speed of streams, ``100ms``, ``250ms`` or ``500ms``
+    streams: :class:`binance.client.streams.MarketDataStreams`, optional
+        Market data streams carrying the partial depth streams, defaults to new streams of client
+
+    Raises
+    ------
+    ValueError
+        If levels are fixed-point but exchange information is not loaded
+    """
+
+    __slots__ = [
+        "client",
+        "levels",
+        "speed",
+        "streams",
+        "index",
+        "book",
+        "sequence",
+        "update_id",
+        "event_time",
+        "_scales",
+        "_rows",
+        "_scratch",
+        "_owns_streams",
+    ]
+
+    def __init__(
+        self,
+        client: "BaseClient",
+        symbols: Iterable[str],
+        levels: int = 10,
+        speed: str = "100ms",
+        streams: MarketDataStreams = None,
+    ):
+        self.client = client
+        self.levels = levels
+        self.speed = speed
+        self._owns_streams = streams is None
+        self.streams = MarketDataStreams(client) if streams is None else streams
+        #: row of symbol
+        self.index = {symbol: row for row, symbol in enumerate(symbols)}
+        # row of encoded symbol
+        self._rows = {symbol.encode(): row for symbol, row in self.index.items()}
+        size = len(self.index)
+        # price and quantity scales per row (fixed-point mode only)
+        self._scales = None
+        if self.streams.fixed_point:
+            client.exchange_info.require()
+            infos = [client.exchange_info[symbol] for symbol in self.index]
+            self._scales = [(info.price_scale, info.quantity_scale) for info in infos]
+        self.book = np.zeros((size, 2, levels, 2), dtype=np.float64 if self._scales is None else np.int64)
+        # levels of a frame, parsed before its row is written
+        self._scratch = np.zeros((2, levels, 2), dtype=self.book.dtype)
+        #: write sequence per row, odd while the row is written
+        self.sequence = np.zeros(size, dtype=np.uint64)
+        #: final update id per row
+        self.update_id = np.zeros(size, dtype=np.int64)
+        #: event time per row
+        self.event_time = np.zeros(size, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"PartialDepth(symbols={len(self.index)}, levels={self.levels}, speed={self.speed})"
+
+    def stream(self, symbol: str) -> str:
+        """Partial depth stream name of symbol"""
+        return f"{symbol.lower()}@depth{self.levels}@{self.speed}"
+
+    def start(self) -> None:
+        """Subscribes the partial depth streams of all symbols"""
+        for symbol in self.index:
+            self.streams.subscribe(self.stream(symbol), self.on_frame, raw=True)
+
+    async def close(self) -> None:
+        """Unsubscribes all streams"""
+        for symbol in self.index:
+            self.streams.unsubscribe(self.stream(symbol), self.on_frame)
+        if self._owns_streams:
+            await self.streams.close()
+
+    def on_frame(self, frame: str | bytes) -> None:
+        """
+        Writes an undecoded combined stream frame into the row of its symbol.
+
+        Parameters
+        ----------
+        frame: str | bytes
+            Partial depth frame, ``{"stream": <name>, "data": {"e": "depthUpdate", ...}}``
+
+        Raises
+        ------
+        ValueError
+            If the frame is malformed or a fixed-point price or quantity has more decimals than its scale (the row
+            is left unchanged)
+        """
+        written = self._parse(frame) if self._scales is None else self._decode(frame)
+        if written is None:
+            return
+        row, update_id, event_time = written
+
+        sequence = self.sequence
+        sequence[row] += 1
+        self.book[row] = self._scratch
+        self.update_id[row] = update_id
+        self.event_time[row] = event_time
+        sequence[row] += 1
+
+    def _parse(self, frame: str | bytes) -> tuple[int, int, int] | None:
+        # float levels, parsed into the scratch buffer without decoding the frame
+        if isinstance(frame, str):
+            frame = frame.encode()
+        row = self._rows.get(_match(SYMBOL, frame, b'"s"')[1])
+        if row is None:
+            return None
+        scratch, levels = self._scratch, self.levels
+        for side, key in ((BIDS, b'"b"'), (ASKS, b'"a"')):
+            match = _match(LEVELS, frame, key)
+            count = 0
+            if match[1] == b"[":
+                # non-empty list, its numbers as "price,quantity,price,..." parsed by NumPy
+                end = LEVELS_END.search(frame, match.end())
+                if end is None:
+                    raise ValueError("unterminated levels in frame")
+                raw = frame[match.end() : end.end()]
+                count = raw.count(b"[")
+                numbers = raw.translate(None, PUNCTUATION)
+                if numbers.count(b",") != 2 * count - 1:
+                    raise ValueError(f"malformed levels: {raw[:64]!r}")
+                values = np.fromstring(numbers, dtype=np.float64, count=2 * count, sep=",")
+                count = min(count, levels)
+                scratch[side, :count] = values[: 2 * count].reshape(count, 2)
+            scratch[side, count:] = 0
+        return row, int(_match(NUMBER, frame, b'"u"')[1]), int(_match(NUMBER, frame, b'"E"')[1])
+
+    def _decode(self, frame: str | bytes) -> tuple[int, int, int] | None:
+        # fixed-point levels, parsed exactly from the decoded frame
+        data = self.client.decoder(frame)["data"]
+        row = self.index.get(data["s"])
+        if row is None:
+            return None
+        scratch = self._scratch
+        price_scale, quantity_scale = self._scales[row]
+        for side, key in ((BIDS, "b"), (ASKS, "a")):
+            levels = data[key][: self.levels]
+            count = len(levels)
+            if count:
+                scratch[side, :count] = [(to_fixed(p, price_scale), to_fixed(q, quantity_scale)) for p, q in levels]
+            scratch[side, count:] = 0
+        return row, data["u"], data["E"]
+
+    def read(self, symbol: str, out: np.ndarray = None) -> np.ndarray:
+        """
+        Consistent copy of the levels of symbol (safe to call from other threads).
+
+        Parameters
+        ----------
+        symbol: str
+            Symbol
+        out: :class:`numpy.ndarray`, optional
+            Array of shape ``(2, levels, 2)`` to copy into
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Bids and asks of symbol, shape ``(2, levels, 2)``
+        """
+        row = self.index[symbol]
+        if out is None:
+            out = np.empty_like(self.book[row])
+        sequence = self.sequence
+        while True:
+            start = int(sequence[row])
+            if start & 1:
+                continue
+            out[...] = self.book[row]
+            if int(sequence[row]) == start:
+                return out
+
+
+def _match(pattern: re.Pattern, frame: bytes, key: bytes) -> re.Match:
+    # value after key of an undecoded frame
+    offset = frame.find(key)
+    match = None if offset < 0 else pattern.match(frame, offset + len(key))
+    if match is None:
+        raise ValueError(f"missing or malformed {key.decode()} in frame")
+    return match
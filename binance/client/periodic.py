@@ -0,0 +1,93 @@
+"""
+Periodic tasks
+==============
+
+Background tasks of client helpers (clock synchronisation, exchange information refreshes and connection
+warm-up) repeated every few seconds.
+"""
+import asyncio
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from binance.client.base import BaseClient
+
+log = logging.getLogger(__name__)
+
+
+class Periodic:
+    """
+    Base of client helpers running a step now and every :attr:`period` seconds in the background.
+
+    Steps of synchronous clients run in a daemon thread, steps of asynchronous clients in a task of the running
+    event loop. Failing steps are logged and retried after the next period. Subclasses implement :meth:`_step`
+    (returning a coroutine when the client is asynchronous) and :attr:`period`.
+    """
+
+    __slots__ = ["_task", "_stopped"]
+
+    #: name of task in log messages
+    TASK = "periodic task"
+
+    client: "BaseClient"
+
+    def __init__(self):
+        self._task = None
+        self._stopped = None
+
+    @property
+    def period(self) -> float:
+        """Seconds between steps"""
+        raise NotImplementedError
+
+    def _step(self):
+        raise NotImplementedError
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is started"""
+        return self._task is not None
+
+    def start(self) -> None:
+        """
+        Starts running the step now and every `period` seconds.
+
+        For asynchronous clients this must be called from within the running event loop, clients defer it until
+        one is running.
+        """
+        if self._task is not None:
+            return
+        if self.client.ASYNCHRONOUS:
+            self._task = asyncio.get_running_loop().create_task(self._async_run())
+        else:
+            self._stopped = threading.Event()
+            self._task = threading.Thread(target=self._run, name=f"binance-{type(self).__name__.lower()}", daemon=True)
+            self._task.start()
+
+    def stop(self) -> None:
+        """Stops the background task"""
+        if self._task is None:
+            return
+        if self.client.ASYNCHRONOUS:
+            self._task.cancel()
+        else:
+            self._stopped.set()
+        self._task = None
+
+    def _run(self) -> None:
+        stopped = self._stopped
+        while not stopped.is_set():
+            try:
+                self._step()
+            except Exception as e:
+                log.warning("%s failed: %s", self.TASK, e)
+            stopped.wait(self.period)
+
+    async def _async_run(self) -> None:
+        while True:
+            try:
+                await self._step()
+            except Exception as e:
+                log.warning("%s failed: %s", self.TASK, e)
+            await asyncio.sleep(self.period)
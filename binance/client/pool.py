@@ -0,0 +1,107 @@
+"""
+Connection pooling
+==================
+
+Connection pool configuration of :class:`binance.client.Client` (``requests``) and
+:class:`binance.client.AIOClient` (``aiohttp``).
+"""
+import socket
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class _SocketOptionsAdapter(HTTPAdapter):
+    """HTTP adapter applying socket options to every new connection"""
+
+    def __init__(self, socket_options: list[tuple[int, int, int]], **kwargs):
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class PoolConfig:
+    """
+    Connection pool configuration.
+
+    Parameters
+    ----------
+    limit: int
+        Maximum number of connections (``aiohttp`` only, ``requests`` pools are per host)
+    limit_per_host: int
+        Maximum number of connections per host
+    keepalive_timeout: float
+        Seconds idle connections are kept open. ``aiohttp`` closes pooled connections idle for longer, ``requests``
+        sends TCP keep-alive probes after this idle time so connections are not dropped by intermediaries.
+    dns_cache_ttl: int
+        Seconds resolved host names are cached (``aiohttp`` only)
+    tcp_nodelay: bool
+        Disable Nagle's algorithm (``aiohttp`` always disables it)
+    """
+
+    __slots__ = ["limit", "limit_per_host", "keepalive_timeout", "dns_cache_ttl", "tcp_nodelay"]
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        tcp_nodelay: bool = True,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.tcp_nodelay = tcp_nodelay
+
+    def __repr__(self) -> str:
+        return (
+            f"PoolConfig(limit={self.limit}, limit_per_host={self.limit_per_host}, "
+            f"keepalive_timeout={self.keepalive_timeout}, dns_cache_ttl={self.dns_cache_ttl}, "
+            f"tcp_nodelay={self.tcp_nodelay})"
+        )
+
+    def socket_options(self) -> list[tuple[int, int, int]]:
+        """Socket options of new connections"""
+        options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        if self.tcp_nodelay:
+            options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, max(int(self.keepalive_timeout), 1)))
+        return options
+
+    def requests_session(self) -> requests.Session:
+        """
+        Creates ``requests`` session.
+
+        Returns
+        -------
+        :class:`requests.Session`
+            Session with sized connection pools
+        """
+        session = requests.Session()
+        adapter = _SocketOptionsAdapter(self.socket_options(), pool_maxsize=self.limit_per_host)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def aiohttp_connector(self) -> aiohttp.TCPConnector:
+        """
+        Creates ``aiohttp`` connector (must be called within the running event loop).
+
+        Returns
+        -------
+        :class:`aiohttp.TCPConnector`
+            Connector with sized connection pool
+        """
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
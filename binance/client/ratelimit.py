@@ -0,0 +1,253 @@
+"""
+Rate limiting
+=============
+
+Header driven rate limit governors shared by all calls of a client (or several clients).
+
+https://binance-docs.github.io/apidocs/futures/en/#limits
+"""
+import threading
+import time
+from collections import deque
+
+from binance.enums.binance import RateLimiter
+
+#: seconds per rate limit interval letter (as used in X-MBX-* headers)
+INTERVALS = {"S": 1, "M": 60, "H": 3600, "D": 86400}
+
+
+class Window:
+    """
+    Fixed rate limit window.
+
+    Binance counts usage in fixed windows aligned to the interval (e.g. every whole minute).
+
+    Parameters
+    ----------
+    limit: int
+        Maximum usage within window
+    interval: float
+        Length of window in seconds
+    """
+
+    __slots__ = ["limit", "interval", "used", "start"]
+
+    def __init__(self, limit: int, interval: float):
+        self.limit = limit
+        self.interval = interval
+        self.used = 0
+        self.start = 0.0
+
+    def __repr__(self) -> str:
+        return f"Window(limit={self.limit}, interval={self.interval}, used={self.used})"
+
+    def _roll(self, now: float) -> None:
+        start = now - now % self.interval
+        if start != self.start:
+            self.start = start
+            self.used = 0
+
+    def remaining(self, now: float) -> int:
+        """Remaining usage of window at time `now`"""
+        self._roll(now)
+        return max(self.limit - self.used, 0)
+
+    def wait(self, amount: int, now: float) -> float:
+        """Seconds to wait before `amount` fits into window (0.0 if it fits now)"""
+        self._roll(now)
+        # an empty window always admits a request (even one exceeding the limit)
+        if self.used and self.used + amount > self.limit:
+            return self.start + self.interval - now
+        return 0.0
+
+    def reconcile(self, used: int, now: float) -> None:
+        """Reconciles local usage with usage reported by the exchange"""
+        self._roll(now)
+        self.used = max(self.used, used)
+
+
+class SlidingWindow:
+    """
+    Sliding rate limit window.
+
+    Admits at most `limit` uses within any `interval` seconds, unlike :class:`Window` which admits `limit` uses
+    at the end of one window and `limit` more at the start of the next.
+
+    Parameters
+    ----------
+    limit: int
+        Maximum usage within any interval
+    interval: float
+        Length of interval in seconds
+
+    Examples
+    --------
+    >>> window = SlidingWindow(2, 1.0)
+    >>> window.add(0.5)
+    >>> window.add(0.75)
+    >>> window.wait(1, 1.0)
+    0.5
+    """
+
+    __slots__ = ["limit", "interval", "times"]
+
+    def __init__(self, limit: int, interval: float):
+        self.limit = limit
+        self.interval = interval
+        #: times of uses within the last interval
+        self.times: deque[float] = deque()
+
+    def __repr__(self) -> str:
+        return f"SlidingWindow(limit={self.limit}, interval={self.interval}, used={len(self.times)})"
+
+    def _expire(self, now: float) -> None:
+        times = self.times
+        while times and times[0] + self.interval <= now:
+            times.popleft()
+
+    def wait(self, amount: int, now: float) -> float:
+        """Seconds to wait before `amount` uses fit into the interval ending at `now` (0.0 if they fit now)"""
+        self._expire(now)
+        times = self.times
+        excess = len(times) + amount - self.limit
+        # an empty window always admits a request (even one exceeding the limit)
+        if excess <= 0 or not times:
+            return 0.0
+        return times[min(excess, len(times)) - 1] + self.interval - now
+
+    def add(self, now: float, amount: int = 1) -> None:
+        """Records `amount` uses at time `now`"""
+        self.times.extend([now] * amount)
+
+
+class Limiter:
+    """
+    Header driven rate limiter.
+
+    Usage is reserved locally before a request is sent and reconciled with the ``X-MBX-*`` headers of every
+    response. The limiter never sleeps itself; :meth:`acquire` returns the delay the caller must wait (blocking
+    for :class:`binance.client.Client` and awaiting for :class:`binance.client.AIOClient`).
+
+    Parameters
+    ----------
+    header: :class:`binance.enums.binance.RateLimiter`
+        Header prefix of rate limit
+    limits: dict[str, int]
+        Limit per interval, e.g. ``{"1M": 2400}``
+    """
+
+    __slots__ = ["header", "windows", "blocked_until", "_lock"]
+
+    def __init__(self, header: RateLimiter, limits: dict[str, int]):
+        self.header = RateLimiter(header)
+        self.windows = {key.upper(): Window(limit, self.parse_interval(key)) for key, limit in limits.items()}
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"Limiter(header={self.header.value}, windows={self.windows})"
+
+    @classmethod
+    def request_weight(cls, limit: int = 2400) -> "Limiter":
+        """Creates request weight limiter (``X-MBX-USED-WEIGHT-1M``)"""
+        return cls(RateLimiter.REQUEST_WEIGHT, {"1M": limit})
+
+    @classmethod
+    def orders(cls, per_10s: int = 300, per_minute: int = 1200) -> "Limiter":
+        """Creates order count limiter (``X-MBX-ORDER-COUNT-10S`` and ``X-MBX-ORDER-COUNT-1M``)"""
+        return cls(RateLimiter.ORDERS, {"10S": per_10s, "1M": per_minute})
+
+    @staticmethod
+    def parse_interval(interval: str) -> float:
+        """
+        Parses rate limit interval (e.g. "10S" or "1M") into seconds
+
+        Parameters
+        ----------
+        interval: str
+            Interval as used in rate limit headers
+
+        Returns
+        -------
+        float
+            Interval in seconds
+        """
+        interval = interval.upper()
+        return int(interval[:-1]) * INTERVALS[interval[-1]]
+
+    @property
+    def remaining(self) -> dict[str, int]:
+        """Remaining budget per interval"""
+        now = time.time()
+        with self._lock:
+            return {key: window.remaining(now) for key, window in self.windows.items()}
+
+    def acquire(self, amount: int) -> float:
+        """
+        Reserves `amount` in every window.
+
+        Parameters
+        ----------
+        amount: int
+            Usage of request (e.g. request weight)
+
+        Returns
+        -------
+        float
+            0.0 if reserved, otherwise seconds to wait before trying again
+        """
+        now = time.time()
+        with self._lock:
+            if self.blocked_until > now:
+                return self.blocked_until - now
+            delay = max((window.wait(amount, now) for window in self.windows.values()), default=0.0)
+            if delay > 0.0:
+                return delay
+            for window in self.windows.values():
+                window.used += amount
+            return 0.0
+
+    def release(self, amount: int) -> None:
+        """
+        Releases a reservation which was not used (e.g. because another limiter refused the request).
+
+        Parameters
+        ----------
+        amount: int
+            Usage previously acquired
+        """
+        with self._lock:
+            for window in self.windows.values():
+                window.used = max(window.used - amount, 0)
+
+    def update(self, limits: dict[str, str]) -> None:
+        """
+        Reconciles usage with rate limit headers of a response.
+
+        Parameters
+        ----------
+        limits: dict[str, str]
+            Rate limit headers, see :meth:`binance.client.response.Response.get_limits`
+        """
+        now = time.time()
+        prefix = self.header.value
+        with self._lock:
+            for key, val in limits.items():
+                key = key.upper()
+                if not key.startswith(prefix):
+                    continue
+                window = self.windows.get(key[len(prefix) :])
+                if window is not None:
+                    window.reconcile(int(val), now)
+
+    def block(self, seconds: float) -> None:
+        """
+        Blocks all requests for a period (e.g. after a HTTP 429 or 418 response with a Retry-After header).
+
+        Parameters
+        ----------
+        seconds: float
+            Seconds to block
+        """
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.time() + seconds)
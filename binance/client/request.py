@@ -0,0 +1,54 @@
+"""
+Encoded binance API request
+"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from binance.enums import HTTPMethod
+
+
+class Request:
+    """
+    Encoded binance API request.
+
+    The canonical query string is encoded once; the signature (if any) is appended to that same string and
+    the transport sends it verbatim, so the signed bytes are exactly the bytes sent.
+
+    Parameters
+    ----------
+    http_method: :class:`binance.enums.HTTPMethod`
+        HTTP method to use
+    url: str
+        Url of endpoint (without query string)
+    query: str
+        Url encoded query string
+    headers: dict[str, str]
+        Headers to include in API call
+    """
+
+    __slots__ = ["http_method", "url", "query", "headers"]
+
+    def __init__(self, http_method: "HTTPMethod", url: str, query: str = "", headers: dict[str, str] = None):
+        self.http_method = http_method
+        self.url = url
+        self.query = query
+        self.headers = headers
+
+    def __repr__(self) -> str:
+        return f"Request(http_method={self.http_method}, url={self.full_url})"
+
+    @property
+    def full_url(self) -> str:
+        """Url of endpoint including encoded query string"""
+        return f"{self.url}?{self.query}" if self.query else self.url
+
+    def sign(self, signature: str) -> None:
+        """
+        Appends signature to the encoded query string.
+
+        Parameters
+        ----------
+        signature: str
+            Signature of the current query string
+        """
+        self.query = f"{self.query}&signature={signature}" if self.query else f"signature={signature}"
@@ -1,7 +1,9 @@
+import json
 import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import numpy as np
     from aiohttp import ClientResponse as AIOHTTPResponse
     from requests import Response as RequestsResponse
 
@@ -36,30 +38,67 @@ class Response:
     """
     Binance client response
 
+    The body is decoded lazily the first time :attr:`data` is accessed, so calls whose result is never read
+    (e.g. order ACKs) do not pay for JSON decoding. The raw response object is only retained on request.
+
     Parameters
     ----------
-    data: dict
-        Response data (JSON converted to a dcitionary)
+    body: bytes
+        Response body (JSON encoded)
     status: int
         Response status code
     limits: dict
         API limits from response
-    raw: object
-        Raw response object
+    raw: object, optional
+        Raw response object (only kept when requested)
+    decoder: Callable[[bytes], object]
+        JSON decoder of response body, see :func:`binance.client.decoder.get_decoder`
     """
 
+    __slots__ = ["body", "status", "limits", "raw", "_decoder", "_data"]
+
     REQUEST_WEIGHT = re.compile(r"X-MBX-USED-WEIGHT-.*")
     ORDERS = re.compile(r"X-MBX-ORDER-COUNT-.*")
 
-    def __init__(self, data: dict, status: int, limits: dict, raw: object):
-        self.data = data
+    #: sentinel of not yet decoded data
+    _UNDECODED = object()
+
+    def __init__(self, body: bytes, status: int, limits: dict, raw: object = None, decoder=json.loads):
+        self.body = body
         self.status = status
         self.limits = limits
         self.raw = raw
+        self._decoder = decoder
+        self._data = self._UNDECODED
 
     def __repr__(self) -> str:
         return f"Response(status={self.status}, data={self.data})"
 
+    @property
+    def data(self) -> dict | list:
+        """Response data (JSON decoded on first access)"""
+        if self._data is self._UNDECODED:
+            self._data = self._decoder(self.body)
+        return self._data
+
+    def to_klines(self, price_scale: int = None) -> "np.ndarray":
+        """
+        Decodes a kline response into a columnar NumPy structured array (requires ``numpy``).
+
+        Parameters
+        ----------
+        price_scale: int, optional
+            Number of decimals of fixed-point int64 prices (prices are float64 if not given)
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Structured array with one record per kline, see :func:`binance.client.columnar.decode_klines`
+        """
+        from binance.client.columnar import decode_klines
+
+        return decode_klines(self.body, price_scale)
+
     @staticmethod
     def get_limits(headers) -> dict:
         """
@@ -77,12 +116,16 @@ class Response:
         """
         limits = dict()
         for key, val in headers.items():
+            # binance sends lower case header names
+            key = key.upper()
             if key.startswith("X-MBX-USED-WEIGHT-") or key.startswith("X-MBX-ORDER-COUNT-"):
                 limits[key] = val
         return limits
 
     @classmethod
-    async def from_aiohttp_response(cls, response: "AIOHTTPResponse") -> "Response":
+    async def from_aiohttp_response(
+        cls, response: "AIOHTTPResponse", decoder=json.loads, keep_raw: bool = False
+    ) -> "Response":
         """
         Creates binance response from aiohttp response object
 
@@ -90,23 +133,28 @@ class Response:
         ----------
         response: :class:`aiohttp.ClientResponse`
             aiohttp reponse object
+        decoder: Callable[[bytes], object]
+            JSON decoder of response body, see :func:`binance.client.decoder.get_decoder`
+        keep_raw: bool
+            Boolean indicating whether to keep the raw response object
 
         Returns
         -------
         :class:`binance.client.response.Response`
             Binance client response
         """
+        body = await response.read()
         if not response.ok:
-            raise ResponseException(
-                status=response.status, reason=response.reason, dict=await response.json(), raw=response
-            )
+            raise ResponseException(status=response.status, reason=response.reason, data=decoder(body), raw=response)
 
-        data = await response.json()
         limits = cls.get_limits(response.headers)
-        return cls(data=data, status=response.status, limits=limits, raw=response)
+        raw = response if keep_raw else None
+        return cls(body=body, status=response.status, limits=limits, raw=raw, decoder=decoder)
 
     @classmethod
-    def from_requests_response(cls, response: "RequestsResponse") -> "Response":
+    def from_requests_response(
+        cls, response: "RequestsResponse", decoder=json.loads, keep_raw: bool = False
+    ) -> "Response":
         """
         Creates binance response from requests response object
 
@@ -114,6 +162,10 @@ class Response:
         ----------
         response: :class:`requests.Response`
             requests reponse object
+        decoder: Callable[[bytes], object]
+            JSON decoder of response body, see :func:`binance.client.decoder.get_decoder`
+        keep_raw: bool
+            Boolean indicating whether to keep the raw response object
 
         Returns
         -------
@@ -122,9 +174,9 @@ class Response:
         """
         if not response.ok:
             raise ResponseException(
-                status=response.status_code, reason=response.reason, data=response.json(), raw=response
+                status=response.status_code, reason=response.reason, data=decoder(response.content), raw=response
             )
 
-        data = response.json()
         limits = cls.get_limits(response.headers)
-        return cls(data=data, status=response.status_code, limits=limits, raw=response)
+        raw = response if keep_raw else None
+        return cls(body=response.content, status=response.status_code, limits=limits, raw=raw, decoder=decoder)
@@ -0,0 +1,140 @@
+"""
+Request signers
+===============
+
+Signers are created once per client and sign the encoded query string of every ``SIGNED`` request.
+
+https://binance-docs.github.io/apidocs/futures/en/#signed-trade-and-user_data-endpoint-security
+"""
+import abc
+import base64
+import hashlib
+import hmac
+from urllib.parse import quote
+
+
+class Signer(abc.ABC):
+    """
+    Signer abstract base class
+    """
+
+    __slots__ = []
+
+    @abc.abstractmethod
+    def sign(self, payload: bytes) -> str:
+        """
+        Signs payload
+
+        Parameters
+        ----------
+        payload: bytes
+            Encoded query string
+
+        Returns
+        -------
+        str
+            Signature ready to be appended to the query string
+        """
+
+
+class HMACSigner(Signer):
+    """
+    HMAC-SHA256 signer.
+
+    The HMAC state is keyed once and cloned for every signature.
+
+    Parameters
+    ----------
+    secret: str | bytes
+        API secret key
+    """
+
+    __slots__ = ["_hmac"]
+
+    def __init__(self, secret: str | bytes):
+        if isinstance(secret, str):
+            secret = secret.encode()
+        self._hmac = hmac.new(secret, digestmod=hashlib.sha256)
+
+    def __repr__(self) -> str:
+        return "HMACSigner()"
+
+    def sign(self, payload: bytes) -> str:
+        h = self._hmac.copy()
+        h.update(payload)
+        return h.hexdigest()
+
+
+class _PrivateKeySigner(Signer):
+    """
+    Base class of signers using an asymmetric private key (requires the ``cryptography`` package).
+
+    Parameters
+    ----------
+    private_key: str | bytes
+        PEM encoded private key
+    password: bytes, optional
+        Password of private key
+    """
+
+    __slots__ = ["_key"]
+
+    def __init__(self, private_key: str | bytes, password: bytes = None):
+        try:
+            from cryptography.hazmat.primitives.serialization import load_pem_private_key
+        except ImportError as e:
+            raise ImportError(f"{type(self).__name__} requires the 'cryptography' package") from e
+
+        if isinstance(private_key, str):
+            private_key = private_key.encode()
+        self._key = load_pem_private_key(private_key, password=password)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    @abc.abstractmethod
+    def _sign(self, payload: bytes) -> bytes:
+        """Signs payload with private key"""
+
+    def sign(self, payload: bytes) -> str:
+        # base64 signatures must be url encoded
+        return quote(base64.b64encode(self._sign(payload)), safe="")
+
+
+class Ed25519Signer(_PrivateKeySigner):
+    """
+    Ed25519 signer (requires the ``cryptography`` package).
+
+    Parameters
+    ----------
+    private_key: str | bytes
+        PEM encoded Ed25519 private key
+    password: bytes, optional
+        Password of private key
+    """
+
+    __slots__ = []
+
+    def _sign(self, payload: bytes) -> bytes:
+        return self._key.sign(payload)
+
+
+class RSASigner(_PrivateKeySigner):
+    """
+    RSA (PKCS#1 v1.5, SHA256) signer (requires the ``cryptography`` package).
+
+    Parameters
+    ----------
+    private_key: str | bytes
+        PEM encoded RSA private key
+    password: bytes, optional
+        Password of private key
+    """
+
+    __slots__ = []
+
+    def _sign(self, payload: bytes) -> bytes:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        return self._key.sign(payload, padding.PKCS1v15(), hashes.SHA256())
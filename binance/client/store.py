@@ -0,0 +1,278 @@
+"""
+Kline store
+===========
+
+Persistent on-disk kline store for :class:`binance.client.AIOClient` (requires the ``numpy`` package).
+
+Every (endpoint, symbol, interval) series is kept in a binary file of kline records (see
+:func:`binance.client.columnar.kline_dtype`) sorted by open time, next to a JSON sidecar listing the time ranges the
+file holds. A request fetches only the missing ranges (see :class:`binance.client.backfill.Backfill`) and is served
+from a memory map of the file without copying. Records (rather than a file per column) keep every append a single
+write and are served as the same record arrays as :meth:`binance.client.response.Response.to_klines`.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from binance.client.backfill import SERIES, open_time
+from binance.client.columnar import from_rows, kline_dtype
+from binance.enums.binance import KlineInterval
+
+if TYPE_CHECKING:
+    from binance.client.aioclient import AIOClient
+    from binance.client.ratelimit import Limiter
+
+log = logging.getLogger(__name__)
+
+#: kline endpoints which can be stored
+ENDPOINTS = [name for name, series in SERIES.items() if series.key is open_time]
+
+
+def missing(held: list[tuple[int, int]], start: int, end: int) -> list[tuple[int, int]]:
+    """
+    Gets the parts of a time range not covered by held ranges.
+
+    Parameters
+    ----------
+    held: list[tuple[int, int]]
+        Sorted, non-overlapping (inclusive) ranges
+    start: int
+        Start of time range
+    end: int
+        End of time range (inclusive)
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Sorted (inclusive) gaps
+    """
+    gaps = []
+    for low, high in held:
+        if high < start:
+            continue
+        if low > end:
+            break
+        if low > start:
+            gaps.append((start, low - 1))
+        start = max(start, high + 1)
+    if start <= end:
+        gaps.append((start, end))
+    return gaps
+
+
+def merge(held: list[tuple[int, int]], ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Merges ranges into held ranges.
+
+    Parameters
+    ----------
+    held: list[tuple[int, int]]
+        Held (inclusive) ranges
+    ranges: list[tuple[int, int]]
+        New (inclusive) ranges
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Sorted, non-overlapping (inclusive) ranges
+    """
+    merged = []
+    for low, high in sorted([*held, *ranges]):
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+        else:
+            merged.append((low, high))
+    return merged
+
+
+class KlineStore:
+    """
+    Persistent on-disk kline store.
+
+    Only closed klines are stored. Files are append-only while new klines arrive in order (the common case of
+    refreshing up to now); filling a gap before already held klines rewrites the file once.
+
+    Parameters
+    ----------
+    client: :class:`binance.client.AIOClient`
+        Asynchronous binance client used to fetch missing klines
+    root: str | os.PathLike
+        Directory of the store
+    concurrency: int
+        Maximum number of concurrent calls when fetching gaps
+    budget: :class:`binance.client.ratelimit.Limiter`, optional
+        Request weight budget when fetching gaps
+    """
+
+    __slots__ = ["client", "root", "concurrency", "budget"]
+
+    #: parameters identifying a series besides its endpoint and interval
+    KEYS = ("symbol", "pair", "contractType")
+
+    #: record type of stored klines
+    DTYPE = kline_dtype()
+
+    def __init__(self, client: "AIOClient", root: str | os.PathLike, concurrency: int = 4, budget: "Limiter" = None):
+        self.client = client
+        self.root = Path(root)
+        self.concurrency = concurrency
+        self.budget = budget
+
+    def __repr__(self) -> str:
+        return f"KlineStore(root={self.root})"
+
+    def path(self, endpoint: str, **params) -> Path:
+        """
+        Gets path of a series (without suffix).
+
+        Parameters
+        ----------
+        endpoint: str
+            Name of kline endpoint
+        **params
+            Endpoint parameters, e.g. ``symbol`` and ``interval``
+
+        Returns
+        -------
+        :class:`pathlib.Path`
+            Path of series, ``.bin`` holds the klines and ``.json`` the held ranges
+        """
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"{endpoint} cannot be stored, expected one of {ENDPOINTS}")
+        series = "_".join(str(params[key]) for key in self.KEYS if key in params)
+        # interval names, as "1m" and "1M" collide on case insensitive file systems
+        interval = KlineInterval(params["interval"]).name.lower()
+        return self.root / endpoint / series / interval
+
+    def held(self, endpoint: str, **params) -> list[tuple[int, int]]:
+        """
+        Gets time ranges held by a series.
+
+        Parameters
+        ----------
+        endpoint: str
+            Name of kline endpoint
+        **params
+            Endpoint parameters, e.g. ``symbol`` and ``interval``
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Sorted (inclusive) ranges of open times in milliseconds
+        """
+        return self._load_ranges(self.path(endpoint, **params))
+
+    def read(self, endpoint: str, start: int, end: int, **params) -> np.ndarray:
+        """
+        Reads stored klines (without fetching missing ones).
+
+        Parameters
+        ----------
+        endpoint: str
+            Name of kline endpoint
+        start: int
+            Start time in milliseconds
+        end: int
+            End time in milliseconds (inclusive)
+        **params
+            Endpoint parameters, e.g. ``symbol`` and ``interval``
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Read-only memory mapped klines opened within the time range
+        """
+        klines = self._map(self.path(endpoint, **params))
+        times = klines["open_time"]
+        return klines[np.searchsorted(times, start) : np.searchsorted(times, end, side="right")]
+
+    async def get(self, endpoint: str, start: int, end: int = None, **params) -> np.ndarray:
+        """
+        Gets klines, fetching only time ranges not held yet.
+
+        Parameters
+        ----------
+        endpoint: str
+            Name of kline endpoint
+        start: int
+            Start time in milliseconds
+        end: int, optional
+            End time in milliseconds (inclusive), defaults to now
+        **params
+            Endpoint parameters, e.g. ``symbol`` and ``interval``
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Read-only memory mapped (closed) klines opened within the time range
+        """
+        path = self.path(endpoint, **params)
+        now = self.client.clock.timestamp()
+        if end is None:
+            end = now
+
+        held = self._load_ranges(path)
+        fetched, ranges = [], []
+        for low, high in missing(held, start, min(end, now)):
+            log.debug("fetching %s %s from %s to %s", endpoint, params, low, high)
+            rows = []
+            async for page in self.client.backfill(
+                endpoint, low, high, concurrency=self.concurrency, budget=self.budget, **params
+            ):
+                rows.extend(page)
+            klines = from_rows(rows)
+            # klines still open are neither stored nor marked as held
+            klines = klines[klines["close_time"] < now]
+            if high >= now:
+                high = int(klines["close_time"][-1]) if len(klines) else low - 1
+            if high >= low:
+                fetched.append(klines)
+                ranges.append((low, high))
+
+        if ranges:
+            self._write(path, np.concatenate(fetched))
+            self._save_ranges(path, merge(held, ranges))
+        return self.read(endpoint, start, end, **params)
+
+    def _map(self, path: Path) -> np.ndarray:
+        path = path.with_suffix(".bin")
+        if not path.exists() or not path.stat().st_size:
+            return np.empty(0, dtype=self.DTYPE)
+        return np.memmap(path, dtype=self.DTYPE, mode="r")
+
+    def _write(self, path: Path, klines: np.ndarray) -> None:
+        if not len(klines):
+            return
+        stored = self._map(path)
+        path = path.with_suffix(".bin")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not len(stored) or klines["open_time"][0] > stored["open_time"][-1]:
+            with open(path, "ab") as f:
+                f.write(klines.tobytes())
+            return
+
+        # out of order: merge, keep one kline per open time and rewrite
+        merged = np.concatenate([stored, klines])
+        del stored
+        _, index = np.unique(merged["open_time"], return_index=True)
+        tmp = path.with_suffix(".tmp")
+        merged[index].tofile(tmp)
+        os.replace(tmp, path)
+
+    def _load_ranges(self, path: Path) -> list[tuple[int, int]]:
+        path = path.with_suffix(".json")
+        if not path.exists():
+            return []
+        with open(path) as f:
+            return [tuple(r) for r in json.load(f)["ranges"]]
+
+    def _save_ranges(self, path: Path, ranges: list[tuple[int, int]]) -> None:
+        path = path.with_suffix(".json")
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"ranges": ranges}, f)
+        os.replace(tmp, path)
@@ -1,3 +1,4 @@
+from .market_data_stream import MarketDataStream, MarketDataStreams
 from .user_data_stream import UserDataStream
 
-__all__ = ["UserDataStream"]
+__all__ = ["MarketDataStream", "MarketDataStreams", "UserDataStream"]
@@ -31,13 +31,21 @@ class BinanceStream(asyncio.Protocol):
         self._connector = None
         self.state = PENDING
 
+    def connection_made(self, transport):
+        log.debug("Connection made")
+        self.state = LISTENING
+        self._retries = 0
+        self._delay = self.initial_delay
+
     def connection_lost(self, exc):
         log.debug(f"Connection lost with exception: {exc}")
+        self.state = DISCONNECTED
         if self._continue_trying:
             self._retry()
 
     def connection_failed(self, exc):
         log.debug(f"Connection failed with exception: {exc}")
+        self.state = DISCONNECTED
         if self._continue_trying:
             self._retry()
 
@@ -56,6 +64,7 @@ class BinanceStream(asyncio.Protocol):
 
     def connect(self):
         if self._connector is None:
+            self.state = CONNECTING
             self._connector = self.loop.create_task(self._connect())
 
     async def _connect(self):
@@ -80,16 +89,34 @@ class BinanceStream(asyncio.Protocol):
 
 
 class BinanceStreams:
+    """
+    Group of stream connections.
+
+    Parameters
+    ----------
+    loop: :class:`asyncio.AbstractEventLoop`, optional
+        Event loop of connections
+    """
+
+    #: stream class of connections
     factory = None
 
     def __init__(self, loop=None):
         if loop is None:
             loop = asyncio.get_event_loop()
         self.loop = loop
+        self.streams = []
 
-    def connect(self):
-        pass
+    def connect(self, *args, **kwargs):
+        """Creates and connects a new stream of `factory`"""
+        stream = self.factory(*args, loop=self.loop, **kwargs)
+        self.streams.append(stream)
+        stream.connect()
+        return stream
 
-    async def connect(self, url, callbacks):
-        transport, protocol = self.loop.create_connection(self.factory, url, 8888)
-        self.task = self.loop.create_task(coro)
+    def disconnect(self):
+        """Disconnects all streams (without reconnecting)"""
+        for stream in self.streams:
+            stream.stop_trying()
+            stream.disconnect()
+        self.streams.clear()
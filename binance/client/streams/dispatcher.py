@@ -0,0 +1,217 @@
+"""
+Dispatcher
+==========
+
+Routing of stream events to handlers indexed by stream, event type (``e``) and symbol.
+
+Handlers are registered under a route ``(stream, event type, symbol)`` where ``None`` matches anything. The
+handlers of a concrete ``(stream, event type, symbol)`` are resolved once from the (at most eight) routes matching
+it and cached, so delivering an event costs a dict lookup no matter how many handlers are registered.
+"""
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+
+log = logging.getLogger(__name__)
+
+Handler = Callable[[object], object]
+
+#: stream, event type and symbol of a route (``None`` matches anything)
+Route = tuple[str | None, str | None, str | None]
+
+
+def event_key(event: object) -> tuple[str | None, str | None]:
+    """
+    Event type and symbol of a market data event (or of an unknown decoded payload).
+
+    Examples
+    --------
+    >>> event_key({"e": "forceOrder", "E": 1568014460893, "o": {"s": "BTCUSDT"}})
+    ('forceOrder', None)
+    """
+    if isinstance(event, dict):
+        return event.get("e"), event.get("s")
+    return event.type, event.symbol
+
+
+class Dispatcher:
+    """
+    Handlers indexed by route.
+
+    Non-batch handlers are called once per matching event. Batch handlers are called once per dispatched frame
+    with the list of its matching events (in order), e.g. with the entries of an all market stream
+    (``!markPrice@arr``) for their symbols. A handler is called at most once per event, even if several of its
+    routes match. Handlers returning a coroutine are scheduled as tasks and failing handlers are logged without
+    affecting other handlers.
+
+    Parameters
+    ----------
+    loop: :class:`asyncio.AbstractEventLoop`, optional
+        Event loop of coroutine handlers, defaults to the running event loop
+
+    Examples
+    --------
+    >>> dispatcher = Dispatcher()
+    >>> dispatcher.add(print, event="aggTrade", symbol="BTCUSDT")
+    >>> dispatcher.dispatch("btcusdt@aggTrade", [{"e": "aggTrade", "s": "BTCUSDT"}, {"e": "aggTrade", "s": "ETHUSDT"}])
+    {'e': 'aggTrade', 's': 'BTCUSDT'}
+    """
+
+    __slots__ = ["loop", "routes", "streams", "_cache"]
+
+    def __init__(self, loop: asyncio.AbstractEventLoop = None):
+        self.loop = loop
+        #: handlers and whether they are batch handlers by route
+        self.routes: dict[Route, list[tuple[Handler, bool]]] = {}
+        #: number of handlers by stream (``None`` for handlers of any stream)
+        self.streams: dict[str | None, int] = {}
+        # non-batch and batch handlers by concrete route
+        self._cache: dict[Route, tuple[tuple[Handler, ...], tuple[Handler, ...]]] = {}
+
+    def __repr__(self) -> str:
+        return f"Dispatcher(routes={len(self.routes)}, handlers={len(self)})"
+
+    def __len__(self) -> int:
+        return sum(self.streams.values())
+
+    def add(
+        self, handler: Handler, stream: str = None, event: str = None, symbol: str = None, batch: bool = False
+    ) -> None:
+        """
+        Adds handler of route.
+
+        Parameters
+        ----------
+        handler: Handler
+            Callable called with every matching event (or a list of them)
+        stream: str, optional
+            Stream name, defaults to any stream
+        event: str, optional
+            Event type, e.g. ``aggTrade`` or ``ORDER_TRADE_UPDATE``, defaults to any event type
+        symbol: str, optional
+            Symbol, defaults to any symbol
+        batch: bool
+            Call handler once per frame with the list of its matching events
+        """
+        self.routes.setdefault((stream, event, symbol), []).append((handler, batch))
+        self.streams[stream] = self.streams.get(stream, 0) + 1
+        self._cache.clear()
+
+    def remove(self, handler: Handler = None, stream: str = None, event: str = None, symbol: str = None) -> int:
+        """
+        Removes handler (or all handlers) of route.
+
+        Parameters
+        ----------
+        handler: Handler, optional
+            Handler to remove, defaults to all handlers of route
+        stream: str, optional
+            Stream name of route
+        event: str, optional
+            Event type of route
+        symbol: str, optional
+            Symbol of route
+
+        Returns
+        -------
+        int
+            Number of removed handlers
+        """
+        route = (stream, event, symbol)
+        entries = self.routes.get(route, [])
+        kept = [entry for entry in entries if handler is not None and entry[0] != handler]
+        return self._replace(route, kept, len(entries) - len(kept))
+
+    def discard(self, stream: str | None, handler: Handler = None) -> int:
+        """
+        Removes handler (or all handlers) from all routes of stream.
+
+        Returns
+        -------
+        int
+            Number of removed handlers
+        """
+        removed = 0
+        for route in [route for route in self.routes if route[0] == stream]:
+            entries = self.routes[route]
+            kept = [entry for entry in entries if handler is not None and entry[0] != handler]
+            removed += self._replace(route, kept, len(entries) - len(kept))
+        return removed
+
+    def _replace(self, route: Route, entries: list[tuple[Handler, bool]], removed: int) -> int:
+        if not removed:
+            return 0
+        if entries:
+            self.routes[route] = entries
+        else:
+            del self.routes[route]
+        count = self.streams[route[0]] - removed
+        if count:
+            self.streams[route[0]] = count
+        else:
+            del self.streams[route[0]]
+        self._cache.clear()
+        return removed
+
+    def match(self, stream: str | None, event: str | None, symbol: str | None) -> tuple[tuple, tuple]:
+        """
+        Handlers of an event.
+
+        Returns
+        -------
+        tuple[tuple[Handler, ...], tuple[Handler, ...]]
+            Non-batch and batch handlers (each at most once)
+        """
+        key = (stream, event, symbol)
+        matched = self._cache.get(key)
+        if matched is None:
+            handlers, batches = {}, {}
+            routes = self.routes
+            for s in dict.fromkeys((stream, None)):
+                for e in dict.fromkeys((event, None)):
+                    for y in dict.fromkeys((symbol, None)):
+                        for handler, batch in routes.get((s, e, y), ()):
+                            (batches if batch else handlers)[handler] = None
+            matched = self._cache[key] = (tuple(handlers), tuple(batches))
+        return matched
+
+    def dispatch(
+        self,
+        stream: str | None,
+        events: Iterable[object],
+        key: Callable[[object], tuple[str | None, str | None]] = event_key,
+    ) -> None:
+        """
+        Delivers the events of a frame to their handlers.
+
+        Parameters
+        ----------
+        stream: str | None
+            Stream name of frame
+        events: Iterable[object]
+            Events of frame
+        key: Callable[[object], tuple[str | None, str | None]]
+            Event type and symbol of an event, defaults to :func:`event_key`
+        """
+        pending = None
+        for event in events:
+            handlers, batches = self.match(stream, *key(event))
+            for handler in handlers:
+                self._call(handler, event)
+            if batches:
+                if pending is None:
+                    pending = {}
+                for handler in batches:
+                    pending.setdefault(handler, []).append(event)
+        if pending is not None:
+            for handler, batch in pending.items():
+                self._call(handler, batch)
+
+    def _call(self, handler: Handler, argument: object) -> None:
+        try:
+            result = handler(argument)
+        except Exception:
+            log.exception("handler %r failed", handler)
+            return
+        if asyncio.iscoroutine(result):
+            (self.loop or asyncio.get_running_loop()).create_task(result)
@@ -0,0 +1,225 @@
+"""
+Stream events
+=============
+
+Typed market data stream events, built once per frame from the decoded payload.
+
+Prices and quantities are floats, or scaled integers in fixed-point mode (see :mod:`binance.client.fixed_point`).
+Mark, index and settle prices carry more decimals than the tick size and are always floats.
+
+https://binance-docs.github.io/apidocs/futures/en/#websocket-market-streams
+"""
+from typing import TYPE_CHECKING
+
+from binance.client.fixed_point import to_fixed
+
+if TYPE_CHECKING:
+    from binance.client.exchange_info import ExchangeInfo, SymbolInfo
+
+
+def _price(value: str, info: "SymbolInfo | None") -> float | int:
+    return float(value) if info is None else to_fixed(value, info.price_scale)
+
+
+def _quantity(value: str, info: "SymbolInfo | None") -> float | int:
+    return float(value) if info is None else to_fixed(value, info.quantity_scale)
+
+
+class Event:
+    """
+    Market data stream event.
+
+    Parameters
+    ----------
+    data: dict
+        Decoded event payload
+    info: :class:`binance.client.exchange_info.SymbolInfo`, optional
+        Trading rules of symbol, parses prices and quantities into fixed-point integers
+    """
+
+    __slots__ = ["type", "event_time", "symbol", "data"]
+
+    def __init__(self, data: dict, info: "SymbolInfo" = None):
+        self.data = data
+        self.type = data.get("e")
+        self.event_time = data.get("E")
+        self.symbol = data.get("s")
+
+    def __repr__(self) -> str:
+        names = ["type", "symbol"] + (self.__slots__ if type(self) is not Event else [])
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in names)
+        return f"{type(self).__name__}({fields})"
+
+
+class AggTrade(Event):
+    """
+    Aggregate trade (``<symbol>@aggTrade``)
+
+    https://binance-docs.github.io/apidocs/futures/en/#aggregate-trade-streams
+    """
+
+    __slots__ = ["id", "price", "quantity", "first_trade_id", "last_trade_id", "trade_time", "maker"]
+
+    def __init__(self, data: dict, info: "SymbolInfo" = None):
+        super().__init__(data)
+        self.id = data["a"]
+        self.price = _price(data["p"], info)
+        self.quantity = _quantity(data["q"], info)
+        self.first_trade_id = data["f"]
+        self.last_trade_id = data["l"]
+        self.trade_time = data["T"]
+        #: whether the buyer is the market maker
+        self.maker = data["m"]
+
+
+class MarkPrice(Event):
+    """
+    Mark price and funding rate (``<symbol>@markPrice``, ``!markPrice@arr``)
+
+    https://binance-docs.github.io/apidocs/futures/en/#mark-price-stream
+    """
+
+    __slots__ = ["mark_price", "index_price", "settle_price", "funding_rate", "next_funding_time"]
+
+    def __init__(self, data: dict, info: "SymbolInfo" = None):
+        super().__init__(data)
+        self.mark_price = float(data["p"])
+        self.index_price = float(data["i"])
+        #: estimated settle price (only useful in the last hour before settlement)
+        self.settle_price = float(data["P"])
+        self.funding_rate = float(data["r"])
+        self.next_funding_time = data["T"]
+
+
+class Kline(Event):
+    """
+    Kline/candlestick (``<symbol>@kline_<interval>``)
+
+    https://binance-docs.github.io/apidocs/futures/en/#kline-candlestick-streams
+    """
+
+    __slots__ = [
+        "interval",
+        "open_time",
+        "close_time",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "quote_volume",
+        "trades",
+        "taker_buy_volume",
+        "taker_buy_quote_volume",
+        "closed",
+    ]
+
+    def __init__(self, data: dict, info: "SymbolInfo" = None):
+        super().__init__(data)
+        k = data["k"]
+        self.interval = k["i"]
+        self.open_time = k["t"]
+        self.close_time = k["T"]
+        self.open = _price(k["o"], info)
+        self.high = _price(k["h"], info)
+        self.low = _price(k["l"], info)
+        self.close = _price(k["c"], info)
+        self.volume = _quantity(k["v"], info)
+        self.quote_volume = float(k["q"])
+        self.trades = k["n"]
+        self.taker_buy_volume = _quantity(k["V"], info)
+        self.taker_buy_quote_volume = float(k["Q"])
+        #: whether the kline is closed (final)
+        self.closed = k["x"]
+
+
+class BookTicker(Event):
+    """
+    Best bid and ask (``<symbol>@bookTicker``, ``!bookTicker``)
+
+    https://binance-docs.github.io/apidocs/futures/en/#individual-symbol-book-ticker-streams
+    """
+
+    __slots__ = ["update_id", "transaction_time", "bid_price", "bid_quantity", "ask_price", "ask_quantity"]
+
+    def __init__(self, data: dict, info: "SymbolInfo" = None):
+        super().__init__(data)
+        self.update_id = data["u"]
+        self.transaction_time = data.get("T")
+        self.bid_price = _price(data["b"], info)
+        self.bid_quantity = _quantity(data["B"], info)
+        self.ask_price = _price(data["a"], info)
+        self.ask_quantity = _quantity(data["A"], info)
+
+
+class DepthUpdate(Event):
+    """
+    Order book update (``<symbol>@depth``, ``<symbol>@depth<levels>``)
+
+    Bids and asks are lists of ``(price, quantity)`` tuples, a quantity of zero removes a level.
+
+    https://binance-docs.github.io/apidocs/futures/en/#diff-book-depth-streams
+    """
+
+    __slots__ = ["transaction_time", "first_update_id", "final_update_id", "previous_update_id", "bids", "asks"]
+
+    def __init__(self, data: dict, info: "SymbolInfo" = None):
+        super().__init__(data)
+        self.transaction_time = data.get("T")
+        self.first_update_id = data["U"]
+        self.final_update_id = data["u"]
+        #: final update id of the previous event
+        self.previous_update_id = data.get("pu")
+        if info is None:
+            self.bids = [(float(price), float(quantity)) for price, quantity in data["b"]]
+            self.asks = [(float(price), float(quantity)) for price, quantity in data["a"]]
+        else:
+            scale, quantity_scale = info.price_scale, info.quantity_scale
+            self.bids = [(to_fixed(p, scale), to_fixed(q, quantity_scale)) for p, q in data["b"]]
+            self.asks = [(to_fixed(p, scale), to_fixed(q, quantity_scale)) for p, q in data["a"]]
+
+
+#: event classes by event type (``e``)
+EVENTS: dict[str, type[Event]] = {
+    "aggTrade": AggTrade,
+    "markPriceUpdate": MarkPrice,
+    "kline": Kline,
+    "bookTicker": BookTicker,
+    "depthUpdate": DepthUpdate,
+}
+
+
+def parse(data: dict | list, exchange_info: "ExchangeInfo" = None) -> Event | list[Event] | dict:
+    """
+    Parses decoded payload into typed event(s).
+
+    Parameters
+    ----------
+    data: dict | list
+        Decoded payload, a list for all market streams (e.g. ``!markPrice@arr``)
+    exchange_info: :class:`binance.client.exchange_info.ExchangeInfo`, optional
+        Exchange information, parses prices and quantities into fixed-point integers
+
+    Returns
+    -------
+    :class:`Event` | list[:class:`Event`] | dict
+        Typed event(s), payloads of unknown event type are returned as is
+
+    Raises
+    ------
+    KeyError
+        If the symbol of a fixed-point event is unknown
+
+    Examples
+    --------
+    >>> parse({"e": "bookTicker", "u": 1, "s": "BTCUSDT", "b": "1.5", "B": "2", "a": "1.6", "A": "3"}).ask_price
+    1.6
+    >>> parse({"e": "unknown"})
+    {'e': 'unknown'}
+    """
+    if isinstance(data, list):
+        return [parse(entry, exchange_info) for entry in data]
+    event = EVENTS.get(data.get("e"))
+    if event is None:
+        return data
+    return event(data) if exchange_info is None else event(data, exchange_info[data["s"]])
@@ -0,0 +1,531 @@
+"""
+Market data stream
+==================
+
+Combined market data websocket streams (many streams multiplexed over one connection) with typed event handlers.
+
+https://binance-docs.github.io/apidocs/futures/en/#websocket-market-streams
+"""
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from binance.client.ratelimit import SlidingWindow
+from binance.client.streams.base import BinanceStream, BinanceStreams
+from binance.client.streams.dispatcher import Dispatcher
+from binance.client.streams.events import Event, parse
+
+if TYPE_CHECKING:
+    from binance.client.base import BaseClient
+
+log = logging.getLogger(__name__)
+
+Handler = Callable[[Event | list[Event] | dict], object]
+
+
+class StreamException(Exception):
+    """
+    Stream request exception
+
+    Parameters
+    ----------
+    code: int
+        Error code
+    msg: str
+        Error message
+    """
+
+    def __init__(self, code: int, msg: str):
+        super().__init__(f"code={code}, msg={msg}")
+        self.code = code
+        self.msg = msg
+
+
+def stream_name(stream: str) -> str:
+    """
+    Normalizes stream name (symbols of stream names are lowercase).
+
+    Examples
+    --------
+    >>> stream_name("BTCUSDT@aggTrade")
+    'btcusdt@aggTrade'
+    >>> stream_name("!markPrice@arr@1s")
+    '!markPrice@arr@1s'
+    """
+    symbol, _, rest = stream.partition("@")
+    return f"{symbol if symbol.startswith('!') else symbol.lower()}@{rest}" if rest else stream
+
+
+def frame_stream(raw: str | bytes) -> str | None:
+    """
+    Reads stream name of an undecoded combined stream frame (binance sends the name first).
+
+    Examples
+    --------
+    >>> frame_stream('{"stream":"btcusdt@depth5@100ms","data":{}}')
+    'btcusdt@depth5@100ms'
+    >>> frame_stream('{"result":null,"id":1}') is None
+    True
+    """
+    if isinstance(raw, bytes):
+        return raw[11 : raw.index(b'"', 11)].decode() if raw.startswith(b'{"stream":"') else None
+    return raw[11 : raw.index('"', 11)] if raw.startswith('{"stream":"') else None
+
+
+class MarketDataStream(BinanceStream):
+    """
+    Combined market data stream connection.
+
+    Every frame is decoded once (with the client decoder), parsed once into typed events (see
+    :mod:`binance.client.streams.events`) and routed to the handlers of its stream, event type and symbol (see
+    :class:`binance.client.streams.dispatcher.Dispatcher`). Handlers are called once per event, batch handlers
+    once per frame with the list of their events (e.g. the entries of ``!markPrice@arr`` for their symbols).
+    Handlers returning a coroutine are scheduled as tasks. Handlers of raw streams decode frames themselves (e.g.
+    :class:`binance.client.partial_depth.PartialDepth`). Lost connections are reconnected with exponential
+    backoff.
+
+    Streams added or removed while connected are (un)subscribed live with ``SUBSCRIBE``/``UNSUBSCRIBE``
+    requests, batched into a single request per event loop iteration and rate limited to `MESSAGE_RATE`
+    requests within any second. A connection carries at most `MAX_STREAMS` streams, see
+    :class:`MarketDataStreams` for more.
+
+    Parameters
+    ----------
+    client: :class:`binance.client.base.BaseClient`
+        Binance client (websocket url and decoder)
+    streams: dict[str, Handler], optional
+        Handler by stream name, e.g. ``{"btcusdt@aggTrade": print}``
+    loop: :class:`asyncio.AbstractEventLoop`, optional
+        Event loop of connection
+    session: :class:`aiohttp.ClientSession`, optional
+        HTTP session, defaults to the session of asynchronous clients (or a session owned by the stream)
+    heartbeat: float, optional
+        Seconds between client pings, a connection without pong is reconnected
+    fixed_point: bool, optional
+        Parse prices and quantities into fixed-point integers with the scales of the cached exchange information,
+        defaults to the fixed-point mode of client
+
+    Raises
+    ------
+    ValueError
+        If fixed-point events are parsed but exchange information is not loaded
+    """
+
+    #: seconds between client pings
+    HEARTBEAT = 60.0
+
+    #: maximum number of streams per connection
+    MAX_STREAMS = 200
+
+    #: requests within any second (binance allows 10 incoming messages, one is left for ping/pong frames)
+    MESSAGE_RATE = 9
+
+    #: seconds to wait for the acknowledgement of a request
+    TIMEOUT = 10.0
+
+    def __init__(
+        self,
+        client: "BaseClient",
+        streams: dict[str, Handler] = None,
+        loop: asyncio.AbstractEventLoop = None,
+        session: aiohttp.ClientSession = None,
+        heartbeat: float = HEARTBEAT,
+        fixed_point: bool = None,
+    ):
+        super().__init__(loop=loop)
+        self.client = client
+        self.heartbeat = heartbeat
+        self.fixed_point = client.fixed_point if fixed_point is None else fixed_point
+        if self.fixed_point:
+            # fixed-point events are parsed with the scales of their symbol
+            client.exchange_info.require()
+        #: handlers by stream, event type and symbol
+        self.dispatcher = Dispatcher(self.loop)
+        #: streams whose handlers are called with undecoded frames
+        self.raw_streams: set[str] = set()
+        self._session = session
+        self._owns_session = False
+        #: streams subscribed on the current connection
+        self.subscriptions: set[str] = set()
+        self._ws = None
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._messages = SlidingWindow(self.MESSAGE_RATE, 1.0)
+        self._sync_task = None
+        for stream, handler in (streams or {}).items():
+            self.subscribe(stream, handler)
+
+    def __repr__(self) -> str:
+        return f"MarketDataStream(state={self.state}, streams={list(self.handlers)})"
+
+    @property
+    def handlers(self) -> dict[str, int]:
+        """Number of handlers by stream name"""
+        return self.dispatcher.streams
+
+    @property
+    def url(self) -> str:
+        """Combined stream url of subscribed streams"""
+        return f"{self.client.websocket_url}/stream?streams={'/'.join(self.handlers)}"
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """HTTP session of websocket connection"""
+        if self._session is None:
+            if self.client.ASYNCHRONOUS:
+                self._session = self.client.session
+            else:
+                self._session = aiohttp.ClientSession()
+                self._owns_session = True
+        return self._session
+
+    def subscribe(
+        self,
+        stream: str,
+        handler: Handler,
+        raw: bool = False,
+        event: str = None,
+        symbol: str = None,
+        batch: bool = False,
+    ) -> None:
+        """
+        Adds handler of stream.
+
+        New streams of a connected stream are subscribed live.
+
+        Parameters
+        ----------
+        stream: str
+            Stream name, e.g. ``btcusdt@kline_1m``
+        handler: Handler
+            Callable called with the events of stream
+        raw: bool
+            Call handler with undecoded frames (all handlers of a stream are either raw or not)
+        event: str, optional
+            Event type of events passed to handler, defaults to all event types
+        symbol: str, optional
+            Symbol of events passed to handler, defaults to all symbols
+        batch: bool
+            Call handler once per frame with the list of its events
+
+        Raises
+        ------
+        ValueError
+            If the connection already carries `MAX_STREAMS` streams, `raw` differs from other handlers or a raw
+            handler filters events
+        """
+        stream = stream_name(stream)
+        if raw and (event is not None or symbol is not None or batch):
+            raise ValueError("raw handlers are called with every frame of their stream")
+        if stream not in self.handlers:
+            if len(self.handlers) >= self.MAX_STREAMS:
+                raise ValueError(f"connection carries {self.MAX_STREAMS} streams, use MarketDataStreams for more")
+            if raw:
+                self.raw_streams.add(stream)
+            self._schedule()
+        elif raw != (stream in self.raw_streams):
+            raise ValueError(f"handlers of {stream} are {'' if raw else 'not '}raw")
+        self.dispatcher.add(handler, stream, event, symbol, batch)
+
+    def unsubscribe(self, stream: str, handler: Handler = None) -> None:
+        """
+        Removes handler (or all handlers) of stream, whatever events it was added for.
+
+        Streams without handlers are unsubscribed live.
+
+        Parameters
+        ----------
+        stream: str
+            Stream name
+        handler: Handler, optional
+            Handler to remove, defaults to all handlers of stream
+        """
+        stream = stream_name(stream)
+        self.dispatcher.discard(stream, handler)
+        if stream not in self.handlers:
+            self.raw_streams.discard(stream)
+            self._schedule()
+
+    async def request(self, method: str, params: list = None) -> object:
+        """
+        Sends request and waits for its acknowledgement.
+
+        Parameters
+        ----------
+        method: str
+            ``SUBSCRIBE``, ``UNSUBSCRIBE``, ``LIST_SUBSCRIPTIONS``, ``SET_PROPERTY`` or ``GET_PROPERTY``
+        params: list, optional
+            Parameters of request
+
+        Returns
+        -------
+        object
+            Result of request
+
+        Raises
+        ------
+        :class:`StreamException`
+            If binance rejects the request
+        ConnectionError
+            If the stream is not connected
+        """
+        delay = self._messages.wait(1, time.monotonic())
+        while delay > 0.0:
+            await asyncio.sleep(delay)
+            delay = self._messages.wait(1, time.monotonic())
+        if self._ws is None:
+            raise ConnectionError("stream is not connected")
+        self._messages.add(time.monotonic())
+
+        request_id = next(self._ids)
+        future = self._pending[request_id] = self.loop.create_future()
+        payload = {"method": method, "id": request_id}
+        if params is not None:
+            payload["params"] = params
+        try:
+            await self._ws.send_json(payload)
+            return await asyncio.wait_for(future, self.TIMEOUT)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def list_subscriptions(self) -> list[str]:
+        """Lists streams subscribed on the connection (as known by binance)"""
+        return await self.request("LIST_SUBSCRIPTIONS")
+
+    def _schedule(self) -> None:
+        if self._ws is not None and self._sync_task is None:
+            self._sync_task = self.loop.create_task(self._sync())
+
+    async def _sync(self) -> None:
+        # let subscription changes of the current event loop iteration accumulate into one request
+        await asyncio.sleep(0)
+        try:
+            while self._ws is not None:
+                removed = [stream for stream in self.subscriptions if stream not in self.handlers]
+                added = [stream for stream in self.handlers if stream not in self.subscriptions]
+                if removed:
+                    await self.request("UNSUBSCRIBE", removed)
+                    self.subscriptions.difference_update(removed)
+                elif added:
+                    await self.request("SUBSCRIBE", added)
+                    self.subscriptions.update(added)
+                else:
+                    break
+        except (StreamException, ConnectionError, asyncio.TimeoutError) as e:
+            # reconnecting subscribes the streams of all handlers
+            log.warning("subscription update failed, reconnecting: %s", e)
+            self.disconnect()
+        finally:
+            self._sync_task = None
+
+    def _acknowledge(self, message: dict) -> None:
+        future = self._pending.get(message["id"])
+        if future is None or future.done():
+            return
+        error = message.get("error")
+        if error is not None:
+            future.set_exception(StreamException(error.get("code"), error.get("msg")))
+        else:
+            future.set_result(message.get("result"))
+
+    def on_message(self, raw: str | bytes) -> None:
+        """
+        Decodes frame and passes its event(s) to the handlers of its stream.
+
+        Parameters
+        ----------
+        raw: str | bytes
+            Combined stream frame, ``{"stream": <name>, "data": <payload>}``
+        """
+        if self.raw_streams:
+            stream = frame_stream(raw)
+            if stream in self.raw_streams:
+                for handler, _ in self.dispatcher.routes[(stream, None, None)]:
+                    try:
+                        handler(raw)
+                    except Exception:
+                        log.exception("handler %r of stream %s failed", handler, stream)
+                return
+
+        message = self.client.decoder(raw)
+        stream = message.get("stream")
+        if stream not in self.handlers:
+            if "id" in message:
+                self._acknowledge(message)
+                return
+            log.debug("unhandled message %s", message)
+            return
+        try:
+            event = parse(message["data"], self.client.exchange_info if self.fixed_point else None)
+        except (KeyError, ValueError) as e:
+            log.warning("unparsable message of stream %s: %s", stream, e)
+            return
+        self.dispatcher.dispatch(stream, event if isinstance(event, list) else (event,))
+
+    async def _connect(self):
+        streams = set(self.handlers)
+        try:
+            ws = await self.session.ws_connect(self.url, heartbeat=self.heartbeat)
+        except Exception as exc:
+            self._connector = None
+            self.loop.call_soon(self.connection_failed, exc)
+            return
+
+        self._ws = ws
+        self.subscriptions = streams
+        self.connection_made(ws)
+        # subscribe streams added while connecting
+        self._schedule()
+        try:
+            async for message in ws:
+                if message.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    self.on_message(message.data)
+                elif message.type == aiohttp.WSMsgType.ERROR:
+                    break
+        finally:
+            self._ws = None
+            self._connector = None
+            self.subscriptions = set()
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection lost"))
+            await ws.close()
+        self.loop.call_soon(self.connection_lost, ws.exception())
+
+    def disconnect(self):
+        """Closes connection, which is reconnected unless :meth:`stop_trying` was called"""
+        if self._ws is not None:
+            self.loop.create_task(self._ws.close())
+
+    async def close(self) -> None:
+        """Closes connection (without reconnecting) and owned session"""
+        self.stop_trying()
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+        if self._ws is not None:
+            await self._ws.close()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class MarketDataStreams(BinanceStreams):
+    """
+    Market data streams spread over as many connections as needed.
+
+    Streams are added to the connection already carrying them, else to the first connection with less than
+    :attr:`MarketDataStream.MAX_STREAMS` streams, else to a new connection. Connections without streams are
+    closed.
+
+    Parameters
+    ----------
+    client: :class:`binance.client.base.BaseClient`
+        Binance client (websocket url and decoder)
+    loop: :class:`asyncio.AbstractEventLoop`, optional
+        Event loop of connections
+    **kwargs
+        Keyword arguments of :class:`MarketDataStream`
+
+    Raises
+    ------
+    ValueError
+        If fixed-point events are parsed but exchange information is not loaded
+    """
+
+    factory = MarketDataStream
+
+    def __init__(self, client: "BaseClient", loop: asyncio.AbstractEventLoop = None, **kwargs):
+        super().__init__(loop=loop)
+        self.client = client
+        self._kwargs = kwargs
+        if self.fixed_point:
+            client.exchange_info.require()
+
+    def __repr__(self) -> str:
+        return (
+            f"MarketDataStreams(connections={len(self.streams)}, streams={sum(len(s.handlers) for s in self.streams)})"
+        )
+
+    @property
+    def fixed_point(self) -> bool:
+        """Whether connections parse prices and quantities into fixed-point integers"""
+        fixed_point = self._kwargs.get("fixed_point")
+        return self.client.fixed_point if fixed_point is None else fixed_point
+
+    def find(self, stream: str) -> MarketDataStream | None:
+        """Finds connection carrying stream"""
+        stream = stream_name(stream)
+        for connection in self.streams:
+            if stream in connection.handlers:
+                return connection
+        return None
+
+    def subscribe(
+        self,
+        stream: str,
+        handler: Handler,
+        raw: bool = False,
+        event: str = None,
+        symbol: str = None,
+        batch: bool = False,
+    ) -> MarketDataStream:
+        """
+        Adds handler of stream.
+
+        Parameters
+        ----------
+        stream: str
+            Stream name, e.g. ``btcusdt@kline_1m``
+        handler: Handler
+            Callable called with the events of stream
+        raw: bool
+            Call handler with undecoded frames
+        event: str, optional
+            Event type of events passed to handler, defaults to all event types
+        symbol: str, optional
+            Symbol of events passed to handler, defaults to all symbols
+        batch: bool
+            Call handler once per frame with the list of its events
+
+        Returns
+        -------
+        :class:`MarketDataStream`
+            Connection carrying stream
+        """
+        connection = self.find(stream)
+        if connection is None:
+            connection = next((c for c in self.streams if len(c.handlers) < c.MAX_STREAMS), None)
+        if connection is None:
+            # connects on the next event loop iteration, with the streams subscribed until then
+            connection = self.connect(self.client, **self._kwargs)
+        connection.subscribe(stream, handler, raw, event, symbol, batch)
+        return connection
+
+    def unsubscribe(self, stream: str, handler: Handler = None) -> None:
+        """
+        Removes handler (or all handlers) of stream.
+
+        Parameters
+        ----------
+        stream: str
+            Stream name
+        handler: Handler, optional
+            Handler to remove, defaults to all handlers of stream
+        """
+        connection = self.find(stream)
+        if connection is None:
+            return
+        connection.unsubscribe(stream, handler)
+        if not connection.handlers:
+            self.streams.remove(connection)
+            self.loop.create_task(connection.close())
+
+    async def close(self) -> None:
+        """Closes all connections"""
+        streams, self.streams = self.streams, []
+        await asyncio.gather(*(stream.close() for stream in streams))
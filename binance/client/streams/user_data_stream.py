@@ -1,93 +1,229 @@
 """
+User data stream
+================
+
+Account, order and position updates of the user data stream (listen key websocket) routed to callbacks by event
+type and symbol.
+
+https://binance-docs.github.io/apidocs/futures/en/#user-data-streams
 """
 import asyncio
-import json
 import logging
-from asyncio import CancelledError
+from collections.abc import Callable
+
+import aiohttp
 
 from binance.client.base import BaseClient
+from binance.client.response import ResponseException
+from binance.client.streams.dispatcher import Dispatcher
+
+log = logging.getLogger(__name__)
 
-log = logging.getLogger(__file__)
+
+def user_data_key(data: dict) -> tuple[str | None, str | None]:
+    """
+    Event type and symbol of a user data event (symbols of order and leverage updates are nested).
+
+    Examples
+    --------
+    >>> user_data_key({"e": "ORDER_TRADE_UPDATE", "E": 1568879465651, "o": {"s": "BTCUSDT"}})
+    ('ORDER_TRADE_UPDATE', 'BTCUSDT')
+    >>> user_data_key({"e": "ACCOUNT_UPDATE", "E": 1564745798939, "a": {}})
+    ('ACCOUNT_UPDATE', None)
+    """
+    nested = data.get("o") or data.get("ac")
+    return data.get("e"), nested.get("s") if isinstance(nested, dict) else data.get("s")
 
 
 class UserDataStream:
-    def __init__(self, client: BaseClient, loop=None):
+    """
+    User data stream connection.
+
+    The connection is opened with a new listen key when the first callback is subscribed and closed when the last
+    one is unsubscribed. The listen key is kept alive while connected. Lost connections and expired listen keys
+    are reconnected (with a new listen key) after an exponential backoff. Every frame is decoded once (with the
+    client decoder) and routed to the callbacks of its event type and symbol (see :func:`user_data_key`).
+
+    Parameters
+    ----------
+    client: :class:`binance.client.base.BaseClient`
+        Binance client (listen key calls, websocket url and decoder)
+    loop: :class:`asyncio.AbstractEventLoop`, optional
+        Event loop of connection
+    session: :class:`aiohttp.ClientSession`, optional
+        HTTP session, defaults to the session of asynchronous clients (or a session owned by the stream)
+    heartbeat: float, optional
+        Seconds between client pings, a connection without pong is reconnected
+    """
+
+    #: seconds between client pings
+    HEARTBEAT = 60.0
+
+    #: seconds between listen key keepalives (listen keys expire after 60 minutes)
+    KEEP_ALIVE = 50 * 60.0
+
+    #: initial and maximum seconds between reconnects
+    INITIAL_DELAY, MAX_DELAY = 1.0, 60.0
+
+    def __init__(
+        self,
+        client: BaseClient,
+        loop: asyncio.AbstractEventLoop = None,
+        session: aiohttp.ClientSession = None,
+        heartbeat: float = HEARTBEAT,
+    ):
         self.client = client
-        self.loop = loop
+        self.loop = asyncio.get_event_loop() if loop is None else loop
+        self.heartbeat = heartbeat
 
-        self._callbacks = list()
+        #: callbacks by event type and symbol
+        self.dispatcher = Dispatcher(self.loop)
+        self._session = session
+        self._owns_session = False
         self._listener_task = None
 
-    def subscribe(self, callback):
+    def __repr__(self) -> str:
+        return f"UserDataStream(callbacks={len(self.dispatcher)}, listening={self._listener_task is not None})"
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """HTTP session of websocket connection"""
+        if self._session is None:
+            if self.client.ASYNCHRONOUS:
+                self._session = self.client.session
+            else:
+                self._session = aiohttp.ClientSession()
+                self._owns_session = True
+        return self._session
+
+    def subscribe(
+        self, callback: Callable[[dict], object], event: str = None, symbol: str = None, batch: bool = False
+    ) -> None:
+        """
+        Adds callback (thread-safe), the first callback opens the connection.
+
+        Parameters
+        ----------
+        callback: Callable[[dict], object]
+            Callable called with every matching decoded event
+        event: str, optional
+            Event type, e.g. ``ORDER_TRADE_UPDATE``, defaults to all event types
+        symbol: str, optional
+            Symbol, defaults to all symbols
+        batch: bool
+            Call callback with the list of its matching events of a frame
+        """
+
         def _subscribe():
-            log.debug("Add callback {callback}.")
-            self._callbacks.append(callback)
+            log.debug("add callback %r", callback)
+            self.dispatcher.add(callback, event=event, symbol=symbol, batch=batch)
             if self._listener_task is None:
                 self._listener_task = self.loop.create_task(self._listener())
 
         self.loop.call_soon_threadsafe(_subscribe)
 
-    def unsubscribe(self, callback=None):
-        def _unsubscribe(self):
-            log.debug("Remove callback {callback}")
-            self._callbacks.remove(callback)
-            if not self._callbacks:
-                self._ws_task.cancel("No more callbacks")
+    def unsubscribe(self, callback: Callable[[dict], object] = None, event: str = None, symbol: str = None) -> None:
+        """
+        Removes callback (or all callbacks, thread-safe), the last callback closes the connection.
+
+        Parameters
+        ----------
+        callback: Callable[[dict], object], optional
+            Callback to remove, defaults to all callbacks
+        event: str, optional
+            Event type the callback was added for, defaults to all its routes
+        symbol: str, optional
+            Symbol the callback was added for, defaults to all its routes
+        """
+
+        def _unsubscribe():
+            log.debug("remove callback %r", callback)
+            if event is None and symbol is None:
+                # from every route of callback (or all callbacks)
+                self.dispatcher.discard(None, callback)
+            else:
+                self.dispatcher.remove(callback, event=event, symbol=symbol)
+            if not len(self.dispatcher) and self._listener_task is not None:
+                self._listener_task.cancel("No more callbacks")
+                self._listener_task = None
 
         self.loop.call_soon_threadsafe(_unsubscribe)
 
-    async def _keep_listen_key_alive(self):
+    async def _call(self, endpoint: Callable):
         if self.client.ASYNCHRONOUS:
-            r = await self.client.user_data.keep_listen_key_alive()
-        else:
-            r = self.client.user_data.keep_listen_key_alive()
-        if not r.OK:
-            raise ValueError("failed")
-
-    async def _get_listen_key(self):
-        if self.client.ASYNCHRONOUS:
-            r = await self.client.user_data.get_listen_key()
-        else:
-            r = self.client.user_data.get_listen_key()
-        if not r.OK:
-            raise ValueError("failed")
-        return r["response"]["listenKey"]
-
-    async def _listener(self):
-        async def keep_alive(self):
-            while True:
-                await asyncio.sleep(60 * 50)
-                await self._keep_listen_key_alive()
-
-        keep_alive_task = self.loop.create_task(keep_alive())
+            return await endpoint()
+        return await self.loop.run_in_executor(None, endpoint)
+
+    async def _keep_alive(self) -> None:
+        while True:
+            await asyncio.sleep(self.KEEP_ALIVE)
+            try:
+                await self._call(self.client.user_data.keep_listen_key_alive)
+            except (ResponseException, aiohttp.ClientError) as e:
+                log.warning("listen key keepalive failed: %s", e)
+
+    def on_message(self, raw: str | bytes) -> dict:
+        """
+        Decodes frame and passes its event to the callbacks of its event type and symbol.
+
+        Parameters
+        ----------
+        raw: str | bytes
+            User data stream frame
+
+        Returns
+        -------
+        dict
+            Decoded event
+        """
+        data = self.client.decoder(raw)
+        self.dispatcher.dispatch(None, (data,), key=user_data_key)
+        return data
+
+    async def _listen(self) -> None:
+        listen_key = (await self._call(self.client.user_data.get_listen_key)).data["listenKey"]
+        url = f"{self.client.websocket_url}/ws/{listen_key}"
+        async with self.session.ws_connect(url, heartbeat=self.heartbeat) as ws:
+            log.debug("user data stream connected")
+            async for message in ws:
+                if message.type == aiohttp.WSMsgType.ERROR:
+                    break
+                if message.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    continue
+                if self.on_message(message.data).get("e") == "listenKeyExpired":
+                    log.info("listen key expired")
+                    break
+
+    async def _listener(self) -> None:
+        keep_alive_task = self.loop.create_task(self._keep_alive())
+        delay = self.INITIAL_DELAY
         try:
             while True:
-                listen_key = await self._get_listen_key()
-                url = f"{self.client._websocket_base}/ws/{listen_key}"
                 try:
-                    ws = await websockets.connect(url, loop=self.loop)
-                    for data in ws:
-                        data = json.loads(data)
-                        list(map(lambda x: x(data), self._callbacks))
-                except ConnectionClosed as e:
-                    log.error(f"Connection closed; {e}. Restarting socket.")
-                finally:
-                    ws.close()
-        except CancelledError:
-            log.debug("CancelledError raised in _listener(); {e}.")
+                    await self._listen()
+                    delay = self.INITIAL_DELAY
+                except (ResponseException, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    log.warning("user data stream failed: %s", e)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.MAX_DELAY)
+                log.debug("reconnecting user data stream")
         finally:
             keep_alive_task.cancel()
-            self._listener_task = None
-
-    async def _clean(self):
-        self._task.cancel()
-        await asyncio.gather(self._task, loop=self._loop)
-
-    def __enter__(self):
+            if self._listener_task is asyncio.current_task():
+                self._listener_task = None
+
+    async def close(self) -> None:
+        """Closes connection and owned session"""
+        task, self._listener_task = self._listener_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "UserDataStream":
         return self
 
-    def __exit__(self, exc_type, exc, tb):
-        self.close()
-
-    def close(self) -> None:
-        self._ws_task.cancel()
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
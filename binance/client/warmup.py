@@ -0,0 +1,103 @@
+"""
+Connection warm-up
+==================
+
+Keeps pooled connections open and warm with low weight pings, so latency sensitive calls (e.g. orders) after a
+quiet period do not pay a new TCP and TLS handshake.
+
+https://binance-docs.github.io/apidocs/futures/en/#test-connectivity
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from binance.client.periodic import Periodic
+
+if TYPE_CHECKING:
+    from binance.client.base import BaseClient
+
+log = logging.getLogger(__name__)
+
+
+class Warmer(Periodic):
+    """
+    Connection warmer.
+
+    Every round sends `connections` concurrent :func:`binance.client.endpoints.market.ping` calls (weight 1
+    each). Concurrent calls cannot share a connection, so each round opens (or keeps alive) that many pooled
+    connections and measures the round trip time (RTT) of each of them.
+
+    Parameters
+    ----------
+    client: :class:`binance.client.base.BaseClient`
+        Binance client to keep warm
+    connections: int
+        Number of connections to keep warm
+    interval: float, optional
+        Seconds between rounds, defaults to half the keep-alive timeout of the client connection pool
+    """
+
+    __slots__ = ["client", "connections", "interval", "rtts"]
+
+    #: seconds between rounds if the client has no connection pool configuration
+    INTERVAL = 15.0
+
+    TASK = "connection warm-up"
+
+    def __init__(self, client: "BaseClient", connections: int = 2, interval: float = None):
+        super().__init__()
+        self.client = client
+        self.connections = connections
+        if interval is None:
+            pool = getattr(client, "pool", None)
+            interval = pool.keepalive_timeout / 2 if pool is not None else self.INTERVAL
+        self.interval = interval
+        #: round trip time (milliseconds) per connection of the last round
+        self.rtts: list[float] = []
+
+    def __repr__(self) -> str:
+        return f"Warmer(connections={self.connections}, interval={self.interval}, rtts={self.rtts})"
+
+    @property
+    def period(self) -> float:
+        """Seconds between rounds"""
+        return self.interval
+
+    def _step(self):
+        return self.warm()
+
+    def warm(self):
+        """
+        Pings every connection once.
+
+        Returns a coroutine when the client is asynchronous.
+
+        Returns
+        -------
+        list[float]
+            Round trip time (milliseconds) per connection
+        """
+        if self.client.ASYNCHRONOUS:
+            return self._async_warm()
+
+        def ping(_) -> float:
+            start = time.perf_counter()
+            self.client.market.ping()
+            return (time.perf_counter() - start) * 1000
+
+        with ThreadPoolExecutor(max_workers=self.connections, thread_name_prefix="binance-warmup") as executor:
+            self.rtts = list(executor.map(ping, range(self.connections)))
+        log.debug("warm connection rtts %s", self.rtts)
+        return self.rtts
+
+    async def _async_warm(self) -> list[float]:
+        async def ping() -> float:
+            start = time.perf_counter()
+            await self.client.market.ping()
+            return (time.perf_counter() - start) * 1000
+
+        self.rtts = list(await asyncio.gather(*(ping() for _ in range(self.connections))))
+        log.debug("warm connection rtts %s", self.rtts)
+        return self.rtts
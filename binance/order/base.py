@@ -26,7 +26,7 @@ class BatchOrder(BaseModel):
 
     batchOrders: conlist(OrderType, min_length=1, max_length=5)
 
-    def dict(self, *args, **kwargs):
+    def model_dump(self, *args, **kwargs):
         """
         Encodes batch order in correct binance format
 
@@ -36,7 +36,7 @@ class BatchOrder(BaseModel):
         """
         orders = list()
         for order in self.batchOrders:
-            d = order.dict(*args, **kwargs)
+            d = order.model_dump(*args, **kwargs)
             # every value must be encoded as str (int and floats too)
             orders.append({k: str(v) for k, v in d.items()})
         return {"batchOrders": json.dumps(orders)}
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+import json
+
+import pytest
+import requests
+
+#: default exchange information of :func:`exchange_info`
+EXCHANGE_INFO = {
+    "symbols": [
+        {"symbol": "BTCUSDT", "pricePrecision": 1, "quantityPrecision": 3, "filters": []},
+        {"symbol": "ETHUSDT", "pricePrecision": 2, "quantityPrecision": 3, "filters": []},
+        {"symbol": "BTCUSDT_240329", "pricePrecision": 1, "quantityPrecision": 3, "filters": []},
+    ]
+}
+
+
+class Streams:
+    """Offline market data streams recording subscribed handlers"""
+
+    def __init__(self, fixed_point: bool = False):
+        self.fixed_point = fixed_point
+        #: handler by stream
+        self.handlers = {}
+        #: streams subscribed with undecoded frames
+        self.raw = set()
+
+    def subscribe(self, stream, handler, raw=False, event=None, symbol=None, batch=False):
+        self.handlers[stream] = handler
+        if raw:
+            self.raw.add(stream)
+
+    def unsubscribe(self, stream, handler=None, event=None, symbol=None):
+        del self.handlers[stream]
+        self.raw.discard(stream)
+
+
+@pytest.fixture
+def make_response():
+    """Factory of offline requests responses"""
+
+    def factory(content: bytes = b"{}", status: int = 200, headers: dict = None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response._content = content
+        response.headers.update(headers or {})
+        return response
+
+    return factory
+
+
+@pytest.fixture
+def streams():
+    """Offline market data streams"""
+    return Streams()
+
+
+@pytest.fixture
+def exchange_info():
+    """Loads exchange information (defaults to :data:`EXCHANGE_INFO`) into a client"""
+
+    def load(client, payload: dict = None):
+        client.exchange_info.load(json.dumps(EXCHANGE_INFO if payload is None else payload).encode())
+        return client
+
+    return load
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+import pytest
+from pydantic import ValidationError
+
+from binance.client.base import BaseClient
+from binance.client.endpoints import market
+from binance.enums.binance import KlineInterval
+
+
+class RecordingClient(BaseClient):
+    """Client recording calls instead of sending them"""
+
+    ASYNCHRONOUS = False
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+        super().__init__(*args, **kwargs)
+
+    def close(self):
+        pass
+
+    def _call(self, http_method, route, /, params=None, **kwargs):
+        self.calls.append((http_method, route, params))
+        return params
+
+
+def get_endpoint(endpoints, name):
+    return next(e for e in endpoints if e.func.__name__ == name)
+
+
+def test_validator_is_shared_between_clients():
+    endpoint = get_endpoint(market.endpoints, "klines")
+    RecordingClient()
+    validator = endpoint.validator
+    RecordingClient()
+    assert endpoint.validator is validator
+
+
+def test_validation():
+    client = RecordingClient()
+    with pytest.raises(ValidationError):
+        client.market.klines()
+
+    params = client.market.klines("BTCUSDT", "1m", limit="5")
+    assert dict(params) == {"symbol": "BTCUSDT", "interval": KlineInterval.ONE_MINUTE, "limit": "5"}
+
+
+def test_binding_plan():
+    from binance.client.endpoints import helpers, trade
+    from binance.client.endpoints.base import BindingPlan
+    from binance.enums.binance import OrderSide, TimeInForce
+    from binance.order import Limit
+
+    endpoint = get_endpoint(trade.endpoints, "new_order")
+    assert endpoint.plan.entries == (
+        ("order", BindingPlan.MODEL, None),
+        ("timestamp", BindingPlan.FACTORY, helpers.get_timestamp),
+        ("recvWindow", BindingPlan.VALUE, None),
+    )
+
+    order = Limit(symbol="BTCUSDT", side=OrderSide.BUY, quantity=1, price=2, timeInForce=TimeInForce.GOOD_TILL_CANCEL)
+    params = endpoint.plan.bind(*endpoint.validator(order, recvWindow=5000))
+    assert params["symbol"] == "BTCUSDT" and params["price"] == "2.0" and params["recvWindow"] == "5000"
+    assert params["timestamp"].isdigit()
+    assert "clientOrderId" not in params
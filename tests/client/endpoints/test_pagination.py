@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+import json
+
+import pytest
+
+from binance import AIOClient, Client
+from binance.client.response import Response
+
+TRADES = [{"a": i, "p": "1.0", "q": "1.0", "T": 1000 + 10 * i} for i in range(2500)]
+
+
+def aggregated_trades(params):
+    """Serves aggregated trades like binance (by fromId or by time range)"""
+    limit = int(params["limit"])
+    if "fromId" in params:
+        trades = TRADES[int(params["fromId"]) :]
+    else:
+        start, end = int(params.get("startTime", 0)), int(params.get("endTime", 1 << 62))
+        trades = [t for t in TRADES if start <= t["T"] <= end]
+    return Response(json.dumps(trades[:limit]).encode(), 200, {})
+
+
+def test_paginate():
+    c = Client()
+    calls = []
+    c._call = lambda *args, params, **kwargs: calls.append(dict(params)) or aggregated_trades(params)
+
+    pages = list(c.market.aggregated_trades.paginate("BTCUSDT", fromId=0))
+    assert [len(page) for page in pages] == [1000, 1000, 500]
+    assert [t["a"] for page in pages for t in page] == list(range(2500))
+    assert [call.get("fromId") for call in calls] == ["0", "1000", "2000"]
+
+    # time range is replaced by the cursor after the first page and trimmed at endTime
+    calls.clear()
+    pages = list(c.market.aggregated_trades.paginate(symbol="BTCUSDT", startTime=1010, endTime=21000, limit=500))
+    assert [t["a"] for page in pages for t in page] == list(range(1, 2001))
+    assert calls[1] == {"symbol": "BTCUSDT", "limit": "500", "fromId": "501"}
+    c.close()
+
+
+@pytest.mark.asyncio
+async def test_paginate_async():
+    c = AIOClient()
+
+    async def call(*args, params, **kwargs):
+        return aggregated_trades(params)
+
+    c._call = call
+    trades = [t async for page in c.market.aggregated_trades.paginate("BTCUSDT", fromId=1500) for t in page]
+    assert [t["a"] for t in trades] == list(range(1500, 2500))
+    await c.close()
+
+
+def test_not_paginated():
+    c = Client()
+    assert hasattr(c.market.historical_trades, "paginate")
+    assert not hasattr(c.market.klines, "paginate")
+    c.close()
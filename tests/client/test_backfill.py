@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+import asyncio
+import json
+
+import pytest
+
+from binance import AIOClient
+from binance.client.backfill import Backfill, windows
+from binance.client.ratelimit import Limiter
+from binance.client.response import Response
+
+MINUTE = 60_000
+
+
+def test_windows():
+    assert windows(30_000, 5 * MINUTE, MINUTE, 2) == [
+        (30_000, 2 * MINUTE - 1),
+        (2 * MINUTE, 4 * MINUTE - 1),
+        (4 * MINUTE, 5 * MINUTE),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_klines():
+    c = AIOClient()
+    calls = []
+
+    async def klines(symbol, interval, startTime, endTime, limit):
+        calls.append((startTime, endTime))
+        # later windows answer first; one extra kline before each window overlaps the previous one
+        await asyncio.sleep(0.01 / (len(calls)))
+        first = max(startTime - startTime % MINUTE - MINUTE, 0)
+        rows = [[t, "1", "1", "1", "1", "1", t + MINUTE - 1] for t in range(first, endTime + 1, MINUTE)]
+        return Response(json.dumps(rows[:limit]).encode(), 200, {})
+
+    c.market.klines = klines
+    backfill = Backfill(c, "klines", concurrency=3, budget=Limiter.request_weight(limit=1000))
+    pages = [page async for page in backfill.pages(0, 4000 * MINUTE - 1, symbol="BTCUSDT", interval="1m")]
+    await c.close()
+
+    times = [row[0] for page in pages for row in page]
+    assert times == list(range(0, 4000 * MINUTE, MINUTE))
+    assert len(pages) == 3
+    # windows overfilled by the overlapping kline are followed up
+    assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_backfill_funding_rate():
+    c = AIOClient()
+
+    async def funding_rate_history(symbol, startTime, endTime, limit):
+        # hourly funding (denser than the assumed 8 hours)
+        hour = 3_600_000
+        first = -(-startTime // hour) * hour
+        rows = [{"symbol": symbol, "fundingTime": t} for t in range(first, endTime + 1, hour)]
+        return Response(json.dumps(rows[:limit]).encode(), 200, {})
+
+    c.market.funding_rate_history = funding_rate_history
+    times = [
+        row["fundingTime"]
+        async for page in c.backfill("funding_rate_history", 0, 2500 * 3_600_000 - 1, symbol="BTCUSDT")
+        for row in page
+    ]
+    await c.close()
+    assert times == list(range(0, 2500 * 3_600_000, 3_600_000))
+
+
+def test_backfill_unknown_endpoint():
+    with pytest.raises(ValueError):
+        Backfill(None, "order_book")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from binance import AIOClient, Client
+from binance.client.cache import ResponseCache
+from binance.client.response import Response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr("binance.client.cache.time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_ttl_and_lru(monkeypatch, make_response, clock):
+    c = Client(cache_responses=True)
+    sent = []
+    monkeypatch.setattr(c.session, "send", lambda req: sent.append(req.url) or make_response(b'{"price": "1"}'))
+
+    first = c.market.ticker_price(symbol="BTCUSDT")
+    assert c.market.ticker_price(symbol="BTCUSDT") is first
+    assert len(sent) == 1
+    c.market.ticker_price(symbol="ETHUSDT")
+    assert len(sent) == 2
+
+    clock.value += 1
+    assert c.market.ticker_price(symbol="BTCUSDT") is not first
+    assert len(sent) == 3
+
+    # uncached endpoints are not affected
+    c.market.ping()
+    c.market.ping()
+    assert len(sent) == 5
+    assert not hasattr(c.market.ping, "cache")
+
+    cache = ResponseCache(ttl=10, size=2)
+    for key in "abc":
+        cache._store(key, key)
+    assert list(cache._entries) == ["b", "c"]
+    c.close()
+
+
+def test_disabled_by_default(monkeypatch, make_response):
+    c = Client()
+    sent = []
+    monkeypatch.setattr(c.session, "send", lambda req: sent.append(req.url) or make_response())
+    assert c.market.mark_price(symbol="BTCUSDT") is not c.market.mark_price(symbol="BTCUSDT")
+    assert len(sent) == 2
+    assert not hasattr(c.market.mark_price, "cache")
+    c.close()
+
+
+def test_single_flight_threads(monkeypatch):
+    c = Client(cache_responses=True)
+    calls, called, release = [], threading.Event(), threading.Event()
+
+    def call(*args, params, **kwargs):
+        calls.append(dict(params))
+        called.set()
+        release.wait(5)
+        return Response(b"{}", 200, {})
+
+    c._call = call
+    responses = []
+    threads = [threading.Thread(target=lambda: responses.append(c.market.open_interest("BTCUSDT"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    assert called.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len(responses) == 8 and all(r is responses[0] for r in responses)
+    c.close()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_async():
+    c = AIOClient(cache_responses=True)
+    calls = []
+
+    async def call(*args, params, **kwargs):
+        calls.append(dict(params))
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise RuntimeError("failed")
+        return Response(b'{"markPrice": "1"}', 200, {})
+
+    c._call = call
+    results = await asyncio.gather(*(c.market.mark_price(symbol="BTCUSDT") for _ in range(5)), return_exceptions=True)
+    assert len(calls) == 1 and all(isinstance(r, RuntimeError) for r in results)
+
+    # failures are not cached
+    responses = await asyncio.gather(*(c.market.mark_price(symbol="BTCUSDT") for _ in range(5)))
+    assert len(calls) == 2 and all(r is responses[0] for r in responses)
+    assert len(c.market.mark_price.cache) == 1
+    await c.close()
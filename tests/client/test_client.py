@@ -13,3 +13,21 @@ def test_client_initialization():
 async def test_aioclient_initialization():
     c = AIOClient()
     await c.close()
+
+
+def test_signed_query_sent_verbatim(monkeypatch, make_response):
+    import hashlib
+    import hmac
+
+    c = Client(api_key="key", api_secret="secret")
+    sent = []
+    monkeypatch.setattr(c.session, "send", lambda req: sent.append(req) or make_response())
+
+    c.trade.get_position_mode(timestamp=1700000000000, recvWindow=5000)
+    c.close()
+
+    url = sent[0].url
+    query, signature = url.split("?", 1)[1].split("&signature=")
+    assert query == "timestamp=1700000000000&recvWindow=5000"
+    assert signature == hmac.new(b"secret", query.encode(), hashlib.sha256).hexdigest()
+    assert sent[0].headers["X-MBX-APIKEY"] == "key"
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from binance import Client
+from binance.client.clock import Clock
+
+
+def test_add_samples():
+    clock = Clock(client=None)
+    assert clock.recv_window == 5000
+
+    # (sent, server, received): the sample with the smallest round trip wins
+    clock.add_samples([(0, 1060, 100), (200, 1225, 250), (300, 1400, 500)])
+    assert clock.rtt == 50 and clock.offset == 1000
+    assert clock.max_rtt == 200 and clock.recv_window == 1600
+
+
+def test_signed_timestamp_follows_server_time(monkeypatch, make_response):
+    c = Client(api_key="key", api_secret="secret")
+    sent = []
+
+    def send(req):
+        sent.append(req)
+        return make_response(json.dumps({"serverTime": int(time.time() * 1000) + 60000}).encode())
+
+    monkeypatch.setattr(c.session, "send", send)
+    c.clock.sync()
+    assert len(sent) == c.clock.samples
+    assert 59000 < c.clock.offset < 61000
+
+    c.trade.get_position_mode()
+    timestamp = int(parse_qs(urlsplit(sent[-1].url).query)["timestamp"][0])
+    assert abs(timestamp - (time.time() * 1000 + 60000)) < 1000
+    c.close()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+import json
+
+import pytest
+
+from binance.client.response import Response
+
+np = pytest.importorskip("numpy")
+
+KLINES = [
+    [1499040000000, "0.01634790", "0.80000000", "0.01575800", "0.01577100", "148976.11427815", 1499644799999,
+     "2434.19055334", 308, "1756.87402397", "28.46694368", "0"],
+    [1499644800000, "0.01577100", "0.01600000", "0.01500000", "0.01590000", "100.5", 1500249599999,
+     "1.5", 12, "50.25", "0.75", "0"],
+]  # fmt: skip
+
+
+def test_to_klines():
+    klines = Response(json.dumps(KLINES).encode(), 200, {}).to_klines()
+    assert klines.shape == (2,)
+    assert klines.dtype["open_time"] == np.int64 and klines.dtype["close"] == np.float64
+    assert klines["open_time"].tolist() == [1499040000000, 1499644800000]
+    assert klines["trades"].tolist() == [308, 12]
+    np.testing.assert_array_equal(klines["close"], [0.015771, 0.0159])
+    np.testing.assert_array_equal(klines["taker_buy_quote_volume"], [28.46694368, 0.75])
+
+
+def test_to_klines_fixed_point():
+    klines = Response(json.dumps(KLINES).encode(), 200, {}).to_klines(price_scale=8)
+    assert klines.dtype["open"] == np.int64
+    assert klines["open"].tolist() == [1634790, 1577100]
+    assert klines["volume"].tolist() == [148976.11427815, 100.5]
+
+
+def test_to_klines_empty():
+    assert Response(b"[]", 200, {}).to_klines().shape == (0,)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+import json
+
+import pytest
+
+from binance import Client
+from binance.client.decoder import get_decoder
+
+
+def test_get_decoder():
+    assert get_decoder("json") is json.loads
+    assert get_decoder(len) is len
+    assert get_decoder()(b'{"a": [1, "2"]}') == {"a": [1, "2"]}
+    with pytest.raises(KeyError):
+        get_decoder("yaml")
+
+
+def test_client_decoder(monkeypatch, make_response):
+    bodies = []
+
+    def decoder(body: bytes):
+        bodies.append(body)
+        return json.loads(body)
+
+    c = Client(decoder=decoder)
+    monkeypatch.setattr(c.session, "send", lambda req: make_response(b'{"serverTime": 1}'))
+    assert c.market.server_time().data == {"serverTime": 1}
+    assert bodies == [b'{"serverTime": 1}']
+    c.close()
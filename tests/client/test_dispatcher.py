@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import asyncio
+
+import pytest
+
+from binance import AIOClient
+from binance.client.streams.dispatcher import Dispatcher
+from binance.client.streams.user_data_stream import UserDataStream, user_data_key
+
+
+def trade(symbol):
+    return {"e": "aggTrade", "s": symbol}
+
+
+def test_routes():
+    dispatcher = Dispatcher()
+    btc, trades, everything = [], [], []
+    dispatcher.add(btc.append, "!bookTicker", symbol="BTCUSDT")
+    dispatcher.add(trades.append, event="aggTrade")
+    dispatcher.add(everything.append)
+    # a handler is called once per event, even if several of its routes match
+    dispatcher.add(everything.append, "btcusdt@aggTrade")
+
+    dispatcher.dispatch("btcusdt@aggTrade", [trade("BTCUSDT")])
+    dispatcher.dispatch("!bookTicker", [{"e": "bookTicker", "s": "BTCUSDT"}, {"e": "bookTicker", "s": "ETHUSDT"}])
+    assert btc == [{"e": "bookTicker", "s": "BTCUSDT"}]
+    assert trades == [trade("BTCUSDT")]
+    assert len(everything) == 3
+    assert dispatcher.streams == {"!bookTicker": 1, None: 2, "btcusdt@aggTrade": 1} and len(dispatcher) == 4
+
+    assert dispatcher.remove(everything.append) == 1
+    assert dispatcher.discard("btcusdt@aggTrade") == 1
+    assert dispatcher.remove(print) == 0
+    dispatcher.dispatch("btcusdt@aggTrade", [trade("BTCUSDT")])
+    assert len(everything) == 3 and len(trades) == 2
+    assert dispatcher.streams == {"!bookTicker": 1, None: 1}
+
+
+def test_batch():
+    dispatcher = Dispatcher()
+    batches, single = [], []
+    dispatcher.add(batches.append, "!markPrice@arr", symbol="BTCUSDT", batch=True)
+    dispatcher.add(batches.append, "!markPrice@arr", symbol="ETHUSDT", batch=True)
+    dispatcher.add(single.append, "!markPrice@arr", symbol="ETHUSDT")
+    events = [trade("BTCUSDT"), trade("BNBUSDT"), trade("ETHUSDT")]
+    dispatcher.dispatch("!markPrice@arr", events)
+    assert batches == [[events[0], events[2]]]
+    assert single == [events[2]]
+
+
+@pytest.mark.asyncio
+async def test_errors_and_coroutines():
+    dispatcher = Dispatcher()
+    received = []
+
+    def fail(event):
+        raise RuntimeError("boom")
+
+    async def handle(event):
+        received.append(event)
+
+    dispatcher.add(fail)
+    dispatcher.add(handle)
+    dispatcher.dispatch(None, [trade("BTCUSDT")])
+    await asyncio.sleep(0)
+    assert received == [trade("BTCUSDT")]
+
+
+def test_user_data_key():
+    orders = []
+    dispatcher = Dispatcher()
+    dispatcher.add(orders.append, event="ORDER_TRADE_UPDATE", symbol="BTCUSDT")
+    dispatcher.dispatch(None, [{"e": "ORDER_TRADE_UPDATE", "o": {"s": "BTCUSDT"}}], key=user_data_key)
+    dispatcher.dispatch(None, [{"e": "ORDER_TRADE_UPDATE", "o": {"s": "ETHUSDT"}}], key=user_data_key)
+    dispatcher.dispatch(None, [{"e": "ACCOUNT_UPDATE", "a": {}}], key=user_data_key)
+    assert len(orders) == 1
+
+
+@pytest.mark.asyncio
+async def test_user_data_unsubscribe():
+    stream = UserDataStream(AIOClient(), loop=asyncio.get_running_loop())
+    started = []
+
+    async def listener():
+        started.append(True)
+        await asyncio.sleep(10)
+
+    stream._listener = listener
+    stream.subscribe(print, event="ORDER_TRADE_UPDATE", symbol="BTCUSDT")
+    await asyncio.sleep(0)
+    task = stream._listener_task
+    # without a route the callback is removed from all its routes
+    stream.unsubscribe(print)
+    await asyncio.sleep(0)
+    await asyncio.gather(task, return_exceptions=True)
+    assert not len(stream.dispatcher) and stream._listener_task is None and task.cancelled()
+
+    # the listener restarts with the next callback
+    stream.subscribe(print)
+    await asyncio.sleep(0.01)
+    assert len(started) == 2 and stream._listener_task is not None
+    stream.unsubscribe()
+    await asyncio.sleep(0)
+    assert stream._listener_task is None
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+import json
+from decimal import Decimal
+
+import pytest
+
+from binance import AIOClient, Client
+
+
+def symbol(name, tick_size="0.10", status="TRADING"):
+    return {
+        "symbol": name,
+        "pair": name,
+        "contractType": "PERPETUAL",
+        "status": status,
+        "pricePrecision": 2,
+        "quantityPrecision": 3,
+        "filters": [
+            {"minPrice": "0.10", "maxPrice": "4529764", "filterType": "PRICE_FILTER", "tickSize": tick_size},
+            {"stepSize": "0.001", "filterType": "LOT_SIZE", "maxQty": "1000", "minQty": "0.001"},
+            {"notional": "5", "filterType": "MIN_NOTIONAL"},
+            {
+                "multiplierDown": "0.9500",
+                "multiplierUp": "1.0500",
+                "multiplierDecimal": "4",
+                "filterType": "PERCENT_PRICE",
+            },
+        ],
+    }
+
+
+def payload(*symbols, server_time=1700000000000):
+    return json.dumps({"timezone": "UTC", "serverTime": server_time, "symbols": list(symbols)}).encode()
+
+
+def test_exchange_info(monkeypatch, make_response):
+    c = Client()
+    bodies = [
+        payload(symbol("BTCUSDT"), symbol("ETHUSDT")),
+        payload(symbol("BTCUSDT"), symbol("ETHUSDT"), server_time=1700000001000),
+        payload(symbol("BTCUSDT", tick_size="0.01"), symbol("ETHUSDT", status="SETTLING"), symbol("SOLUSDT")),
+        payload(symbol("BTCUSDT", tick_size="0.01"), symbol("SOLUSDT")),
+    ]
+    monkeypatch.setattr(c.session, "send", lambda req: make_response(bodies.pop(0)))
+    diffs = []
+    c.exchange_info.listeners.append(diffs.append)
+
+    assert c.exchange_info.refresh() is None
+    btc = c.exchange_info["BTCUSDT"]
+    assert btc.tick_size == Decimal("0.10") and btc.step_size == Decimal("0.001")
+    assert btc.min_notional == Decimal("5") and btc.multiplier_up == Decimal("1.05")
+    assert btc.status == "TRADING" and btc.contract_type == "PERPETUAL"
+    assert c.exchange_info.data["timezone"] == "UTC" and "symbols" not in c.exchange_info.data
+
+    # only server time changed: index is kept
+    assert c.exchange_info.refresh() is None
+    assert c.exchange_info["BTCUSDT"] is btc
+
+    diff = c.exchange_info.refresh()
+    assert diff.listed == ["SOLUSDT"] and diff.delisted == []
+    assert set(diff.changed) == {"BTCUSDT", "ETHUSDT"}
+    assert diff.changed["BTCUSDT"][1].tick_size == Decimal("0.01")
+
+    diff = c.exchange_info.refresh()
+    assert diff.delisted == ["ETHUSDT"] and "ETHUSDT" not in c.exchange_info
+    assert len(diffs) == 2 and diffs[-1] is diff
+    c.close()
+
+
+@pytest.mark.asyncio
+async def test_exchange_info_async():
+    c = AIOClient()
+
+    async def exchange_info():
+        from binance.client.response import Response
+
+        return Response(payload(symbol("BTCUSDT")), 200, {})
+
+    c.market.exchange_info = exchange_info
+    assert await c.exchange_info.refresh() is None
+    assert c.exchange_info.get("BTCUSDT").tick_size == Decimal("0.10")
+    assert not c.exchange_info.expired
+    await c.close()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from binance import Client
+from binance.client.filters import FilterException
+from binance.enums.binance import OrderSide, TimeInForce
+from binance.order import BatchOrder, Limit
+
+EXCHANGE_INFO = {
+    "serverTime": 1700000000000,
+    "symbols": [
+        {
+            "symbol": "BTCUSDT",
+            "status": "TRADING",
+            "filters": [
+                {"minPrice": "0.10", "maxPrice": "4529764", "filterType": "PRICE_FILTER", "tickSize": "0.10"},
+                {"stepSize": "0.001", "filterType": "LOT_SIZE", "maxQty": "1000", "minQty": "0.001"},
+                {"stepSize": "0.001", "filterType": "MARKET_LOT_SIZE", "maxQty": "120", "minQty": "0.001"},
+                {"notional": "100", "filterType": "MIN_NOTIONAL"},
+                {"multiplierDown": "0.9500", "multiplierUp": "1.0500", "filterType": "PERCENT_PRICE"},
+            ],
+        }
+    ],
+}
+
+
+@pytest.fixture
+def client(monkeypatch, make_response, exchange_info):
+    c = Client(api_key="key", api_secret="secret", check_orders=True)
+    exchange_info(c, EXCHANGE_INFO)
+    c.sent = []
+    monkeypatch.setattr(
+        c.session, "send", lambda req: c.sent.append(parse_qs(urlsplit(req.url).query)) or make_response()
+    )
+    yield c
+    c.close()
+
+
+def limit(side=OrderSide.BUY, quantity=0.0129, price=35000.17):
+    return Limit(symbol="BTCUSDT", side=side, quantity=quantity, price=price, timeInForce=TimeInForce.GOOD_TILL_CANCEL)
+
+
+def test_rounding(client):
+    client.trade.new_order(limit())
+    assert client.sent[-1]["price"] == ["35000.10"] and client.sent[-1]["quantity"] == ["0.012"]
+
+    client.trade.new_order(limit(side=OrderSide.SELL))
+    assert client.sent[-1]["price"] == ["35000.20"]
+
+    client.trade.batch_order(BatchOrder(batchOrders=[limit(), limit(side=OrderSide.SELL)]))
+    batch = json.loads(client.sent[-1]["batchOrders"][0])
+    assert [order["price"] for order in batch] == ["35000.10", "35000.20"]
+
+
+@pytest.mark.parametrize(
+    "order, filter_type",
+    [
+        (limit(quantity=0.0009), "LOT_SIZE"),
+        (limit(quantity=2000), "LOT_SIZE"),
+        (limit(price=0.01), "PRICE_FILTER"),
+        (limit(quantity=0.001, price=1000), "MIN_NOTIONAL"),
+        (limit(price=40000), "PERCENT_PRICE"),
+    ],
+)
+def test_rejected_locally(client, order, filter_type):
+    client.order_filter.set_mark_price("BTCUSDT", "35000")
+    remaining = client.order_limiter.remaining
+    with pytest.raises(FilterException) as e:
+        client.trade.new_order(order)
+    assert e.value.filter_type == filter_type
+    assert not client.sent and client.order_limiter.remaining == remaining
+
+
+def test_percent_price_requires_mark_price(client):
+    client.trade.new_order(limit(price=40000))
+    assert client.sent[-1]["price"] == ["40000.0"]
+
+
+def test_unknown_symbol(client):
+    with pytest.raises(FilterException):
+        client.trade.new_order(Limit(symbol="XYZUSDT", side=OrderSide.BUY, quantity=1, price=1, timeInForce="GTC"))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+import json
+from decimal import Decimal
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from binance import AIOClient, Client
+from binance.client.filters import FilterException
+from binance.client.fixed_point import from_fixed, to_fixed
+from binance.client.order_book import OrderBook, OrderBooks
+from binance.client.streams import MarketDataStream, MarketDataStreams
+from binance.client.streams.events import parse
+from binance.enums.binance import OrderSide, TimeInForce
+from binance.order import BatchOrder, Limit
+
+EXCHANGE_INFO = {
+    "serverTime": 1700000000000,
+    "symbols": [
+        {
+            "symbol": "BTCUSDT",
+            "status": "TRADING",
+            "pricePrecision": 2,
+            "quantityPrecision": 3,
+            "filters": [
+                {"minPrice": "0.10", "maxPrice": "4529764", "filterType": "PRICE_FILTER", "tickSize": "0.10"},
+                {"stepSize": "0.001", "filterType": "LOT_SIZE", "maxQty": "1000", "minQty": "0.001"},
+                {"notional": "100", "filterType": "MIN_NOTIONAL"},
+            ],
+        },
+        {"symbol": "1000SHIBUSDT", "status": "TRADING", "pricePrecision": 6, "quantityPrecision": 0, "filters": []},
+    ],
+}
+
+
+@pytest.fixture
+def client(monkeypatch, make_response, exchange_info):
+    c = Client(api_key="key", api_secret="secret", fixed_point=True)
+    exchange_info(c, EXCHANGE_INFO)
+    c.sent = []
+    monkeypatch.setattr(
+        c.session, "send", lambda req: c.sent.append(parse_qs(urlsplit(req.url).query)) or make_response()
+    )
+    yield c
+    c.close()
+
+
+@pytest.mark.parametrize("value", ["0", "1", "-1", "0.1", "-0.05", "123456.789", "0.000001", "99999999.999999"])
+@pytest.mark.parametrize("scale", [6, 8])
+def test_round_trip(value, scale):
+    fixed = to_fixed(value, scale)
+    assert Decimal(from_fixed(fixed, scale)) == Decimal(value)
+    assert fixed == int(Decimal(value).scaleb(scale))
+
+
+def test_scales(client):
+    btc = client.exchange_info["BTCUSDT"]
+    assert (btc.price_scale, btc.quantity_scale) == (1, 3)
+    # precision is used if filters are missing
+    shib = client.exchange_info["1000SHIBUSDT"]
+    assert (shib.price_scale, shib.quantity_scale) == (6, 0)
+
+
+def test_events(client):
+    trade = {"e": "aggTrade", "s": "BTCUSDT", "a": 1, "p": "35000.10", "q": "0.012", "f": 1, "l": 1, "T": 1, "m": 0}
+    event = parse(trade, client.exchange_info)
+    assert event.price == 350001 and event.quantity == 12
+    assert parse(trade).price == 35000.1
+    with pytest.raises(KeyError):
+        parse(dict(trade, s="UNKNOWN"), client.exchange_info)
+
+
+def test_order_book(client):
+    book = OrderBook("BTCUSDT", info=client.exchange_info["BTCUSDT"])
+    assert book.load({"lastUpdateId": 1, "bids": [["35000.10", "0.500"]], "asks": [["35000.20", "1.000"]]})
+    update = {"e": "depthUpdate", "s": "BTCUSDT", "U": 1, "u": 2, "pu": 1, "b": [["35000.00", "2"]], "a": []}
+    assert book.apply(parse(update, client.exchange_info))
+    assert book.bids.prices.dtype.kind == "i"
+    assert book.bids.best == (350001, 500) and book.spread == 1
+    assert book.bids.top(2)[0].tolist() == [350001, 350000]
+
+
+def test_orders(client):
+    order = Limit(
+        symbol="BTCUSDT", side=OrderSide.BUY, quantity=12, price=350001, timeInForce=TimeInForce.GOOD_TILL_CANCEL
+    )
+    client.trade.new_order(order)
+    assert client.sent[-1]["price"] == ["35000.1"] and client.sent[-1]["quantity"] == ["0.012"]
+
+    client.trade.batch_order(BatchOrder(batchOrders=[order, order]))
+    batch = json.loads(client.sent[-1]["batchOrders"][0])
+    assert [(o["price"], o["quantity"]) for o in batch] == [("35000.1", "0.012")] * 2
+
+    with pytest.raises(FilterException) as e:
+        client.trade.new_order(order.model_copy(update={"price": 350001.5}))
+    assert e.value.filter_type == "FIXED_POINT"
+
+
+@pytest.mark.asyncio
+async def test_exchange_info_required(streams):
+    client = AIOClient(fixed_point=True)
+    with pytest.raises(ValueError, match="not loaded"):
+        MarketDataStream(client)
+    with pytest.raises(ValueError, match="not loaded"):
+        MarketDataStreams(client)
+    streams.fixed_point = True
+    with pytest.raises(ValueError, match="not loaded"):
+        OrderBooks(client, streams).add("BTCUSDT")
+    await client.close()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+import asyncio
+import json
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from binance import AIOClient
+from binance.client.ratelimit import SlidingWindow
+from binance.client.streams import MarketDataStream, MarketDataStreams
+from binance.client.streams.events import AggTrade, DepthUpdate, MarkPrice, parse
+from binance.client.streams.market_data_stream import StreamException
+
+AGG_TRADE = {
+    "e": "aggTrade",
+    "E": 123456789,
+    "s": "BTCUSDT",
+    "a": 5933014,
+    "p": "0.001",
+    "q": "100",
+    "f": 100,
+    "l": 105,
+    "T": 123456785,
+    "m": True,
+}
+MARK_PRICE = {
+    "e": "markPriceUpdate",
+    "E": 1562305380000,
+    "s": "BTCUSDT",
+    "p": "11794.15000000",
+    "i": "11784.62659091",
+    "P": "11784.25641265",
+    "r": "0.00038167",
+    "T": 1562306400000,
+}
+
+
+def test_parse():
+    event = parse(AGG_TRADE)
+    assert isinstance(event, AggTrade)
+    assert event.price == 0.001 and event.quantity == 100 and event.maker and event.symbol == "BTCUSDT"
+    events = parse([MARK_PRICE, MARK_PRICE])
+    assert [type(e) for e in events] == [MarkPrice, MarkPrice] and events[0].funding_rate == 0.00038167
+    depth = parse({"e": "depthUpdate", "s": "BTCUSDT", "U": 1, "u": 2, "pu": 0, "b": [["1.5", "2"]], "a": []})
+    assert isinstance(depth, DepthUpdate) and depth.bids == [(1.5, 2.0)] and depth.previous_update_id == 0
+
+
+@pytest_asyncio.fixture
+async def server():
+    """Local combined stream server, sends one frame per requested stream and closes"""
+    connections = []
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        streams = request.query["streams"].split("/")
+        connections.append(streams)
+        for stream in streams:
+            await ws.send_str(json.dumps({"stream": stream, "data": AGG_TRADE}))
+        await asyncio.sleep(0.05)
+        await ws.close()
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/stream", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"ws://127.0.0.1:{port}", connections
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_stream(server):
+    url, connections = server
+    client = AIOClient(websocket_url=url)
+    trades, depth = [], []
+
+    async def on_trade(event):
+        trades.append(event)
+
+    stream = MarketDataStream(client, {"BTCUSDT@aggTrade": on_trade, "ethusdt@depth@100ms": depth.append})
+    # reconnect quickly
+    stream.initial_delay, stream._delay, stream.jitter = 0.01, 0.01, 0
+    stream.connect()
+    await asyncio.sleep(0.3)
+    await stream.close()
+    await client.close()
+
+    assert connections[0] == ["btcusdt@aggTrade", "ethusdt@depth@100ms"]
+    # closed connections are reconnected
+    assert len(connections) >= 2
+    assert len(trades) == len(depth) == len(connections)
+    assert isinstance(trades[0], AggTrade) and trades[0].id == 5933014
+
+
+@pytest.mark.asyncio
+async def test_handler_errors(server):
+    url, connections = server
+    client = AIOClient(websocket_url=url)
+    received = []
+
+    def fail(event):
+        raise RuntimeError("boom")
+
+    stream = MarketDataStream(client, {"btcusdt@aggTrade": fail})
+    stream.subscribe("btcusdt@aggTrade", received.append)
+    stream.unsubscribe("ethusdt@aggTrade")
+    stream.connect()
+    await asyncio.sleep(0.02)
+    await stream.close()
+    await client.close()
+    # failing handlers do not affect other handlers
+    assert len(received) == 1
+
+
+@pytest.mark.asyncio
+async def test_routing():
+    client = AIOClient()
+    stream = MarketDataStream(client)
+    every, eth, batches = [], [], []
+    stream.subscribe("!markPrice@arr", every.append)
+    stream.subscribe("!markPrice@arr", eth.append, symbol="ETHUSDT")
+    stream.subscribe("!markPrice@arr", batches.append, event="markPriceUpdate", batch=True)
+    assert stream.handlers == {"!markPrice@arr": 3}
+    with pytest.raises(ValueError):
+        stream.subscribe("btcusdt@depth5", print, raw=True, symbol="BTCUSDT")
+
+    stream.on_message(json.dumps({"stream": "!markPrice@arr", "data": [MARK_PRICE, {**MARK_PRICE, "s": "ETHUSDT"}]}))
+    assert [e.symbol for e in every] == ["BTCUSDT", "ETHUSDT"] and [e.symbol for e in eth] == ["ETHUSDT"]
+    assert len(batches) == 1 and [e.symbol for e in batches[0]] == ["BTCUSDT", "ETHUSDT"]
+    stream.unsubscribe("!markPrice@arr", eth.append)
+    assert stream.handlers == {"!markPrice@arr": 2}
+    stream.unsubscribe("!markPrice@arr")
+    assert stream.handlers == {}
+    await stream.close()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_failed():
+    client = AIOClient(websocket_url="ws://127.0.0.1:1")
+    stream = MarketDataStream(client, {"btcusdt@aggTrade": print})
+    failures = []
+    stream.connection_failed = failures.append
+    stream.connect()
+    await asyncio.sleep(0.1)
+    assert len(failures) == 1 and stream._connector is None
+    await stream.close()
+    await client.close()
+
+
+@pytest_asyncio.fixture
+async def live_server():
+    """Local combined stream server answering live subscription requests"""
+    connections, requests = [], []
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        subscriptions = request.query["streams"].split("/")
+        connections.append(subscriptions)
+        async for message in ws:
+            payload = json.loads(message.data)
+            requests.append(payload)
+            method, params = payload["method"], payload.get("params", [])
+            if method == "SUBSCRIBE":
+                subscriptions.extend(params)
+                for stream in params:
+                    await ws.send_str(json.dumps({"stream": stream, "data": AGG_TRADE}))
+                result = None
+            elif method == "UNSUBSCRIBE":
+                subscriptions[:] = [s for s in subscriptions if s not in params]
+                result = None
+            elif method == "LIST_SUBSCRIPTIONS":
+                result = subscriptions
+            else:
+                await ws.send_str(json.dumps({"error": {"code": 2, "msg": "Invalid request"}, "id": payload["id"]}))
+                continue
+            await ws.send_str(json.dumps({"result": result, "id": payload["id"]}))
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/stream", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"ws://127.0.0.1:{port}", connections, requests
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_live_subscriptions(live_server):
+    url, connections, requests = live_server
+    client = AIOClient(websocket_url=url)
+    trades = []
+    stream = MarketDataStream(client, {"btcusdt@aggTrade": trades.append})
+    stream.connect()
+    await asyncio.sleep(0.05)
+    for symbol in ("ethusdt", "bnbusdt", "xrpusdt"):
+        stream.subscribe(f"{symbol}@aggTrade", trades.append)
+    await asyncio.sleep(0.05)
+    # subscriptions of one event loop iteration are batched into one request
+    assert requests == [
+        {"method": "SUBSCRIBE", "params": ["ethusdt@aggTrade", "bnbusdt@aggTrade", "xrpusdt@aggTrade"], "id": 1}
+    ]
+    assert len(trades) == 3
+    assert stream.subscriptions == set(stream.handlers)
+
+    stream.unsubscribe("ETHUSDT@aggTrade")
+    await asyncio.sleep(0.05)
+    assert requests[-1]["method"] == "UNSUBSCRIBE" and requests[-1]["params"] == ["ethusdt@aggTrade"]
+    assert sorted(await stream.list_subscriptions()) == sorted(stream.handlers)
+    with pytest.raises(StreamException):
+        await stream.request("GET_PROPERTY", ["unknown"])
+    # no reconnects
+    assert len(connections) == 1
+    await stream.close()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_rate(live_server):
+    url, connections, requests = live_server
+    client = AIOClient(websocket_url=url)
+    stream = MarketDataStream(client, {"btcusdt@aggTrade": print})
+    stream._messages = SlidingWindow(2, 0.1)
+    stream.connect()
+    await asyncio.sleep(0.05)
+    start = time.monotonic()
+    await asyncio.gather(*(stream.list_subscriptions() for _ in range(6)))
+    # 6 requests at 2 within any 0.1 seconds take at least 0.2 seconds
+    assert time.monotonic() - start >= 0.19
+    assert len(requests) == 6
+    await stream.close()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_not_connected():
+    client = AIOClient()
+    stream = MarketDataStream(client)
+    with pytest.raises(ConnectionError):
+        await stream.list_subscriptions()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_sharding(live_server):
+    url, connections, requests = live_server
+    client = AIOClient(websocket_url=url)
+
+    class SmallStream(MarketDataStream):
+        MAX_STREAMS = 2
+
+    streams = MarketDataStreams(client)
+    streams.factory = SmallStream
+    for symbol in ("btcusdt", "ethusdt", "bnbusdt", "xrpusdt", "adausdt"):
+        streams.subscribe(f"{symbol}@aggTrade", print)
+    streams.subscribe("btcusdt@aggTrade", print)
+    assert [len(s.handlers) for s in streams.streams] == [2, 2, 1]
+    await asyncio.sleep(0.05)
+    assert sorted(map(len, connections)) == [1, 2, 2] and not requests
+
+    with pytest.raises(ValueError):
+        streams.streams[0].subscribe("dogeusdt@aggTrade", print)
+    streams.unsubscribe("adausdt@aggTrade")
+    assert len(streams.streams) == 2
+    # free capacity is reused by live subscriptions
+    streams.unsubscribe("btcusdt@aggTrade")
+    assert streams.subscribe("dotusdt@aggTrade", print) is streams.streams[0]
+    await asyncio.sleep(0.05)
+    assert [r["method"] for r in requests] == ["UNSUBSCRIBE", "SUBSCRIBE"]
+    await streams.close()
+    await client.close()
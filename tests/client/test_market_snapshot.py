@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+import json
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from binance import Client
+from binance.client.market_snapshot import STREAMS, MarketSnapshot
+
+
+def frame(stream, data):
+    return json.dumps({"stream": stream, "data": data}, separators=(",", ":"))
+
+
+def mark_price(symbol, price, rate):
+    return {
+        "e": "markPriceUpdate",
+        "E": 1700000000000,
+        "s": symbol,
+        "p": price,
+        "i": price,
+        "P": price,
+        "r": rate,
+        "T": 1700006400000,
+    }
+
+
+def book_ticker(symbol, bid, ask):
+    return {
+        "e": "bookTicker",
+        "u": 42,
+        "E": 1700000000002,
+        "T": 1700000000001,
+        "s": symbol,
+        "b": bid,
+        "B": "1.500",
+        "a": ask,
+        "A": "0.250",
+    }
+
+
+@pytest.fixture
+def client(exchange_info):
+    return exchange_info(Client())
+
+
+def test_streams(client, streams):
+    snapshot = MarketSnapshot(client, streams=streams)
+    assert snapshot.index == {"BTCUSDT": 0, "ETHUSDT": 1, "BTCUSDT_240329": 2}
+    snapshot.start()
+    assert set(streams.handlers) == streams.raw == {"!markPrice@arr@1s", "!ticker@arr", "!bookTicker"}
+
+    column = snapshot["mark_price"]
+    entries = [
+        mark_price("ETHUSDT", "2000.12345678", "0.00010000"),
+        mark_price("BNBUSDT", "300.0", "0.0001"),
+        mark_price("BTCUSDT_240329", "35100.5", ""),
+    ]
+    snapshot.on_frame(frame("!markPrice@arr@1s", entries))
+    assert snapshot["mark_price"] is column
+    assert math.isnan(column[0]) and column[1:].tolist() == [2000.12345678, 35100.5]
+    assert snapshot["funding_rate"][1] == 0.0001 and math.isnan(snapshot["funding_rate"][2])
+    assert snapshot["next_funding_time"].tolist() == [0, 1700006400000, 1700006400000]
+
+    snapshot.on_frame(frame("!bookTicker", book_ticker("BTCUSDT", "35000.1", "35000.2")).encode())
+    assert snapshot.row("BTCUSDT")["bid_price"] == 35000.1
+    assert snapshot["ask_quantity"][0] == 0.25 and snapshot["book_update_id"][0] == 42
+
+    snapshot.on_frame(
+        frame(
+            "!ticker@arr",
+            [
+                {
+                    "e": "24hrTicker",
+                    "E": 3,
+                    "s": "BTCUSDT",
+                    "c": "35000.1",
+                    "o": "34000.0",
+                    "h": "35500.0",
+                    "l": "33900.0",
+                    "v": "1000.5",
+                    "q": "35000000.0",
+                    "P": "2.94",
+                    "n": 12345,
+                }
+            ],
+        )
+    )
+    assert snapshot.row("BTCUSDT")["trades"] == 12345 and snapshot["last_price"][0] == 35000.1
+
+
+def test_fixed_point(client, streams):
+    streams.fixed_point = True
+    snapshot = MarketSnapshot(client, ["BTCUSDT", "ETHUSDT"], streams=streams)
+    snapshot.update(
+        [book_ticker("ETHUSDT", "2000.12", "2000.13"), book_ticker("BTCUSDT", "35000.1", "35000.2")],
+        {"b": "bid_price", "B": "bid_quantity"},
+    )
+    assert snapshot["bid_price"].dtype == np.int64
+    assert snapshot["bid_price"].tolist() == [350001, 200012]
+    assert snapshot["bid_quantity"].tolist() == [1500, 1500]
+    snapshot.on_frame(frame("!bookTicker", book_ticker("BTCUSDT", "35000.3", "35000.4")))
+    assert snapshot["bid_price"][0] == 350003 and snapshot["ask_price"][0] == 350004
+    # values are parsed exactly, missing values are zero on both paths
+    snapshot.update(
+        [book_ticker("BTCUSDT", "9007199254740993.1", ""), book_ticker("ETHUSDT", "", "1.01")], STREAMS["!bookTicker"]
+    )
+    assert snapshot["bid_price"].tolist() == [90071992547409931, 0]
+    assert snapshot["ask_price"].tolist() == [0, 101]
+    snapshot.update(book_ticker("ETHUSDT", "2000.14", ""), STREAMS["!bookTicker"])
+    assert snapshot["bid_price"][1] == 200014 and snapshot["ask_price"][1] == 0
+    with pytest.raises(ValueError):
+        snapshot.update(book_ticker("ETHUSDT", "2000.145", "2000.15"), STREAMS["!bookTicker"])
+
+
+def test_seed(client, streams):
+    mark_prices = [
+        {
+            "symbol": "BTCUSDT",
+            "markPrice": "35000.5",
+            "indexPrice": "35001.0",
+            "lastFundingRate": "0.0001",
+            "nextFundingTime": 1700006400000,
+            "time": 1700000000000,
+        }
+    ]
+    book_tickers = [
+        {
+            "symbol": "ETHUSDT",
+            "bidPrice": "2000.12",
+            "bidQty": "3.000",
+            "askPrice": "2000.13",
+            "askQty": "4.000",
+            "lastUpdateId": 7,
+            "time": 1700000000001,
+        }
+    ]
+    market = SimpleNamespace(
+        mark_price=lambda: SimpleNamespace(data=mark_prices),
+        ticker_order_book=lambda: SimpleNamespace(data=book_tickers),
+    )
+    fake = SimpleNamespace(
+        ASYNCHRONOUS=False, market=market, exchange_info=client.exchange_info, decoder=client.decoder
+    )
+    snapshot = MarketSnapshot(fake, streams=streams)
+    snapshot.seed()
+    assert snapshot.row("BTCUSDT")["mark_price"] == 35000.5 and snapshot["funding_rate"][0] == 0.0001
+    assert snapshot.row("ETHUSDT")["ask_quantity"] == 4.0 and snapshot["book_update_id"].tolist() == [0, 7, 0]
+
+
+def test_exchange_info_required(streams):
+    with pytest.raises(ValueError):
+        MarketSnapshot(Client(), streams=streams)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from binance import AIOClient
+from binance.client.order_book import BookSide, OrderBook, OrderBooks
+from binance.client.response import Response
+from binance.client.streams.events import DepthUpdate
+
+
+def depth(first, final, previous, bids=(), asks=(), symbol="BTCUSDT"):
+    return DepthUpdate(
+        {
+            "e": "depthUpdate",
+            "E": final,
+            "s": symbol,
+            "U": first,
+            "u": final,
+            "pu": previous,
+            "b": [[str(p), str(q)] for p, q in bids],
+            "a": [[str(p), str(q)] for p, q in asks],
+        }
+    )
+
+
+SNAPSHOT = {"lastUpdateId": 10, "bids": [["99.0", "1"], ["100.0", "2"]], "asks": [["101.0", "3"], ["102.0", "4"]]}
+
+
+def test_book_side():
+    bids = BookSide(True, capacity=2)
+    bids.load([(100.0, 1.0), (99.0, 2.0), (98.0, 0.0)])
+    assert len(bids) == 2 and bids.best == (100.0, 1.0)
+    bids.update(101.0, 3.0)
+    bids.update(97.0, 4.0)
+    bids.update(99.0, 5.0)
+    bids.update(100.0, 0.0)
+    bids.update(50.0, 0.0)
+    prices, quantities = bids.top(10)
+    assert prices.tolist() == [101.0, 99.0, 97.0] and quantities.tolist() == [3.0, 5.0, 4.0]
+    # top levels are views of the book
+    assert np.shares_memory(prices, bids.prices)
+    assert bids.vwap(4.0) == (3 * 101.0 + 99.0) / 4
+    assert bids.vwap(100.0) is None
+
+    asks = BookSide(False)
+    asks.load([(102.0, 1.0), (101.0, 2.0)])
+    asks.update(100.5, 1.0)
+    assert asks.best == (100.5, 1.0)
+    assert asks.top(2)[0].tolist() == [100.5, 101.0]
+    assert asks.vwap(2.0) == (100.5 + 101.0) / 2
+
+
+def test_sync():
+    book = OrderBook("BTCUSDT")
+    # updates are buffered until the snapshot is loaded
+    assert not book.apply(depth(5, 8, 4, bids=[(100.0, 7)]))
+    assert not book.apply(depth(9, 12, 8, bids=[(100.0, 0)], asks=[(101.5, 1)]))
+    assert not book.apply(depth(13, 14, 12, asks=[(101.0, 0)]))
+    assert book.load(SNAPSHOT)
+    assert book.last_update_id == 14 and not book.buffer
+    assert book.bids.best == (99.0, 1.0) and book.asks.best == (101.5, 1.0)
+    assert book.spread == 2.5
+
+    assert book.apply(depth(15, 16, 14, bids=[(99.5, 1)]))
+    assert book.bids.best == (99.5, 1.0) and book.mid_price == 100.5
+    # missing update (pu != previous u)
+    assert not book.apply(depth(20, 21, 19, bids=[(100.0, 1)]))
+    assert not book.synced and book.bids.best == (99.5, 1.0)
+
+
+def test_snapshot_too_old():
+    book = OrderBook("BTCUSDT")
+    book.apply(depth(11, 12, 10))
+    assert not book.load({"lastUpdateId": 5, "bids": [], "asks": []})
+    assert not book.synced and len(book.buffer) == 1
+    # first update must cover the snapshot
+    book = OrderBook("BTCUSDT")
+    assert book.load(SNAPSHOT)
+    assert not book.apply(depth(12, 13, 11))
+    # updates following a gap in the buffer are kept for the next snapshot
+    book = OrderBook("BTCUSDT")
+    for first, final, previous in [(10, 10, 9), (25, 25, 24), (30, 30, 29), (35, 35, 34)]:
+        book.apply(depth(first, final, previous))
+    assert not book.load(SNAPSHOT)
+    assert [event.final_update_id for event in book.buffer] == [25, 30, 35]
+
+
+@pytest.mark.asyncio
+async def test_order_books(streams):
+    c = AIOClient()
+    snapshots = []
+
+    async def call(*args, params, **kwargs):
+        snapshots.append(dict(params))
+        await asyncio.sleep(0.01)
+        snapshot = dict(SNAPSHOT, lastUpdateId=10 * len(snapshots))
+        return Response(json.dumps(snapshot).encode(), 200, {})
+
+    c._call = call
+    books = OrderBooks(c, streams, limit=100)
+    updated = []
+    books.listeners.append(updated.append)
+    # symbols are case-insensitive, depth events carry uppercase symbols
+    book = books.add("btcusdt")
+    assert books["BTCUSDT"] is book and "btcusdt" in books
+    on_depth = streams.handlers["btcusdt@depth@100ms"]
+    on_depth(depth(9, 11, 8, asks=[(101.0, 9)]))
+    await asyncio.sleep(0.05)
+    assert book.synced and book.asks.best == (101.0, 9.0)
+    assert snapshots == [{"symbol": "BTCUSDT", "limit": "100"}]
+
+    on_depth(depth(12, 12, 11))
+    assert updated == [book]
+    # stale updates are dropped without notifying listeners
+    on_depth(depth(9, 11, 8))
+    assert updated == [book]
+    # gap triggers a new snapshot, updates older than it are dropped
+    on_depth(depth(15, 16, 14, asks=[(101.0, 1)]))
+    on_depth(depth(17, 21, 16, asks=[(101.0, 2)]))
+    await asyncio.sleep(0.05)
+    assert len(snapshots) == 2 and book.synced and book.last_update_id == 21 and book.asks.best == (101.0, 2.0)
+
+    await books.close()
+    assert not streams.handlers
+    await c.close()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import json
+
+import numpy as np
+import pytest
+
+from binance import AIOClient
+from binance.client.partial_depth import ASKS, BIDS, PRICE, QUANTITY, PartialDepth
+from binance.client.streams import MarketDataStreams
+
+
+def frame(symbol="BTCUSDT", update_id=10, bids=(("35000.1", "0.500"), ("35000.0", "1.250")), asks=(("35000.2", "2"),)):
+    data = {
+        "e": "depthUpdate",
+        "E": 1700000000123,
+        "T": 1700000000120,
+        "s": symbol,
+        "U": update_id - 5,
+        "u": update_id,
+        "pu": update_id - 6,
+        "b": [list(level) for level in bids],
+        "a": [list(level) for level in asks],
+    }
+    return json.dumps({"stream": f"{symbol.lower()}@depth5@100ms", "data": data}, separators=(",", ":"))
+
+
+def test_decode(streams):
+    depth = PartialDepth(AIOClient(), ["BTCUSDT", "ETHUSDT"], levels=5, streams=streams)
+    depth.start()
+    assert set(streams.handlers) == streams.raw == {"btcusdt@depth5@100ms", "ethusdt@depth5@100ms"}
+    depth.on_frame(frame())
+    btc = depth.book[depth.index["BTCUSDT"]]
+    assert btc[BIDS, :, PRICE].tolist() == [35000.1, 35000.0, 0, 0, 0]
+    assert btc[BIDS, :2, QUANTITY].tolist() == [0.5, 1.25]
+    assert btc[ASKS, 0].tolist() == [35000.2, 2.0]
+    assert depth.update_id[0] == 10 and depth.event_time[0] == 1700000000123
+    assert depth.sequence.tolist() == [2, 0]
+
+    # rows are overwritten in place
+    book = depth.book
+    depth.on_frame(frame(update_id=11, bids=[("1", "2")], asks=[]).encode())
+    assert depth.book is book and depth.update_id[0] == 11
+    assert depth.read("BTCUSDT")[BIDS, :2].tolist() == [[1.0, 2.0], [0.0, 0.0]]
+    assert not depth.read("BTCUSDT")[ASKS].any()
+    # unknown symbols are ignored
+    depth.on_frame(frame(symbol="BNBUSDT"))
+    assert depth.sequence.tolist() == [4, 0]
+    # key order and whitespace do not matter, extra levels are dropped
+    data = json.loads(frame(bids=[("3", "4")] * 6))["data"]
+    depth.on_frame(json.dumps({"data": dict(reversed(data.items())), "stream": "btcusdt@depth5@100ms"}, indent=1))
+    assert depth.book[0, BIDS].tolist() == [[3.0, 4.0]] * 5 and depth.sequence[0] == 6
+    # malformed levels are rejected, the row is left unchanged
+    with pytest.raises(ValueError):
+        depth.on_frame(frame(update_id=12, bids=[("35000.x", "1")]))
+    assert depth.sequence[0] == 6 and depth.update_id[0] == 10 and depth.book[0, BIDS, 0].tolist() == [3.0, 4.0]
+
+
+def test_fixed_point(exchange_info, streams):
+    client = exchange_info(AIOClient(fixed_point=True))
+    streams.fixed_point = True
+    depth = PartialDepth(client, ["BTCUSDT", "ETHUSDT"], levels=5, streams=streams)
+    depth.on_frame(frame())
+    assert depth.book.dtype == np.int64
+    assert depth.book[0, BIDS, :2].tolist() == [[350001, 500], [350000, 1250]]
+    # values with more decimals than the scale are rejected, the row is left unchanged
+    with pytest.raises(ValueError):
+        depth.on_frame(frame(update_id=11, bids=[("35000.15", "1")]))
+    assert depth.sequence[0] == 2 and depth.update_id[0] == 10
+    assert depth.book[0, BIDS, 0].tolist() == [350001, 500]
+
+
+@pytest.mark.asyncio
+async def test_raw_streams():
+    client = AIOClient()
+    streams = MarketDataStreams(client)
+    depth = PartialDepth(client, ["BTCUSDT"], levels=5, streams=streams)
+    depth.start()
+    connection = streams.find(depth.stream("BTCUSDT"))
+    events = []
+    connection.subscribe("btcusdt@aggTrade", events.append)
+    with pytest.raises(ValueError):
+        connection.subscribe(depth.stream("BTCUSDT"), events.append)
+
+    connection.on_message(frame())
+    assert depth.sequence[0] == 2 and not events
+    await depth.close()
+    assert connection.raw_streams == set()
+    await streams.close()
+    await client.close()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+import asyncio
+
+import pytest
+
+from binance import AIOClient, Client
+from binance.client.periodic import Periodic
+
+
+class Counter(Periodic):
+    __slots__ = ["client", "steps"]
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+        self.steps = 0
+
+    @property
+    def period(self) -> float:
+        return 0.01
+
+    def _step(self):
+        if self.client.ASYNCHRONOUS:
+            return self._async_step()
+        self.steps += 1
+        raise ValueError("failing steps are retried")
+
+    async def _async_step(self):
+        self.steps += 1
+        raise ValueError("failing steps are retried")
+
+
+def test_thread():
+    counter = Counter(Client())
+    counter.start()
+    assert counter.running
+    while counter.steps < 3:
+        counter._stopped.wait(0.01)
+    counter.stop()
+    assert not counter.running
+
+
+@pytest.mark.asyncio
+async def test_task():
+    counter = Counter(AIOClient())
+    counter.start()
+    await asyncio.sleep(0.05)
+    counter.stop()
+    assert counter.steps >= 3 and not counter.running
+    await counter.client.close()
+
+
+@pytest.mark.parametrize(
+    "kwargs, helper",
+    [
+        ({"sync_clock": True}, "clock"),
+        ({"exchange_info_ttl": 60}, "exchange_info"),
+        ({"warm_connections": 1}, "warmer"),
+    ],
+)
+def test_deferred_start(kwargs, helper):
+    # created outside the event loop, background tasks start on entering the client
+    c = AIOClient(**kwargs)
+    assert not getattr(c, helper).running
+
+    async def run():
+        async with c:
+            assert getattr(c, helper).running
+        assert not getattr(c, helper).running
+
+    asyncio.run(run())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+import socket
+
+import aiohttp
+import pytest
+import requests
+
+from binance import AIOClient, Client
+from binance.client.pool import PoolConfig
+
+
+def test_client_pool():
+    c = Client(pool=PoolConfig(limit_per_host=4, tcp_nodelay=True))
+    adapter = c.session.get_adapter(c.api_url)
+    assert adapter._pool_maxsize == 4
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in adapter.socket_options
+    c.close()
+
+
+def test_client_shared_session(monkeypatch):
+    session = requests.Session()
+    closed = []
+    monkeypatch.setattr(session, "close", lambda: closed.append(session))
+    for _ in range(2):
+        c = Client(session=session)
+        assert c.session is session
+        c.close()
+    assert not closed
+
+
+@pytest.mark.asyncio
+async def test_aioclient_lazy_session():
+    c = AIOClient(pool=PoolConfig(limit=10, limit_per_host=5, dns_cache_ttl=60))
+    assert c._session is None
+    connector = c.session.connector
+    assert connector.limit == 10 and connector.limit_per_host == 5
+    await c.close()
+    assert connector.closed
+
+
+@pytest.mark.asyncio
+async def test_aioclient_shared_connector():
+    connector = aiohttp.TCPConnector(limit_per_host=8)
+    clients = [AIOClient(connector=connector) for _ in range(2)]
+    assert all(c.session.connector is connector for c in clients)
+    for c in clients:
+        await c.close()
+    assert not connector.closed
+    await connector.close()
+
+    session = aiohttp.ClientSession()
+    c = AIOClient(session=session)
+    assert c.session is session
+    await c.close()
+    assert not session.closed
+    await session.close()
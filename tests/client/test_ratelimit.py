@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+import json
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from binance import Client
+from binance.client.endpoints import helpers
+from binance.client.ratelimit import Limiter, SlidingWindow, Window
+from binance.client.response import ResponseException
+
+
+def test_window():
+    window = Window(limit=10, interval=60)
+    assert window.wait(10, now=120.0) == 0.0
+    window.used += 10
+    assert window.wait(1, now=150.0) == 30.0
+    assert window.remaining(now=150.0) == 0
+    # next window
+    assert window.wait(1, now=180.0) == 0.0
+    assert window.remaining(now=180.0) == 10
+
+
+def test_sliding_window():
+    window = SlidingWindow(limit=9, interval=1.0)
+    window.add(now=0.9, amount=9)
+    # no second burst right after a whole second
+    assert window.wait(1, now=1.05) == 0.9 + 1.0 - 1.05
+    assert window.wait(1, now=1.9) == 0.0
+    window.add(now=1.9)
+    assert len(window.times) == 1
+    assert SlidingWindow(limit=2, interval=1.0).wait(5, now=0.0) == 0.0
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    monkeypatch.setattr("binance.client.ratelimit.time", SimpleNamespace(time=lambda: 1000.0))
+
+
+def test_limiter(frozen_time):
+    limiter = Limiter.request_weight(limit=10)
+    assert limiter.acquire(6) == 0.0
+    assert limiter.acquire(6) > 0.0
+    assert limiter.remaining == {"1M": 4}
+
+    limiter.update({"x-mbx-used-weight-1m": "9", "X-MBX-ORDER-COUNT-10S": "1"})
+    assert limiter.remaining == {"1M": 1}
+
+    limiter.block(30)
+    assert limiter.acquire(0) > 29
+
+
+@pytest.mark.parametrize(
+    "weight, params, expected",
+    [
+        (helpers.order_book_weight, {}, 10),
+        (helpers.order_book_weight, {"limit": "5"}, 2),
+        (helpers.order_book_weight, {"limit": "1000"}, 20),
+        (helpers.klines_weight, {}, 5),
+        (helpers.klines_weight, {"limit": "99"}, 1),
+        (helpers.klines_weight, {"limit": "1500"}, 10),
+        (helpers.symbol_weight(1, 40), {"symbol": "BTCUSDT"}, 1),
+        (helpers.symbol_weight(1, 40), {}, 40),
+    ],
+)
+def test_weights(weight, params, expected):
+    assert weight(params) == expected
+
+
+def test_client_waits_for_weight(monkeypatch, make_response, frozen_time):
+    c = Client(weight_limiter=Limiter.request_weight(limit=20))
+    monkeypatch.setattr(c.session, "send", lambda req: make_response(headers={"x-mbx-used-weight-1m": "15"}))
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        c.weight_limiter.windows["1M"].used = 0
+
+    monkeypatch.setattr("binance.client.client.time.sleep", sleep)
+
+    c.market.order_book(symbol="BTCUSDT")  # weight 10, reconciled to 15
+    assert not sleeps
+    c.market.order_book(symbol="BTCUSDT", limit=5)  # weight 2
+    assert not sleeps
+    c.market.order_book(symbol="BTCUSDT")  # weight 10 exceeds budget
+    assert len(sleeps) == 1
+    c.close()
+
+
+def test_client_blocks_when_rate_limited(monkeypatch, make_response, frozen_time):
+    c = Client()
+    response = make_response(b'{"code": -1003}', status=429, headers={"Retry-After": "120"})
+    monkeypatch.setattr(c.session, "send", lambda req: response)
+
+    with pytest.raises(ResponseException):
+        c.market.ping()
+    assert c.weight_limiter.acquire(1) > 110
+    c.close()
+
+
+def test_client_counts_orders(monkeypatch, make_response, frozen_time):
+    from binance.enums.binance import OrderSide, TimeInForce
+    from binance.order import BatchOrder, Limit
+
+    c = Client(api_key="key", api_secret="secret", order_limiter=Limiter.orders(per_10s=6, per_minute=100))
+    sent = []
+    monkeypatch.setattr(c.session, "send", lambda req: sent.append(req) or make_response())
+    monkeypatch.setattr("binance.client.client.time.sleep", lambda delay: pytest.fail("should not wait"))
+
+    order = Limit(symbol="BTCUSDT", side=OrderSide.BUY, quantity=1, price=2, timeInForce=TimeInForce.GOOD_TILL_CANCEL)
+    c.trade.new_order(order)
+    assert c.order_limiter.remaining == {"10S": 5, "1M": 99}
+
+    c.trade.batch_order(BatchOrder(batchOrders=[order] * 5))
+    assert c.order_limiter.remaining == {"10S": 0, "1M": 94}
+    batch = json.loads(parse_qs(urlsplit(sent[-1].url).query)["batchOrders"][0])
+    assert len(batch) == 5 and batch[0]["symbol"] == "BTCUSDT"
+
+    # order budget exhausted: request weight must not be consumed
+    used = c.weight_limiter.windows["1M"].used
+    assert c._acquire(weight=5, orders=1) > 0
+    assert c.weight_limiter.windows["1M"].used == used
+    c.close()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+import pytest
+
+from binance.client.response import Response, ResponseException
+
+
+def test_lazy_decoding(make_response):
+    decoded = []
+
+    def decoder(body):
+        decoded.append(body)
+        return {"orderId": 1}
+
+    raw = make_response(b'{"orderId": 1}', headers={"x-mbx-order-count-10s": "1", "Content-Type": "json"})
+    response = Response.from_requests_response(raw, decoder=decoder)
+    assert response.raw is None
+    assert response.limits == {"X-MBX-ORDER-COUNT-10S": "1"}
+    assert not decoded
+
+    assert response.data == {"orderId": 1}
+    assert response.data == {"orderId": 1}
+    assert decoded == [b'{"orderId": 1}']
+
+    with pytest.raises(AttributeError):
+        response.cache = {}
+
+
+def test_keep_raw(make_response):
+    raw = make_response(b"{}")
+    assert Response.from_requests_response(raw, keep_raw=True).raw is raw
+
+
+def test_response_exception(make_response):
+    raw = make_response(b'{"code": -1121, "msg": "Invalid symbol."}', status=400)
+    with pytest.raises(ResponseException) as e:
+        Response.from_requests_response(raw)
+    assert e.value.status == 400 and e.value.data["code"] == -1121
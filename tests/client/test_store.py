@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+import json
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from binance import AIOClient
+from binance.client.response import Response
+
+np = pytest.importorskip("numpy")
+
+from binance.client.store import KlineStore, merge, missing  # noqa: E402
+
+MINUTE = 60_000
+NOW = 10_000 * MINUTE + 30_000
+
+
+def test_ranges():
+    held = [(10, 19), (30, 39)]
+    assert missing(held, 0, 50) == [(0, 9), (20, 29), (40, 50)]
+    assert missing(held, 12, 35) == [(20, 29)]
+    assert missing(held, 10, 19) == []
+    assert merge(held, [(20, 29), (45, 50)]) == [(10, 39), (45, 50)]
+
+
+@pytest_asyncio.fixture
+async def client(monkeypatch):
+    c = AIOClient()
+    c.calls = []
+
+    async def klines(symbol, interval, startTime, endTime, limit):
+        c.calls.append((startTime, endTime))
+        first = -(-startTime // MINUTE) * MINUTE
+        # includes the kline still open at NOW
+        times = range(first, min(endTime, NOW) + 1, MINUTE)
+        rows = [[t, "1.5", "2", "1", "1.5", "10", t + MINUTE - 1, "15", 3, "5", "7.5", "0"] for t in times]
+        return Response(json.dumps(rows[:limit]).encode(), 200, {})
+
+    c.market.klines = klines
+    monkeypatch.setattr("binance.client.clock.time", SimpleNamespace(time=lambda: NOW / 1000))
+    yield c
+    await c.close()
+
+
+@pytest.mark.asyncio
+async def test_store(client, tmp_path):
+    store = KlineStore(client, tmp_path)
+    params = dict(symbol="BTCUSDT", interval="1m")
+
+    klines = await store.get("klines", 2000 * MINUTE, 3999 * MINUTE, **params)
+    assert klines["open_time"].tolist() == list(range(2000 * MINUTE, 4000 * MINUTE, MINUTE))
+    assert isinstance(klines, np.memmap)
+
+    # held range is served from disk
+    calls = len(client.calls)
+    klines = await store.get("klines", 2500 * MINUTE, 3500 * MINUTE, **params)
+    assert len(klines) == 1001 and len(client.calls) == calls
+
+    # only gaps are fetched: before, and up to the last closed kline
+    klines = await store.get("klines", 1000 * MINUTE, **params)
+    assert klines["open_time"].tolist() == list(range(1000 * MINUTE, 10_000 * MINUTE, MINUTE))
+    assert all(end < 2000 * MINUTE or start > 3999 * MINUTE for start, end in client.calls[calls:])
+    assert store.held("klines", **params) == [(1000 * MINUTE, 10_000 * MINUTE - 1)]
+    assert store.read("klines", 0, NOW, **params)["close"][0] == 1.5
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from binance import AIOClient
+from binance.client.response import Response
+from binance.client.streams import UserDataStream
+
+ORDER_UPDATE = {"e": "ORDER_TRADE_UPDATE", "E": 1568879465651, "T": 1568879465650, "o": {"s": "BTCUSDT", "X": "NEW"}}
+
+
+@pytest_asyncio.fixture
+async def server():
+    """Local user data stream server, sends the frames queued for a listen key"""
+    connections, frames = [], {}
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        listen_key = request.match_info["listen_key"]
+        connections.append(listen_key)
+        for frame in frames.get(listen_key, []):
+            await ws.send_str(json.dumps(frame))
+        async for _ in ws:
+            pass
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/ws/{listen_key}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"ws://127.0.0.1:{port}", connections, frames
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_listener(server):
+    url, connections, frames = server
+    client = AIOClient(api_key="key", websocket_url=url)
+    calls = []
+
+    async def call(method, path, *args, **kwargs):
+        calls.append((method, path))
+        return Response(json.dumps({"listenKey": f"key{len(calls)}"}).encode(), 200, {})
+
+    client._call = call
+    frames["key1"] = [
+        ORDER_UPDATE,
+        dict(ORDER_UPDATE, o={"s": "ETHUSDT", "X": "NEW"}),
+        {"e": "ACCOUNT_UPDATE", "E": 1564745798939, "a": {}},
+        # reconnects with a new listen key
+        {"e": "listenKeyExpired", "E": 1576653824250},
+    ]
+    frames["key2"] = [dict(ORDER_UPDATE, o={"s": "BTCUSDT", "X": "FILLED"})]
+
+    stream = UserDataStream(client, loop=asyncio.get_running_loop())
+    orders, events = [], []
+    stream.subscribe(orders.append, event="ORDER_TRADE_UPDATE", symbol="BTCUSDT")
+    stream.subscribe(events.append)
+    await asyncio.sleep(0.2)
+    assert connections == ["key1", "key2"] and [path for _, path in calls] == ["/fapi/v1/listenKey"] * 2
+    assert [order["o"]["X"] for order in orders] == ["NEW", "FILLED"]
+    assert [event["e"] for event in events] == [
+        "ORDER_TRADE_UPDATE",
+        "ORDER_TRADE_UPDATE",
+        "ACCOUNT_UPDATE",
+        "listenKeyExpired",
+        "ORDER_TRADE_UPDATE",
+    ]
+
+    # the last callback closes the connection
+    task = stream._listener_task
+    stream.unsubscribe()
+    await asyncio.gather(task, return_exceptions=True)
+    assert task.cancelled() and stream._listener_task is None
+    await stream.close()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_reconnect(server):
+    url, connections, frames = server
+    client = AIOClient(api_key="key", websocket_url=url + "/missing")
+    stream = UserDataStream(client, loop=asyncio.get_running_loop())
+    stream.INITIAL_DELAY = 0.01
+
+    async def call(method, path, *args, **kwargs):
+        return Response(b'{"listenKey": "key"}', 200, {})
+
+    client._call = call
+    stream.subscribe(print)
+    await asyncio.sleep(0.1)
+    # failed connections are retried
+    assert stream._listener_task is not None and not stream._listener_task.done() and not connections
+    async with stream:
+        pass
+    assert stream._listener_task is None
+    await client.close()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+import asyncio
+import threading
+import time
+
+import pytest
+
+from binance import AIOClient, Client
+from binance.client.pool import PoolConfig
+from binance.client.response import Response
+
+
+def test_warm(monkeypatch, make_response):
+    c = Client(pool=PoolConfig(keepalive_timeout=20))
+    assert c.warmer.interval == 10
+    threads = set()
+
+    def send(req):
+        threads.add(threading.get_ident())
+        time.sleep(0.05)
+        return make_response()
+
+    monkeypatch.setattr(c.session, "send", send)
+    c.warmer.connections = 3
+    rtts = c.warmer.warm()
+    assert len(rtts) == 3 and all(rtt >= 50 for rtt in rtts)
+    # pings are concurrent, so every ping holds its own connection
+    assert len(threads) == 3
+    c.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_async():
+    c = AIOClient()
+    active, peak = 0, 0
+
+    async def call(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Response(b"{}", 200, {})
+
+    c._call = call
+    c.warmer.connections = 4
+    c.warmer.start()
+    await asyncio.sleep(0.05)
+    c.warmer.stop()
+    assert peak == 4 and len(c.warmer.rtts) == 4
+    await c.close()